@@ -73,7 +73,7 @@ async def main():
     
     for i, doc in enumerate(documents, 1):
         print(f"\nDocument {i}: {doc.title}")
-        print(f"  Status: {doc.status.value}")
+        print(f"  Status: {doc.status.value_str}")
         print(f"  Quality: {doc.quality_score:.2%}")
         print(f"  Words: {doc.word_count:,}")
         print(f"  Sections: {len(doc.sections)}")
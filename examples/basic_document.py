@@ -50,7 +50,7 @@ async def main():
     print(f"Document creation complete!")
     print(f"{'='*60}")
     print(f"Title: {document.title}")
-    print(f"Status: {document.status.value}")
+    print(f"Status: {document.status.value_str}")
     print(f"Quality Score: {document.quality_score:.2f}")
     print(f"Word Count: {document.word_count}")
     print(f"Sections: {len(document.sections)}")
@@ -60,6 +60,12 @@ setup(
             "psycopg2-binary>=2.9.0",
             "redis>=5.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "validation": [
+            "jsonschema>=4.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -12,6 +12,9 @@ from ..utils.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# asyncio.timeout() is available on Python 3.11+
+_HAS_TIMEOUT_SCOPE = hasattr(asyncio, 'timeout')
+
 
 class AgentState:
     """Agent states."""
@@ -64,7 +67,7 @@ class BaseAgent(ABC):
             Task result
         """
         self.state = AgentState.BUSY
-        self.logger.info(f"Starting task {task.id}")
+        self.logger.info("Starting task %s", task.id)
         start_time = datetime.now()
         
         try:
@@ -73,7 +76,7 @@ class BaseAgent(ABC):
             self.state = AgentState.IDLE
             
         except Exception as e:
-            self.logger.error(f"Task {task.id} failed: {str(e)}")
+            self.logger.error("Task %s failed: %s", task.id, e)
             self.metrics['tasks_failed'] += 1
             self.state = AgentState.ERROR
             result = TaskResult(
@@ -106,22 +109,34 @@ class BaseAgent(ABC):
         
         for attempt in range(self.config.max_retries):
             try:
-                return await asyncio.wait_for(
-                    self.process(task),
-                    timeout=self.config.timeout
-                )
+                return await self._process_with_timeout(task)
             except asyncio.TimeoutError:
                 last_error = "Task timed out"
-                self.logger.warning(f"Task {task.id} timed out (attempt {attempt + 1})")
+                self.logger.warning("Task %s timed out (attempt %s)", task.id, attempt + 1)
             except Exception as e:
                 last_error = str(e)
-                self.logger.warning(f"Task {task.id} failed (attempt {attempt + 1}): {e}")
+                self.logger.warning("Task %s failed (attempt %s): %s", task.id, attempt + 1, e)
             
             if attempt < self.config.max_retries - 1:
                 await asyncio.sleep(2 ** attempt)  # Exponential backoff
         
         raise Exception(f"Task failed after {self.config.max_retries} attempts: {last_error}")
     
+    async def _process_with_timeout(self, task: Task) -> TaskResult:
+        """
+        Run process() under the configured timeout.
+        
+        Uses an asyncio.timeout() scope on Python 3.11+, which awaits the
+        coroutine in the current task instead of wrapping it in a new one.
+        
+        Raises:
+            asyncio.TimeoutError: If the task exceeds the timeout
+        """
+        if _HAS_TIMEOUT_SCOPE:
+            async with asyncio.timeout(self.config.timeout):
+                return await self.process(task)
+        return await asyncio.wait_for(self.process(task), timeout=self.config.timeout)
+    
     @abstractmethod
     async def process(self, task: Task) -> TaskResult:
         """
@@ -147,5 +162,6 @@ class BaseAgent(ABC):
         return {
             'name': self.name,
             'state': self.state,
-            'metrics': self.metrics.copy()
+            'metrics': self.metrics.copy(),
+            'estimated_tokens': self.llm_client.estimated_tokens
         }
\ No newline at end of file
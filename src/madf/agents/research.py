@@ -48,7 +48,7 @@ class ResearchAgent(BaseAgent):
         query = task.data.get('query')
         depth = task.data.get('depth', 'moderate')
         
-        self.logger.info(f"Researching: {query}")
+        self.logger.info("Researching: %s", query)
         
         # Step 1: Break down the research query
         sub_queries = await self._decompose_query(query)
@@ -1,13 +1,26 @@
 """Verification agent implementation."""
 
 import asyncio
+import hashlib
 import json
-from typing import Dict
+import re
+from collections.abc import Mapping
+from difflib import SequenceMatcher
+from typing import Any, Dict, Optional, Tuple
 
 from .base import BaseAgent
 from ..models.task import Task, TaskResult
 from ..utils.config import AgentConfig
 
+_DIGIT_RE = re.compile(r'\d')
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize read-only mapping views as dicts and anything else as text."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
 
 class VerificationAgent(BaseAgent):
     """
@@ -18,8 +31,18 @@ class VerificationAgent(BaseAgent):
     - Completeness analysis
     - Quality scoring
     - Compliance checking
+    
+    Verification reports are memoized on a digest of the normalized
+    document text, requirements and research brief, so re-verifying
+    unchanged content skips the LLM calls. A passing report is also reused
+    for a near-identical revision of the last document verified against
+    the same requirements and research, unless the revision changes any
+    numbers.
     """
     
+    max_cached_reports = 128
+    near_duplicate_ratio = 0.98
+    
     def __init__(self, config: AgentConfig):
         """
         Initialize verification agent.
@@ -29,6 +52,8 @@ class VerificationAgent(BaseAgent):
         """
         super().__init__(config)
         self.specialization = "verification"
+        self._verify_cache: Dict[bytes, Dict] = {}
+        self._last_verified: Dict[bytes, Tuple[str, Dict]] = {}
     
     async def process(self, task: Task) -> TaskResult:
         """
@@ -50,6 +75,19 @@ class VerificationAgent(BaseAgent):
         requirements = task.data.get('requirements', {})
         research_brief = task.data.get('research_brief', '')
         
+        text = " ".join((document or "").split())
+        context_key = self._context_key(requirements, research_brief)
+        cache_key = self._cache_key(text, context_key)
+        cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Reusing verification report for unchanged document")
+            return TaskResult(task_id=task.id, success=True, data=cached)
+        
+        similar = self._near_duplicate_report(text, context_key)
+        if similar is not None:
+            self.logger.debug("Reusing passing verification report for near-identical revision")
+            return TaskResult(task_id=task.id, success=True, data=similar)
+        
         # Run parallel verification checks
         accuracy_check = asyncio.create_task(
             self._verify_accuracy(document, research_brief)
@@ -71,20 +109,80 @@ class VerificationAgent(BaseAgent):
             accuracy, completeness, quality
         )
         
+        data = {
+            'verification_report': {
+                'accuracy': accuracy,
+                'completeness': completeness,
+                'quality': quality,
+                'overall_score': overall_score
+            },
+            'passed': overall_score >= 0.85
+        }
+        
+        if len(self._verify_cache) >= self.max_cached_reports:
+            # Evict the oldest report
+            del self._verify_cache[next(iter(self._verify_cache))]
+        self._verify_cache[cache_key] = data
+        
+        self._last_verified.pop(context_key, None)
+        if len(self._last_verified) >= self.max_cached_reports:
+            del self._last_verified[next(iter(self._last_verified))]
+        self._last_verified[context_key] = (text, data)
+        
         return TaskResult(
             task_id=task.id,
             success=True,
-            data={
-                'verification_report': {
-                    'accuracy': accuracy,
-                    'completeness': completeness,
-                    'quality': quality,
-                    'overall_score': overall_score
-                },
-                'passed': overall_score >= 0.85
-            }
+            data=data
         )
     
+    @staticmethod
+    def _context_key(requirements: Dict, research_brief) -> bytes:
+        """Digest of the requirements and research a document is checked against."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(requirements, sort_keys=True, default=_json_default).encode())
+        digest.update(b"\0")
+        digest.update(json.dumps(research_brief, sort_keys=True, default=_json_default).encode())
+        return digest.digest()
+    
+    @staticmethod
+    def _cache_key(text: str, context_key: bytes) -> bytes:
+        """Digest of the whitespace-normalized document and its context."""
+        digest = hashlib.blake2b(text.encode(), digest_size=16)
+        digest.update(context_key)
+        return digest.digest()
+    
+    def _near_duplicate_report(self, text: str, context_key: bytes) -> Optional[Dict]:
+        """
+        Passing report of the last document with this context, if text is nearly the same.
+        
+        Compares the texts word by word. A length check and quick_ratio
+        (which ignores word order) rule out clearly different texts cheaply;
+        ratio() then confirms the similarity in order, and any edit touching
+        a number counts as a changed claim.
+        """
+        last = self._last_verified.get(context_key)
+        if last is None:
+            return None
+        
+        last_text, data = last
+        if not data['passed']:
+            return None
+        
+        longest = max(len(last_text), len(text))
+        if abs(len(last_text) - len(text)) > (1 - self.near_duplicate_ratio) * longest:
+            return None
+        
+        last_words, words = last_text.split(), text.split()
+        matcher = SequenceMatcher(None, last_words, words, autojunk=False)
+        if (matcher.quick_ratio() < self.near_duplicate_ratio
+                or matcher.ratio() < self.near_duplicate_ratio):
+            return None
+        
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag != 'equal' and _DIGIT_RE.search(" ".join(last_words[i1:i2] + words[j1:j2])):
+                return None
+        return data
+    
     async def _verify_accuracy(self, document: str, research_brief: str) -> Dict:
         """Verify factual accuracy against research."""
         prompt = f"""Verify the factual accuracy of this document against the research brief:
@@ -122,7 +220,7 @@ Document:
 {document}
 
 Requirements:
-{json.dumps(requirements, indent=2)}
+{json.dumps(requirements, indent=2, default=_json_default)}
 
 Check:
 1. All required sections present
@@ -18,6 +18,9 @@ class WritingAgent(BaseAgent):
     - Citation management
     """
     
+    # Sampling temperature for section drafts unless the task sets ``temperature``
+    SECTION_TEMPERATURE = 0.7
+    
     def __init__(self, config: AgentConfig):
         """
         Initialize writing agent.
@@ -35,7 +38,13 @@ class WritingAgent(BaseAgent):
         Task types:
         - outline: Create document outline
         - section: Write a specific section
-        - full: Write complete document
+        - full: Write complete document; a supplied ``outline`` is used
+          instead of generating one from the research brief, and each
+          section is put on ``section_queue`` (if given) as
+          ``(index, section)`` once written
+        
+        Section and full tasks may set ``temperature`` to override
+        SECTION_TEMPERATURE when drafting sections.
         
         Args:
             task: Writing task
@@ -114,7 +123,7 @@ Write compelling, well-structured content that:
         
         content = await self.llm_client.generate(
             prompt=prompt,
-            temperature=0.7,
+            temperature=data.get('temperature', self.SECTION_TEMPERATURE),
             system_message=f"You are an expert writer creating {style} content."
         )
         
@@ -125,8 +134,11 @@ Write compelling, well-structured content that:
     
     async def _write_full_document(self, data: Dict) -> Dict:
         """Write complete document."""
-        # First create outline
-        outline_data = await self._create_outline(data)
+        # First create outline, unless one was supplied
+        if data.get('outline'):
+            outline_data = {'outline': data['outline']}
+        else:
+            outline_data = await self._create_outline(data)
         
         # Parse outline into sections
         sections = self._parse_outline(outline_data['outline'])
@@ -134,8 +146,9 @@ Write compelling, well-structured content that:
         # Write each section
         written_sections = []
         context = ""
+        section_queue = data.get('section_queue')
         
-        for section in sections:
+        for index, section in enumerate(sections):
             section_data = {
                 **data,
                 'section_title': section['title'],
@@ -146,6 +159,10 @@ Write compelling, well-structured content that:
             section_result = await self._write_section(section_data)
             written_sections.append(section_result)
             
+            # Hand the draft downstream while the next section is written
+            if section_queue is not None:
+                await section_queue.put((index, section_result))
+            
             # Update context for next section
             context += f"\n\n{section_result['content']}"
         
@@ -1,16 +1,19 @@
 """Coordination layer modules."""
 
-from .workflow import WorkflowManager, Workflow, Stage, WorkflowBuilder
+from .workflow import WorkflowManager, Workflow, Stage, WorkflowBuilder, WorkflowScheduler, ReadyBatch
 from .message_bus import MessageBus, Message, MessageType
-from .resource_manager import ResourceManager
+from .resource_manager import ResourceManager, FairShareScheduler
 
 __all__ = [
     "WorkflowManager",
     "Workflow",
     "Stage",
     "WorkflowBuilder",
+    "WorkflowScheduler",
+    "ReadyBatch",
     "MessageBus",
     "Message",
     "MessageType",
     "ResourceManager",
+    "FairShareScheduler",
 ]
\ No newline at end of file
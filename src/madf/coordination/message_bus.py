@@ -3,26 +3,28 @@
 import asyncio
 from dataclasses import dataclass, field
 from typing import Dict, List, Callable, Any, Optional
-from enum import Enum
 from datetime import datetime
 import logging
 
+from ..models._common import _SLOTS, _NamedIntEnum
+
 logger = logging.getLogger(__name__)
 
 
-class MessageType(Enum):
+class MessageType(_NamedIntEnum):
     """Types of messages in the system."""
-    TASK_ASSIGNMENT = "task_assignment"
-    TASK_COMPLETE = "task_complete"
-    TASK_FAILED = "task_failed"
-    AGENT_STATUS = "agent_status"
-    QUALITY_REPORT = "quality_report"
-    COORDINATION_REQUEST = "coordination_request"
-    STAGE_COMPLETE = "stage_complete"
-    ERROR = "error"
+    TASK_ASSIGNMENT = 1
+    TASK_COMPLETE = 2
+    TASK_FAILED = 3
+    AGENT_STATUS = 4
+    QUALITY_REPORT = 5
+    COORDINATION_REQUEST = 6
+    STAGE_COMPLETE = 7
+    ERROR = 8
+    SECTION_DRAFTED = 9
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Message:
     """
     Represents a message in the system.
@@ -96,7 +98,7 @@ class MessageBus:
         if message_type not in self.subscribers:
             self.subscribers[message_type] = []
         self.subscribers[message_type].append(handler)
-        logger.debug(f"Subscribed handler to {message_type}")
+        logger.debug("Subscribed handler to %s", message_type.value_str)
     
     def unsubscribe(self, message_type: MessageType, handler: Callable[[Message], None]):
         """
@@ -109,7 +111,7 @@ class MessageBus:
         if message_type in self.subscribers:
             try:
                 self.subscribers[message_type].remove(handler)
-                logger.debug(f"Unsubscribed handler from {message_type}")
+                logger.debug("Unsubscribed handler from %s", message_type.value_str)
             except ValueError:
                 pass
     
@@ -121,7 +123,8 @@ class MessageBus:
             message: Message to publish
         """
         await self.message_queue.put(message)
-        logger.debug(f"Published message: {message.type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published message: %s", message.type.value_str)
     
     async def _process_messages(self):
         """
@@ -139,7 +142,7 @@ class MessageBus:
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
-                logger.error(f"Error processing message: {e}")
+                logger.error("Error processing message: %s", e)
     
     async def _deliver_message(self, message: Message):
         """
@@ -151,7 +154,8 @@ class MessageBus:
         handlers = self.subscribers.get(message.type, [])
         
         if not handlers:
-            logger.debug(f"No handlers for message type: {message.type}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No handlers for message type: %s", message.type.value_str)
             return
         
         # Deliver to all subscribers
@@ -162,7 +166,7 @@ class MessageBus:
                 else:
                     handler(message)
             except Exception as e:
-                logger.error(f"Error in message handler: {e}")
+                logger.error("Error in message handler: %s", e)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -175,7 +179,7 @@ class MessageBus:
             'running': self.running,
             'queue_size': self.message_queue.qsize(),
             'subscriber_counts': {
-                msg_type.value: len(handlers)
+                msg_type.value_str: len(handlers)
                 for msg_type, handlers in self.subscribers.items()
             }
         }
\ No newline at end of file
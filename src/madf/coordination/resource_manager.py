@@ -1,7 +1,10 @@
 """Resource management for agent orchestration."""
 
 import asyncio
-from typing import Dict, Optional, Set
+import itertools
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -29,6 +32,102 @@ class ResourcePool:
         self.available = self.max_size
 
 
+class FairShareScheduler:
+    """
+    Max-min fair allocation of task slots across agent types.
+    
+    Up to ``capacity`` tasks run at once. While slots are free they are
+    granted immediately; under contention each freed slot goes to the
+    waiting agent type holding the fewest slots (oldest waiter on ties),
+    so every busy type converges on an equal share and slots left unused
+    by idle types spill over to busy ones.
+    
+    Example:
+        >>> scheduler = FairShareScheduler(capacity=4)
+        >>> async with scheduler.slot('writing'):
+        ...     await agent.execute(task)
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize scheduler.
+        
+        Args:
+            capacity: Maximum concurrent tasks across all agent types
+        """
+        self.capacity = max(1, capacity)
+        self.running = 0
+        self.in_use: Dict[str, int] = defaultdict(int)
+        self.waiters: Dict[str, Deque[Tuple[int, asyncio.Future]]] = defaultdict(deque)
+        self._arrivals = itertools.count()
+    
+    async def acquire(self, agent_type: str):
+        """
+        Wait for a task slot for an agent type.
+        
+        Args:
+            agent_type: Agent type requesting the slot
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.waiters[agent_type].append((next(self._arrivals), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before cancellation; hand the slot on
+                self.release(agent_type)
+            raise
+    
+    def release(self, agent_type: str):
+        """
+        Return a task slot and grant it to the fairest waiter.
+        
+        Args:
+            agent_type: Agent type that held the slot
+        """
+        self.running -= 1
+        self.in_use[agent_type] -= 1
+        self._dispatch()
+    
+    @asynccontextmanager
+    async def slot(self, agent_type: str) -> AsyncIterator[None]:
+        """
+        Hold a task slot for the duration of the block.
+        
+        Args:
+            agent_type: Agent type requesting the slot
+        """
+        await self.acquire(agent_type)
+        try:
+            yield
+        finally:
+            self.release(agent_type)
+    
+    def _grant(self, agent_type: str):
+        self.running += 1
+        self.in_use[agent_type] += 1
+    
+    def _dispatch(self):
+        """Grant free slots to waiters, fewest slots held first."""
+        while self.running < self.capacity:
+            best = None
+            for agent_type, queue in self.waiters.items():
+                while queue and queue[0][1].cancelled():
+                    queue.popleft()
+                if queue:
+                    key = (self.in_use[agent_type], queue[0][0])
+                    if best is None or key < best[0]:
+                        best = (key, agent_type)
+            if best is None:
+                return
+            
+            agent_type = best[1]
+            _, future = self.waiters[agent_type].popleft()
+            self._grant(agent_type)
+            future.set_result(None)
+
+
 class ResourceManager:
     """
     Manages computational resources and agent capacity.
@@ -47,22 +146,25 @@ class ResourceManager:
         ...     pass
     """
     
-    def __init__(self, max_agents: int = 10):
+    def __init__(self, max_agents: int = 10, max_concurrent_tasks: Optional[int] = None):
         """
         Initialize resource manager.
         
         Args:
             max_agents: Maximum concurrent agents
+            max_concurrent_tasks: Task slots shared fairly across agent
+                types (defaults to ``max_agents``)
         """
         self.max_agents = max_agents
         self.pool = ResourcePool(max_size=max_agents)
+        self.scheduler = FairShareScheduler(max_concurrent_tasks or max_agents)
         self.metrics = {
             'total_allocations': 0,
             'total_deallocations': 0,
             'peak_usage': 0,
             'wait_times': []
         }
-        logger.info(f"ResourceManager initialized with {max_agents} agents")
+        logger.info("ResourceManager initialized with %s agents", max_agents)
     
     async def acquire(self, resource_id: str, timeout: Optional[float] = None) -> 'ResourceContext':
         """
@@ -82,14 +184,14 @@ class ResourceManager:
         
         # Wait for resource availability
         if self.pool.available <= 0:
-            logger.debug(f"Resource {resource_id} waiting for availability")
+            logger.debug("Resource %s waiting for availability", resource_id)
             try:
                 await asyncio.wait_for(
                     self._wait_for_resource(),
                     timeout=timeout
                 )
             except asyncio.TimeoutError:
-                logger.error(f"Resource {resource_id} acquisition timed out")
+                logger.error("Resource %s acquisition timed out", resource_id)
                 raise
         
         # Acquire resource
@@ -106,10 +208,22 @@ class ResourceManager:
         wait_time = (datetime.now() - start_time).total_seconds()
         self.metrics['wait_times'].append(wait_time)
         
-        logger.debug(f"Resource {resource_id} acquired (available: {self.pool.available})")
+        logger.debug("Resource %s acquired (available: %s)", resource_id, self.pool.available)
         
         return ResourceContext(self, resource_id)
     
+    def task_slot(self, agent_type: str):
+        """
+        Fair-share task slot for an agent type.
+        
+        Args:
+            agent_type: Agent type running the task
+            
+        Returns:
+            Async context manager holding the slot
+        """
+        return self.scheduler.slot(agent_type)
+    
     async def _wait_for_resource(self):
         """Wait for a resource to become available."""
         while self.pool.available <= 0:
@@ -126,7 +240,7 @@ class ResourceManager:
             self.pool.in_use.remove(resource_id)
             self.pool.available += 1
             self.metrics['total_deallocations'] += 1
-            logger.debug(f"Resource {resource_id} released (available: {self.pool.available})")
+            logger.debug("Resource %s released (available: %s)", resource_id, self.pool.available)
     
     def get_stats(self) -> Dict:
         """
@@ -4,7 +4,7 @@ State manager for distributed state across agents.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import json
 
@@ -37,7 +37,7 @@ class StateManager:
         self.workflow_states: Dict[str, WorkflowState] = {}
         self.locks: Dict[str, asyncio.Lock] = {}
         
-        logger.info(f"StateManager initialized with backend: {backend}")
+        logger.info("StateManager initialized with backend: %s", backend)
     
     async def create_document_state(self,
                                    document_id: str,
@@ -68,7 +68,7 @@ class StateManager:
         self.document_states[document_id] = state
         self.locks[document_id] = asyncio.Lock()
         
-        logger.debug(f"Created document state: {document_id}")
+        logger.debug("Created document state: %s", document_id)
         return state
     
     async def get_document_state(self, document_id: str) -> Optional[DocumentState]:
@@ -93,7 +93,7 @@ class StateManager:
             True if successful
         """
         if document_id not in self.document_states:
-            logger.warning(f"Document not found: {document_id}")
+            logger.warning("Document not found: %s", document_id)
             return False
         
         async with self.locks[document_id]:
@@ -114,7 +114,7 @@ class StateManager:
             )
             state.history.append(change)
             
-            logger.debug(f"Updated document {document_id} to version {state.version}")
+            logger.debug("Updated document %s to version %s", document_id, state.version)
             return True
     
     async def update_document_metadata(self,
@@ -159,7 +159,7 @@ class StateManager:
         )
         
         self.workflow_states[workflow_id] = state
-        logger.debug(f"Created workflow state: {workflow_id}")
+        logger.debug("Created workflow state: %s", workflow_id)
         return state
     
     async def get_workflow_state(self, workflow_id: str) -> Optional[WorkflowState]:
@@ -172,15 +172,37 @@ class StateManager:
         """
         Update current workflow stage.
         """
+        return await self.update_stages(workflow_id, [(stage, datetime.now())])
+    
+    async def update_stages(self,
+                            workflow_id: str,
+                            transitions: List[Tuple[Any, datetime]]) -> bool:
+        """
+        Apply a batch of buffered stage transitions in one call.
+        
+        Equivalent to calling ``update_stage`` for each transition in order;
+        the workflow ends on the last stage with its timestamp.
+        
+        Args:
+            workflow_id: Workflow to update
+            transitions: (stage, timestamp) pairs in the order they happened
+        
+        Returns:
+            True if successful
+        """
+        if not transitions:
+            return True
+        
         if workflow_id not in self.workflow_states:
             # Create if doesn't exist
             await self.create_workflow_state(workflow_id, [])
         
+        stage, timestamp = transitions[-1]
         state = self.workflow_states[workflow_id]
-        state.stage = stage.value if hasattr(stage, 'value') else str(stage)
-        state.updated_at = datetime.now()
+        state.stage = stage.value_str if hasattr(stage, 'value_str') else str(stage)
+        state.updated_at = timestamp
         
-        logger.debug(f"Updated workflow {workflow_id} to stage: {state.stage}")
+        logger.debug("Updated workflow %s to stage: %s", workflow_id, state.stage)
         return True
     
     async def complete_stage(self,
@@ -206,7 +228,7 @@ class StateManager:
         
         state.updated_at = datetime.now()
         
-        logger.debug(f"Completed stage {stage} for workflow {workflow_id}")
+        logger.debug("Completed stage %s for workflow %s", stage, workflow_id)
         return True
     
     async def get_state_history(self, document_id: str) -> List[StateChange]:
@@ -261,11 +283,11 @@ class StateManager:
                     state.content = snapshot['content']
                     state.metadata = snapshot['metadata']
             
-            logger.info(f"Restored snapshot for document: {document_id}")
+            logger.info("Restored snapshot for document: %s", document_id)
             return True
         
         except Exception as e:
-            logger.error(f"Failed to restore snapshot: {e}")
+            logger.error("Failed to restore snapshot: %s", e)
             return False
     
     async def close(self):
@@ -1,19 +1,21 @@
 """Workflow management for document creation."""
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Set
-from enum import Enum
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
 
 from ..models.request import DocumentRequest
+from ..models._common import _NamedIntEnum
 
 
-class StageType(Enum):
+class StageType(_NamedIntEnum):
     """Types of workflow stages."""
-    RESEARCH = "research"
-    PLANNING = "planning"
-    WRITING = "writing"
-    EDITING = "editing"
-    VERIFICATION = "verification"
+    RESEARCH = 1
+    PLANNING = 2
+    WRITING = 3
+    EDITING = 4
+    VERIFICATION = 5
 
 
 @dataclass
@@ -47,6 +49,35 @@ class Stage:
         return all(dep in completed_stages for dep in self.depends_on)
 
 
+@dataclass
+class ReadyBatch:
+    """
+    Stages ready for dispatch in a single scheduling step.
+    
+    Attributes:
+        parallel: Ready stages marked parallel, safe to run concurrently
+        serial: A single ready stage that must run on its own
+    """
+    parallel: List[Stage] = field(default_factory=list)
+    serial: Optional[Stage] = None
+    
+    @property
+    def stages(self) -> List[Stage]:
+        """All stages in this batch."""
+        return self.parallel if self.serial is None else [self.serial]
+    
+    def __bool__(self) -> bool:
+        return bool(self.parallel) or self.serial is not None
+
+
+def _make_batch(ready: List[Stage]) -> ReadyBatch:
+    """Group ready stages into a parallel batch or a single serial stage."""
+    parallel = [stage for stage in ready if stage.parallel]
+    if parallel:
+        return ReadyBatch(parallel=parallel)
+    return ReadyBatch(serial=ready[0] if ready else None)
+
+
 @dataclass
 class Workflow:
     """
@@ -60,6 +91,9 @@ class Workflow:
     name: str
     stages: List[Stage]
     metadata: dict = field(default_factory=dict)
+    _compiled_runner: Optional[Callable[..., Awaitable[None]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def get_next_stages(self, completed_stages: Set[str]) -> List[Stage]:
         """
@@ -76,6 +110,290 @@ class Workflow:
             if stage.name not in completed_stages
             and stage.can_execute(completed_stages)
         ]
+    
+    def get_ready_batch(self, completed_stages: Set[str]) -> ReadyBatch:
+        """
+        Get the next batch of stages to dispatch.
+        
+        All ready stages marked ``parallel`` are returned together so they
+        can be run concurrently; otherwise a single serial stage is returned.
+        
+        Args:
+            completed_stages: Set of completed stage names
+            
+        Returns:
+            Batch of stages ready for execution
+        """
+        return _make_batch(self.get_next_stages(completed_stages))
+    
+    def compile(self):
+        """
+        Specialize this workflow into a straight-line async runner.
+        
+        The stage order is resolved once and emitted as generated code, so
+        running the workflow needs no per-stage scheduling. Parallel
+        batches are emitted as a single ``_run_parallel`` call. Workflows
+        where waiting for a whole batch would hold back a stage whose own
+        dependencies are already met keep the dataflow runner instead.
+        
+        Raises:
+            ValueError: If the stage dependencies are unknown or cyclic
+        """
+        batches = _resolve_batches(self)
+        if _barriers_implied(batches):
+            self._compiled_runner = _compile_runner(self, batches)
+        else:
+            self._compiled_runner = self._run_dataflow
+    
+    async def run(self, run_stage: Callable[[Stage], Awaitable[Any]]):
+        """
+        Run all stages in dependency order.
+        
+        Uses the compiled runner when available and falls back to
+        dispatching stages as their dependencies complete otherwise.
+        
+        Args:
+            run_stage: Coroutine function executing a single stage
+        """
+        if self._compiled_runner is not None:
+            await self._compiled_runner(run_stage)
+            return
+        
+        await self._run_dataflow(run_stage)
+    
+    async def _run_dataflow(self, run_stage: Callable[[Stage], Awaitable[Any]]):
+        """
+        Dispatch each stage as soon as its dependencies have completed.
+        
+        Parallel stages start whenever they are ready; serial stages never
+        overlap one another. If a stage fails, stages still running are
+        cancelled and awaited, then the error is re-raised.
+        
+        Args:
+            run_stage: Coroutine function executing a single stage
+            
+        Raises:
+            ValueError: If the stage dependencies are cyclic
+        """
+        scheduler = WorkflowScheduler(self)
+        pending: Dict[asyncio.Future, Stage] = {}
+        serial_running = False
+        
+        try:
+            while not scheduler.done:
+                for stage in scheduler.take_ready(serial_running):
+                    pending[asyncio.ensure_future(run_stage(stage))] = stage
+                    serial_running = serial_running or not stage.parallel
+                
+                if not pending:
+                    raise ValueError(f"Workflow {self.name} has cyclic stage dependencies")
+                
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = pending.pop(task)
+                    task.result()
+                    if not stage.parallel:
+                        serial_running = False
+                    scheduler.complete(stage.name)
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let cancelled stages finish their cleanup before returning
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _resolve_batches(workflow: Workflow) -> List[ReadyBatch]:
+    """Resolve a workflow into the ordered batches it will execute."""
+    scheduler = WorkflowScheduler(workflow)
+    batches = []
+    while not scheduler.done:
+        batch = scheduler.take_batch()
+        if not batch:
+            raise ValueError(f"Workflow {workflow.name} has cyclic stage dependencies")
+        for stage in batch.stages:
+            scheduler.complete(stage.name)
+        batches.append(batch)
+    return batches
+
+
+def _barriers_implied(batches: List[ReadyBatch]) -> bool:
+    """Whether every stage already depends on all stages of the batch before it."""
+    ancestors: Dict[str, Set[str]] = {}
+    previous: Set[str] = set()
+    for batch in batches:
+        for stage in batch.stages:
+            ancestors[stage.name] = set(stage.depends_on).union(
+                *(ancestors[dep] for dep in stage.depends_on)
+            )
+            if not previous <= ancestors[stage.name]:
+                return False
+        previous = {stage.name for stage in batch.stages}
+    return True
+
+
+async def _run_parallel(*stage_runs: Awaitable[Any]):
+    """
+    Run a batch of stages concurrently.
+    
+    If a stage fails, the others are cancelled and awaited before the
+    error is re-raised, as in the dataflow runner.
+    """
+    tasks = [asyncio.ensure_future(run) for run in stage_runs]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Also retrieves the errors of any other failed stages
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _compile_runner(workflow: Workflow,
+                    batches: List[ReadyBatch]) -> Callable[..., Awaitable[None]]:
+    """Generate a straight-line runner for a workflow's resolved stage order."""
+    stages = []
+    lines = ["async def _run(run_stage):"]
+    
+    for batch in batches:
+        calls = []
+        for stage in batch.stages:
+            calls.append(f"run_stage(stages[{len(stages)}])")
+            stages.append(stage)
+        if batch.serial is not None:
+            lines.append(f"    await {calls[0]}")
+        else:
+            lines.append(f"    await run_parallel({', '.join(calls)})")
+    
+    if not stages:
+        lines.append("    return None")
+    
+    namespace = {'stages': tuple(stages), 'run_parallel': _run_parallel}
+    exec(compile("\n".join(lines), f"<workflow:{workflow.name}>", "exec"), namespace)
+    return namespace['_run']
+
+
+class WorkflowScheduler:
+    """
+    Incremental scheduler for workflow stages.
+    
+    Tracks the number of unmet dependencies per stage and keeps a queue
+    of stages that are ready to run, so completing a stage only touches
+    its direct dependents instead of re-scanning the whole workflow.
+    
+    Example:
+        >>> scheduler = WorkflowScheduler(workflow)
+        >>> while not scheduler.done:
+        ...     stage = scheduler.take()
+        ...     await run(stage)
+        ...     scheduler.complete(stage.name)
+    """
+    
+    def __init__(self, workflow: Workflow):
+        """
+        Initialize scheduler for a workflow.
+        
+        Args:
+            workflow: Workflow to schedule
+            
+        Raises:
+            ValueError: If a stage depends on an unknown stage
+        """
+        self.workflow = workflow
+        self.stages: Dict[str, Stage] = {stage.name: stage for stage in workflow.stages}
+        self.pending: Dict[str, int] = {}
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.stages}
+        self.ready: Deque[Stage] = deque()
+        self.completed: Set[str] = set()
+        
+        for stage in workflow.stages:
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage: {dep}")
+                self.dependents[dep].append(stage.name)
+            self.pending[stage.name] = len(stage.depends_on)
+            if not stage.depends_on:
+                self.ready.append(stage)
+    
+    @property
+    def done(self) -> bool:
+        """Whether all stages have completed."""
+        return len(self.completed) == len(self.stages)
+    
+    def has_ready(self) -> bool:
+        """Whether a stage is ready for execution."""
+        return bool(self.ready)
+    
+    def take(self) -> Optional[Stage]:
+        """
+        Take the next ready stage.
+        
+        Returns:
+            Next stage to execute, or None if no stage is ready
+        """
+        return self.ready.popleft() if self.ready else None
+    
+    def take_batch(self) -> ReadyBatch:
+        """
+        Take the next batch of ready stages.
+        
+        Every ready stage marked ``parallel`` is taken at once for
+        concurrent dispatch; otherwise only the first serial stage is taken.
+        
+        Returns:
+            Batch of stages to execute (empty if nothing is ready)
+        """
+        batch = _make_batch(list(self.ready))
+        if batch.serial is not None:
+            self.ready.remove(batch.serial)
+        elif batch.parallel:
+            self.ready = deque(stage for stage in self.ready if not stage.parallel)
+        return batch
+    
+    def take_ready(self, serial_running: bool = False) -> List[Stage]:
+        """
+        Take every ready stage that may start now.
+        
+        All ready ``parallel`` stages are taken, plus the first ready serial
+        stage unless a serial stage is still running.
+        
+        Args:
+            serial_running: Whether a serial stage is currently executing
+            
+        Returns:
+            Stages to dispatch (empty if nothing may start)
+        """
+        taken = [stage for stage in self.ready if stage.parallel]
+        if not serial_running:
+            serial = next((stage for stage in self.ready if not stage.parallel), None)
+            if serial is not None:
+                taken.append(serial)
+        if taken:
+            names = {stage.name for stage in taken}
+            self.ready = deque(stage for stage in self.ready if stage.name not in names)
+        return taken
+    
+    def complete(self, name: str) -> List[Stage]:
+        """
+        Mark a stage as completed.
+        
+        Args:
+            name: Name of the completed stage
+            
+        Returns:
+            Stages that became ready as a result
+        """
+        if name in self.completed:
+            return []
+        self.completed.add(name)
+        
+        newly_ready = []
+        for dependent in self.dependents[name]:
+            self.pending[dependent] -= 1
+            if self.pending[dependent] == 0:
+                stage = self.stages[dependent]
+                self.ready.append(stage)
+                newly_ready.append(stage)
+        return newly_ready
 
 
 class WorkflowManager:
@@ -89,18 +407,19 @@ class WorkflowManager:
     def __init__(self):
         """Initialize workflow manager."""
         self.workflows = {}
+        self._outline_workflows: Dict[str, Workflow] = {}
         self._register_default_workflows()
     
     def _register_default_workflows(self):
         """Register default workflows for common document types."""
         # Standard article workflow
-        self.workflows['article'] = self._create_article_workflow()
+        self.register_workflow('article', self._create_article_workflow())
         
         # Research paper workflow
-        self.workflows['paper'] = self._create_paper_workflow()
+        self.register_workflow('paper', self._create_paper_workflow())
         
         # Technical report workflow
-        self.workflows['report'] = self._create_report_workflow()
+        self.register_workflow('report', self._create_report_workflow())
     
     def _create_article_workflow(self) -> Workflow:
         """Create workflow for article creation."""
@@ -208,13 +527,55 @@ class WorkflowManager:
             Workflow for document creation
         """
         # Get workflow based on document type
-        workflow_template = self.workflows.get(
-            request.document_type,
-            self.workflows['article']  # Default to article
-        )
+        name = request.document_type
+        if name not in self.workflows:
+            name = 'article'  # Default to article
+        
+        # With a predefined outline, writing no longer waits on research
+        if request.outline:
+            return self._outline_workflow(name)
         
-        # Can customize workflow based on request requirements
-        return workflow_template
+        return self.workflows[name]
+    
+    def _outline_workflow(self, name: str) -> Workflow:
+        """
+        Variant of a workflow for requests that supply their own outline.
+        
+        The writing agent only needs research to build an outline, so writing
+        stages drop their research dependencies and run alongside research.
+        Verification still checks claims against the research brief, so
+        verification stages depend on research directly. Variants are built
+        and compiled once per registration, since distinct workflows may
+        share a ``Workflow.name``.
+        
+        Args:
+            name: Name the workflow is registered under
+            
+        Returns:
+            Workflow with research and writing overlapped
+        """
+        cached = self._outline_workflows.get(name)
+        if cached is not None:
+            return cached
+        
+        template = self.workflows[name]
+        research = {s.name for s in template.stages if s.agent_type == 'research'}
+        stages = []
+        for stage in template.stages:
+            if stage.agent_type == 'writing' and research.intersection(stage.depends_on):
+                depends_on = [d for d in stage.depends_on if d not in research]
+                stage = replace(stage, depends_on=depends_on, parallel=True)
+            elif stage.name in research:
+                stage = replace(stage, parallel=True)
+            elif stage.agent_type == 'verification':
+                missing = [r for r in sorted(research) if r not in stage.depends_on]
+                stage = replace(stage, depends_on=stage.depends_on + missing)
+            stages.append(stage)
+        
+        workflow = Workflow(name=template.name, stages=stages, metadata=template.metadata)
+        workflow.compile()
+        self._outline_workflows[name] = workflow
+        return workflow
     
     def register_workflow(self, name: str, workflow: Workflow):
         """
@@ -224,7 +585,21 @@ class WorkflowManager:
             name: Workflow name
             workflow: Workflow instance
         """
+        workflow.compile()
         self.workflows[name] = workflow
+        self._outline_workflows.pop(name, None)
+    
+    def schedule(self, workflow: Workflow) -> WorkflowScheduler:
+        """
+        Create a scheduler for executing a workflow.
+        
+        Args:
+            workflow: Workflow to schedule
+            
+        Returns:
+            Scheduler tracking ready stages
+        """
+        return WorkflowScheduler(workflow)
 
 
 class WorkflowBuilder:
@@ -2,7 +2,20 @@
 
 from .document import Document, DocumentSection, DocumentStatus
 from .request import DocumentRequest
-from .task import Task, TaskResult
+from .task import Task, TaskResult, TaskBatch, TaskView
+from .state import (
+    MessageType,
+    AgentStatus,
+    AgentMetrics,
+    Result,
+    Message,
+    Context,
+    FeedbackHistory,
+    FeedbackView,
+    StateChange,
+    DocumentState,
+    WorkflowState,
+)
 
 __all__ = [
     "Document",
@@ -11,4 +24,17 @@ __all__ = [
     "DocumentRequest",
     "Task",
     "TaskResult",
+    "TaskBatch",
+    "TaskView",
+    "MessageType",
+    "AgentStatus",
+    "AgentMetrics",
+    "Result",
+    "Message",
+    "Context",
+    "FeedbackHistory",
+    "FeedbackView",
+    "StateChange",
+    "DocumentState",
+    "WorkflowState",
 ]
\ No newline at end of file
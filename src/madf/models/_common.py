@@ -0,0 +1,67 @@
+"""Helpers shared across model modules."""
+
+from collections import deque
+from enum import IntEnum
+from typing import Deque
+import os
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_VALID_TYPES = frozenset({"article", "paper", "report", "essay", "blog", "documentation"})
+
+
+_ID_BATCH = 256
+_id_pool: Deque[str] = deque()
+
+
+def _refill_id_pool():
+    """Pre-generate a batch of random UUID4 strings from one urandom read."""
+    raw = bytearray(os.urandom(16 * _ID_BATCH))
+    for i in range(0, len(raw), 16):
+        raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40  # version 4
+        raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    _id_pool.extend(
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    )
+
+
+def _new_id() -> str:
+    """Generate a new unique identifier (UUID4 string)."""
+    while True:
+        try:
+            return _id_pool.popleft()
+        except IndexError:
+            _refill_id_pool()
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the parent's pre-generated ids
+    os.register_at_fork(after_in_child=_id_pool.clear)
+
+
+def _intern_id(value):
+    """Intern an identifier so dict/set lookups can match on identity."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class _NamedIntEnum(IntEnum):
+    """
+    Integer-valued enum whose external string form is the member name.
+    
+    Members compare and hash as small ints; ``value_str`` and ``from_str``
+    convert to and from the lower-case name used in logs and storage.
+    """
+    
+    @property
+    def value_str(self) -> str:
+        """Lower-case string form of the member."""
+        return self.name.lower()
+    
+    @classmethod
+    def from_str(cls, value: str):
+        """Look up a member by its string form."""
+        return cls[value.upper()]
@@ -3,21 +3,22 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from datetime import datetime
-from enum import Enum
 
+from ._common import _SLOTS, _NamedIntEnum, _intern_id
 
-class DocumentStatus(Enum):
+
+class DocumentStatus(_NamedIntEnum):
     """Document creation status."""
-    PENDING = "pending"
-    RESEARCHING = "researching"
-    WRITING = "writing"
-    EDITING = "editing"
-    VERIFYING = "verifying"
-    COMPLETE = "complete"
-    FAILED = "failed"
+    PENDING = 1
+    RESEARCHING = 2
+    WRITING = 3
+    EDITING = 4
+    VERIFYING = 5
+    COMPLETE = 6
+    FAILED = 7
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocumentSection:
     """
     Represents a section of a document.
@@ -43,10 +44,13 @@ class Document:
     """
     Complete document with metadata.
     
+    Sections are kept ordered by ``DocumentSection.order`` so renderers can
+    iterate them directly; use ``add_section`` to insert new sections.
+    
     Attributes:
         id: Unique document identifier
         title: Document title
-        sections: List of document sections
+        sections: List of document sections, ordered by section order
         status: Current document status
         quality_score: Quality score (0-1)
         word_count: Total word count
@@ -64,6 +68,29 @@ class Document:
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        self.id = _intern_id(self.id)
+        self.sections = sorted(self.sections, key=lambda x: x.order)
+    
+    def add_section(self, section: DocumentSection):
+        """
+        Insert a section, keeping sections ordered.
+        
+        Sections with equal order keep their insertion order.
+        
+        Args:
+            section: Section to insert
+        """
+        sections = self.sections
+        lo, hi = 0, len(sections)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if section.order < sections[mid].order:
+                hi = mid
+            else:
+                lo = mid + 1
+        sections.insert(lo, section)
+    
     def get_full_text(self) -> str:
         """
         Get complete document text.
@@ -71,13 +98,13 @@ class Document:
         Returns:
             Full document text with all sections
         """
-        sorted_sections = sorted(self.sections, key=lambda x: x.order)
-        return "\n\n".join([s.content for s in sorted_sections])
+        return "\n\n".join([s.content for s in self.sections])
     
     def update_word_count(self):
         """Update word count based on content."""
-        text = self.get_full_text()
-        self.word_count = len(text.split())
+        # Sections are joined with blank lines, so per-section counts sum to
+        # the full-text count without materializing the joined document.
+        self.word_count = sum(s.word_count() for s in self.sections)
     
     def get_section(self, title: str) -> DocumentSection:
         """Get section by title."""
@@ -95,7 +122,7 @@ class Document:
         """
         md = f"# {self.title}\n\n"
         
-        for section in sorted(self.sections, key=lambda x: x.order):
+        for section in self.sections:
             md += f"## {section.title}\n\n"
             md += f"{section.content}\n\n"
         
@@ -111,7 +138,7 @@ class Document:
         html = f"<html><head><title>{self.title}</title></head><body>\n"
         html += f"<h1>{self.title}</h1>\n"
         
-        for section in sorted(self.sections, key=lambda x: x.order):
+        for section in self.sections:
             html += f"<h2>{section.title}</h2>\n"
             # Simple paragraph conversion
             paragraphs = section.content.split('\n\n')
@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
+import warnings
 
+from ._common import _SLOTS, _VALID_TYPES
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class DocumentRequest:
     """
     Request for document creation.
@@ -40,18 +43,46 @@ class DocumentRequest:
         Raises:
             ValueError: If validation fails
         """
-        if not self.topic or len(self.topic) < 5:
+        topic_len = len(self.topic) if self.topic else 0
+        if topic_len < 5:
             raise ValueError("Topic must be at least 5 characters")
         
-        if self.target_length < 100:
-            raise ValueError("Target length must be at least 100 words")
-        
-        if self.target_length > 50000:
+        target_length = self.target_length
+        if not 100 <= target_length <= 50000:
+            if target_length < 100:
+                raise ValueError("Target length must be at least 100 words")
             raise ValueError("Target length cannot exceed 50,000 words")
         
-        valid_types = ['article', 'paper', 'report', 'essay', 'blog', 'documentation']
-        if self.document_type not in valid_types:
+        if self.document_type not in _VALID_TYPES:
             # Allow custom types but warn
-            pass
+            warnings.warn(
+                f"Unknown document type '{self.document_type}'; "
+                "falling back to the default workflow",
+                UserWarning,
+                stacklevel=2
+            )
+        
+        return True
+    
+    def to_metadata_dict(self) -> Dict[str, Any]:
+        """
+        Persistable copy of the request fields.
+        
+        Only the list and dict fields are copied, one level deep. Every
+        field holds primitives, so this avoids the recursive deep copy that
+        ``dataclasses.asdict`` performs.
         
-        return True
\ No newline at end of file
+        Returns:
+            Dictionary of request fields
+        """
+        return {
+            'topic': self.topic,
+            'document_type': self.document_type,
+            'target_length': self.target_length,
+            'style': self.style,
+            'audience': self.audience,
+            'requirements': list(self.requirements),
+            'references': list(self.references),
+            'outline': self.outline,
+            'metadata': dict(self.metadata)
+        }
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""Agent, messaging and workflow state models."""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional
+from datetime import datetime
+
+from ._common import _SLOTS, _NamedIntEnum, _intern_id, _new_id
+
+
+class MessageType(_NamedIntEnum):
+    """Types of messages exchanged between agents"""
+    TASK = 1
+    RESULT = 2
+    STATUS = 3
+    ERROR = 4
+    FEEDBACK = 5
+    CONTROL = 6
+
+
+class AgentStatus(_NamedIntEnum):
+    """Agent operational status"""
+    IDLE = 1
+    BUSY = 2
+    ERROR = 3
+    OFFLINE = 4
+
+
+@dataclass
+class AgentMetrics:
+    """Performance metrics for an agent"""
+    tasks_completed: int = 0
+    tasks_failed: int = 0
+    total_processing_time: float = 0.0
+    total_tokens_used: int = 0
+    average_quality_contribution: float = 0.0
+    last_activity: Optional[datetime] = None
+
+
+@dataclass(**_SLOTS)
+class Result:
+    """Result of agent processing"""
+    task_id: str
+    success: bool
+    output: Any
+    metadata: Dict[str, Any]
+    metrics: Dict[str, Any]
+    errors: Optional[List[str]] = None
+    completed_at: datetime = field(default_factory=datetime.now)
+    
+    def __post_init__(self):
+        self.task_id = _intern_id(self.task_id)
+
+
+@dataclass(**_SLOTS)
+class Message:
+    """Message for inter-agent communication"""
+    id: str = field(default_factory=_new_id)
+    type: MessageType = MessageType.TASK
+    sender: str = ""
+    recipient: str = ""
+    payload: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
+    priority: int = 0
+    correlation_id: Optional[str] = None
+    
+    def __post_init__(self):
+        self.id = _intern_id(self.id)
+        self.correlation_id = _intern_id(self.correlation_id)
+
+
+class FeedbackView(NamedTuple):
+    """Read-only column view of a FeedbackHistory."""
+    iterations: List[int]
+    scores: array
+    feedbacks: List[Dict[str, Any]]
+
+
+@dataclass(**_SLOTS)
+class FeedbackHistory:
+    """
+    Per-iteration feedback stored column-wise.
+    
+    Agents that only need scores or iteration numbers can read a single
+    column instead of rebuilding a dict per entry.
+    
+    Attributes:
+        iterations: Iteration number of each entry
+        scores: Quality score of each entry
+        feedbacks: Feedback payload of each entry
+    """
+    iterations: List[int] = field(default_factory=list)
+    scores: array = field(default_factory=lambda: array('d'))
+    feedbacks: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def append(self, iteration: int, score: float, feedback: Dict[str, Any]):
+        """Record feedback for an iteration."""
+        self.iterations.append(iteration)
+        self.scores.append(score)
+        self.feedbacks.append(feedback)
+    
+    def as_view(self) -> FeedbackView:
+        """Columns as a lightweight tuple, without copying."""
+        return FeedbackView(self.iterations, self.scores, self.feedbacks)
+    
+    def __len__(self) -> int:
+        return len(self.iterations)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate entries as dicts with iteration/score/feedback keys."""
+        for iteration, score, feedback in zip(self.iterations, self.scores, self.feedbacks):
+            yield {'iteration': iteration, 'score': score, 'feedback': feedback}
+
+
+@dataclass
+class Context:
+    """Context for document creation"""
+    topic: str
+    requirements: Dict[str, Any]
+    research_data: Optional[Dict[str, Any]] = None
+    outline: Optional[Dict[str, Any]] = None
+    feedback: FeedbackHistory = field(default_factory=FeedbackHistory)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(**_SLOTS)
+class StateChange:
+    """Record of a state change"""
+    timestamp: datetime = field(default_factory=datetime.now)
+    actor: str = ""
+    action: str = ""
+    previous_state: Any = None
+    new_state: Any = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class DocumentState:
+    """State of a document in creation"""
+    document_id: str
+    version: int = 1
+    content: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    history: List[StateChange] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    
+    def __post_init__(self):
+        self.document_id = _intern_id(self.document_id)
+
+
+@dataclass
+class WorkflowState:
+    """State of workflow execution"""
+    workflow_id: str
+    stage: str
+    completed_stages: List[str] = field(default_factory=list)
+    pending_stages: List[str] = field(default_factory=list)
+    quality_scores: Dict[str, float] = field(default_factory=dict)
+    iteration: int = 0
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    
+    def __post_init__(self):
+        self.workflow_id = _intern_id(self.workflow_id)
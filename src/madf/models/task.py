@@ -1,11 +1,16 @@
 """Task models for agent execution."""
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+import heapq
+import itertools
 
+from ._common import _SLOTS, _intern_id
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Task:
     """
     Represents a task for an agent.
@@ -24,9 +29,12 @@ class Task:
     priority: int = 0
     created_at: datetime = field(default_factory=datetime.now)
     assigned_to: Optional[str] = None
+    
+    def __post_init__(self):
+        self.id = _intern_id(self.id)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskResult:
     """
     Result from agent task execution.
@@ -44,4 +52,147 @@ class TaskResult:
     data: Dict[str, Any]
     error: Optional[str] = None
     execution_time: float = 0.0
-    metadata: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        self.task_id = _intern_id(self.task_id)
+
+
+class TaskView:
+    """
+    Lightweight read-only view of a task stored in a TaskBatch.
+    
+    A view from ``peek()`` reads the batch columns on access. ``pop()``
+    frees the task's slot for reuse, so a popped view holds its row
+    instead. Call ``to_task()`` to materialize a full Task.
+    """
+    
+    __slots__ = ("batch", "index", "_row")
+    
+    def __init__(self, batch: "TaskBatch", index: int, row: Optional[tuple] = None):
+        self.batch = batch
+        self.index = index
+        # (id, type, priority, created_ns, data) once detached by pop()
+        self._row = row
+    
+    def _get(self, position: int, column: str) -> Any:
+        """Read a field from the detached row or the batch column."""
+        if self._row is not None:
+            return self._row[position]
+        return getattr(self.batch, column)[self.index]
+    
+    @property
+    def id(self) -> str:
+        return self._get(0, "ids")
+    
+    @property
+    def type(self) -> str:
+        return self._get(1, "types")
+    
+    @property
+    def priority(self) -> int:
+        return self._get(2, "priorities")
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        return self._get(4, "payload_refs")
+    
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._get(3, "created_ns") / 1e9)
+    
+    def to_task(self) -> Task:
+        """Materialize this view as a Task."""
+        return Task(
+            id=self.id,
+            type=self.type,
+            data=self.data,
+            priority=self.priority,
+            created_at=self.created_at
+        )
+
+
+class TaskBatch:
+    """
+    Priority queue of tasks stored column-wise.
+    
+    Task fields are kept in parallel arrays so heap operations only touch
+    compact ``(-priority, sequence, index)`` entries instead of full Task
+    objects. Higher priority tasks pop first; equal priorities pop in
+    insertion order. Popped slots are cleared and reused, so the columns
+    only grow to the largest number of tasks queued at once.
+    
+    Attributes:
+        ids: Task identifiers
+        types: Task types
+        priorities: Task priorities
+        created_ns: Creation timestamps in nanoseconds
+        payload_refs: Task payload data
+    """
+    
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.ids: List[Optional[str]] = []
+        self.types: List[Optional[str]] = []
+        self.priorities = array('q')
+        self.created_ns = array('q')
+        self.payload_refs: List[Optional[Dict[str, Any]]] = []
+        self._heap: List[Tuple[int, int, int]] = []
+        self._free: List[int] = []
+        self._sequence = itertools.count()
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def push(self, task: Task):
+        """
+        Add a task to the batch.
+        
+        Args:
+            task: Task to enqueue
+        """
+        created_ns = int(task.created_at.timestamp() * 1e9)
+        if self._free:
+            index = self._free.pop()
+            self.ids[index] = task.id
+            self.types[index] = task.type
+            self.priorities[index] = task.priority
+            self.created_ns[index] = created_ns
+            self.payload_refs[index] = task.data
+        else:
+            index = len(self.ids)
+            self.ids.append(task.id)
+            self.types.append(task.type)
+            self.priorities.append(task.priority)
+            self.created_ns.append(created_ns)
+            self.payload_refs.append(task.data)
+        heapq.heappush(self._heap, (-task.priority, next(self._sequence), index))
+    
+    def pop(self) -> TaskView:
+        """
+        Remove and return the highest priority task.
+        
+        Returns:
+            View of the dequeued task
+            
+        Raises:
+            IndexError: If the batch is empty
+        """
+        if not self._heap:
+            raise IndexError("pop from empty TaskBatch")
+        index = heapq.heappop(self._heap)[2]
+        row = (
+            self.ids[index],
+            self.types[index],
+            self.priorities[index],
+            self.created_ns[index],
+            self.payload_refs[index]
+        )
+        # Drop references so the payload can be collected, then reuse the slot
+        self.ids[index] = self.types[index] = self.payload_refs[index] = None
+        self._free.append(index)
+        return TaskView(self, index, row)
+    
+    def peek(self) -> Optional[TaskView]:
+        """Return the highest priority task without removing it."""
+        return TaskView(self, self._heap[0][2]) if self._heap else None
@@ -1,11 +1,19 @@
 """Document Orchestrator - Central coordination for multi-agent document creation."""
 
 import asyncio
+import copy
+import hashlib
+import itertools
+import json
 import logging
+from collections import OrderedDict
+from types import MappingProxyType
+from dataclasses import replace
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-import uuid
 
+from .models._common import _new_id
 from .models.document import Document, DocumentSection, DocumentStatus
 from .models.request import DocumentRequest
 from .models.task import Task, TaskResult
@@ -13,14 +21,52 @@ from .agents.research import ResearchAgent
 from .agents.writing import WritingAgent
 from .agents.editing import EditingAgent
 from .agents.verification import VerificationAgent
-from .coordination.workflow import WorkflowManager, Stage
+from .coordination.workflow import WorkflowManager, Workflow, Stage
 from .coordination.message_bus import MessageBus, Message, MessageType
 from .coordination.resource_manager import ResourceManager
 from .utils.config import OrchestratorConfig, AgentConfig, ModelConfig
+from .utils.llm_client import close_provider_clients
 from .storage.state_store import StateStore
+from .storage.redis_store import RedisStateStore
 
 logger = logging.getLogger(__name__)
 
+# Stage-to-status mapping, resolved once rather than on every transition
+_STAGE_STATUS = {
+    'research': DocumentStatus.RESEARCHING,
+    'writing': DocumentStatus.WRITING,
+    'editing': DocumentStatus.EDITING,
+    'verification': DocumentStatus.VERIFYING
+}
+_STATUS_PENDING = DocumentStatus.PENDING
+
+# Writing temperature added per speculative attempt, so attempts differ
+_ATTEMPT_TEMPERATURE_STEP = 0.1
+
+
+class _ResultBuilder:
+    """Collects the parts of the final document as workflow stages complete."""
+    
+    __slots__ = ("content", "quality_score")
+    
+    def __init__(self):
+        self.content = ''
+        self.quality_score = 0.0
+    
+    def add_stage(self, name: str, result: Dict[str, Any]):
+        """
+        Record the contribution of a completed stage.
+        
+        Args:
+            name: Stage name
+            result: Stage result data
+        """
+        if name == 'editing':
+            self.content = result.get('edited_content', '')
+        elif name == 'verification':
+            report = result.get('verification_report', {})
+            self.quality_score = report.get('overall_score', 0.0)
+
 
 class DocumentOrchestrator:
     """
@@ -50,6 +96,9 @@ class DocumentOrchestrator:
         >>> document = await orchestrator.create_document(request)
     """
     
+    _TASK_POOL_SIZE = 16
+    _RESULT_CACHE_SIZE = 128
+    
     def __init__(self, config: OrchestratorConfig):
         """
         Initialize the document orchestrator.
@@ -58,21 +107,55 @@ class DocumentOrchestrator:
             config: Orchestrator configuration
         """
         self.config = config
-        self.workflow_manager = WorkflowManager()
-        self.resource_manager = ResourceManager(config.max_agents)
-        self.message_bus = MessageBus()
-        self.state_store = StateStore()
+        self._pending_saves: Dict[str, asyncio.Future] = {}
+        self._task_pool: List[Task] = []
+        # Task ids only need to be unique within this orchestrator
+        self._task_prefix = _new_id()[:8]
+        self._task_counter = itertools.count()
+        self._result_cache: "OrderedDict[str, Document]" = OrderedDict()
+        self._task_builders = {
+            'research': self._build_research_task,
+            'writing': self._build_writing_task,
+            'editing': self._build_editing_task,
+            'verification': self._build_verification_task
+        }
         
         # Initialize agents
         self._init_agents()
         
         logger.info("DocumentOrchestrator initialized")
     
+    # Subsystems are built on first use, so orchestrators that are only
+    # inspected (e.g. for agent metrics) skip workflow compilation and
+    # creating the state directory.
+    
+    @cached_property
+    def workflow_manager(self) -> WorkflowManager:
+        """Workflow manager with the default workflows registered."""
+        return WorkflowManager()
+    
+    @cached_property
+    def resource_manager(self) -> ResourceManager:
+        """Resource manager sized to the configured agent and task limits."""
+        return ResourceManager(self.config.max_agents, self.config.max_concurrent_tasks)
+    
+    @cached_property
+    def message_bus(self) -> MessageBus:
+        """Message bus for stage notifications."""
+        return MessageBus()
+    
+    @cached_property
+    def state_store(self) -> StateStore:
+        """Document state storage for the configured backend."""
+        if self.config.storage_backend == 'redis':
+            if self.config.storage_flush_interval > 0:
+                logger.warning("storage_flush_interval is ignored by the redis backend")
+            return RedisStateStore(self.config.redis_url)
+        return StateStore(flush_interval=self.config.storage_flush_interval)
+    
     def _init_agents(self):
         """Initialize all specialized agents."""
         # Create default configs if not provided
-        default_model_config = ModelConfig(model="gpt-4", temperature=0.7)
-        
         research_config = self.config.research_config or AgentConfig(
             name="research",
             model_config=ModelConfig(model="gpt-4", temperature=0.3)
@@ -98,7 +181,7 @@ class DocumentOrchestrator:
             'verification': VerificationAgent(verification_config)
         }
         
-        logger.info(f"Initialized {len(self.agents)} agents")
+        logger.info("Initialized %s agents", len(self.agents))
     
     async def create_document(self, request: DocumentRequest) -> Document:
         """
@@ -124,12 +207,23 @@ class DocumentOrchestrator:
         # Validate request
         request.validate()
         
+        self._install_eager_task_factory()
+        
+        cache_key = None
+        if self.config.enable_caching:
+            cache_key = self._request_cache_key(request)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                logger.info("Returning cached document: %s", cached.id)
+                return self._copy_document(cached)
+        
         # Generate document ID
-        doc_id = str(uuid.uuid4())
+        doc_id = _new_id()
         
-        logger.info(f"Starting document creation: {doc_id}")
-        logger.info(f"Topic: {request.topic}")
-        logger.info(f"Type: {request.document_type}")
+        logger.info("Starting document creation: %s", doc_id)
+        logger.info("Topic: %s", request.topic)
+        logger.info("Type: %s", request.document_type)
         
         # Initialize document
         document = Document(
@@ -137,7 +231,7 @@ class DocumentOrchestrator:
             title=request.topic,
             sections=[],
             status=DocumentStatus.PENDING,
-            metadata={'request': request.__dict__}
+            metadata={'request': request.to_metadata_dict()}
         )
         
         # Save initial state
@@ -146,39 +240,173 @@ class DocumentOrchestrator:
         try:
             # Create and execute workflow
             workflow = self.workflow_manager.create_workflow(request)
+            self._check_agents(workflow)
             
-            # Execute workflow stages
-            workflow_result = await self._execute_workflow(workflow, request, document)
-            
-            # Update document from workflow result
-            document = await self._finalize_document(workflow_result, document)
+            # Execute workflow stages and build the document from the results
+            document = await self._run_workflow_attempts(workflow, request, document)
             
             # Final verification
             if document.quality_score < self.config.quality_threshold:
                 logger.warning(
-                    f"Document quality {document.quality_score} below threshold "
-                    f"{self.config.quality_threshold}. Consider refinement."
+                    "Document quality %s below threshold %s. Consider refinement.",
+                    document.quality_score, self.config.quality_threshold
                 )
             
             document.status = DocumentStatus.COMPLETE
             await self.state_store.save_document(document)
             
-            logger.info(f"Document creation completed: {doc_id}")
-            logger.info(f"Quality score: {document.quality_score}")
-            logger.info(f"Word count: {document.word_count}")
+            logger.info("Document creation completed: %s", doc_id)
+            logger.info("Quality score: %s", document.quality_score)
+            logger.info("Word count: %s", document.word_count)
+            
+            if cache_key is not None:
+                self._result_cache[cache_key] = self._copy_document(document)
+                if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
             
             return document
             
         except Exception as e:
-            logger.error(f"Document creation failed: {str(e)}")
+            logger.error("Document creation failed: %s", e)
             document.status = DocumentStatus.FAILED
             await self.state_store.save_document(document)
             raise RuntimeError(f"Failed to create document: {str(e)}")
     
+    @staticmethod
+    def _request_cache_key(request: DocumentRequest) -> str:
+        """
+        Digest of the request fields that determine the generated document.
+        
+        Args:
+            request: Document request
+            
+        Returns:
+            Hex digest identifying equivalent requests
+        """
+        fields = request.to_metadata_dict()
+        del fields['metadata']
+        payload = json.dumps(fields, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _copy_document(document: Document) -> Document:
+        """Copy a document so cached entries are not shared with callers."""
+        return replace(
+            document,
+            sections=[replace(s, metadata=copy.deepcopy(s.metadata)) for s in document.sections],
+            metadata=copy.deepcopy(document.metadata)
+        )
+    
+    def _check_agents(self, workflow: Workflow):
+        """
+        Ensure every stage in the workflow has an agent.
+        
+        Args:
+            workflow: Workflow about to run
+            
+        Raises:
+            ValueError: If a stage names an unknown agent type
+        """
+        for stage in workflow.stages:
+            if stage.agent_type not in self.agents:
+                raise ValueError(f"Unknown agent type: {stage.agent_type}")
+    
+    def _install_eager_task_factory(self):
+        """
+        Install asyncio's eager task factory on the running loop.
+        
+        Eager tasks start running synchronously when created, so stage
+        gathers that finish without suspending skip a loop round-trip.
+        Requires Python 3.12+; a factory already set on the loop is kept.
+        """
+        factory = getattr(asyncio, 'eager_task_factory', None)
+        if factory is None or not self.config.enable_eager_tasks:
+            return
+        
+        loop = asyncio.get_running_loop()
+        if loop.get_task_factory() is None:
+            loop.set_task_factory(factory)
+    
+    async def _run_workflow_attempts(self,
+                                     workflow: Workflow,
+                                     request: DocumentRequest,
+                                     document: Document) -> Document:
+        """
+        Run the workflow, optionally with speculative attempts in parallel.
+        
+        With ``speculative_iterations`` set, that many extra attempts run
+        concurrently on copies of the document, each drafting at a higher
+        writing temperature than the last. The first attempt to reach the
+        quality threshold wins and the others are cancelled; otherwise the
+        highest-scoring attempt is returned. Attempts do not save interim
+        statuses, since they share the document's ID; the stored document
+        stays pending until the winner is saved.
+        
+        Args:
+            workflow: Workflow to execute
+            request: Document request
+            document: Document being created
+            
+        Returns:
+            Finalized document
+            
+        Raises:
+            Exception: The last attempt failure if no attempt succeeded
+        """
+        attempts = 1 + max(0, self.config.speculative_iterations)
+        if attempts == 1:
+            workflow_result = await self._execute_workflow(workflow, request, document)
+            return await self._finalize_document(workflow_result, document)
+        
+        async def attempt(number: int) -> Document:
+            candidate = replace(document, sections=[], metadata=dict(document.metadata))
+            temperature = min(
+                1.0,
+                round(WritingAgent.SECTION_TEMPERATURE + number * _ATTEMPT_TEMPERATURE_STEP, 2)
+            )
+            workflow_result = await self._execute_workflow(
+                workflow, request, candidate,
+                save_status=False, writing_temperature=temperature
+            )
+            return await self._finalize_document(workflow_result, candidate)
+        
+        tasks = [asyncio.ensure_future(attempt(number)) for number in range(attempts)]
+        best = None
+        error = None
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    candidate = await next_done
+                except Exception as e:
+                    logger.warning("Speculative workflow attempt failed: %s", e)
+                    error = e
+                    continue
+                
+                if best is None or candidate.quality_score > best.quality_score:
+                    best, candidate = candidate, best
+                # Finished tasks keep their results alive until we return, so
+                # drop the losing draft's content now
+                if candidate is not None:
+                    candidate.sections.clear()
+                if best.quality_score >= self.config.quality_threshold:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled attempts finish their cleanup before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if best is None:
+            raise error
+        return best
+    
     async def _execute_workflow(self, 
-                               workflow: 'Workflow', 
+                               workflow: Workflow, 
                                request: DocumentRequest,
-                               document: Document) -> Dict[str, Any]:
+                               document: Document,
+                               save_status: bool = True,
+                               writing_temperature: Optional[float] = None) -> Dict[str, Any]:
         """
         Execute workflow stages.
         
@@ -186,22 +414,34 @@ class DocumentOrchestrator:
             workflow: Workflow to execute
             request: Document request
             document: Document being created
+            save_status: Whether to persist status changes as stages start
+            writing_temperature: Section drafting temperature, None for the
+                writing agent's default
             
         Returns:
             Workflow execution results
         """
+        builder = _ResultBuilder()
         workflow_context = {
             'request': request,
-            'document': document
+            'document': document,
+            'inputs': self._stage_inputs(request),
+            'result_builder': builder,
+            'writing_temperature': writing_temperature
         }
         
-        for stage in workflow.stages:
-            logger.info(f"Executing stage: {stage.name}")
+        # Interim status saves run in the background and are flushed below
+        saves = set()
+        
+        async def run_stage(stage: Stage):
+            logger.info("Executing stage: %s", stage.name)
             document.status = self._get_status_for_stage(stage.name)
-            await self.state_store.save_document(document)
+            if save_status:
+                saves.add(self._schedule_save(document))
             
             stage_result = await self._execute_stage(stage, workflow_context)
             workflow_context[stage.name] = stage_result
+            builder.add_stage(stage.name, stage_result)
             
             # Publish stage completion
             await self.message_bus.publish(Message(
@@ -212,8 +452,42 @@ class DocumentOrchestrator:
                 }
             ))
         
+        try:
+            await workflow.run(run_stage)
+        except BaseException:
+            await asyncio.gather(*saves, return_exceptions=True)
+            raise
+        await asyncio.gather(*saves)
+        
         return workflow_context
     
+    def _schedule_save(self, document: Document) -> asyncio.Future:
+        """
+        Schedule a status save, sharing one write among stages started together.
+        
+        Stages launched in the same parallel batch each update the document
+        status; the write is deferred by one loop tick so a single save
+        captures all of them. Stages do not wait for the write; the caller
+        awaits the returned future before the document is finalized.
+        
+        Args:
+            document: Document to save
+            
+        Returns:
+            Future completing once the status is written
+        """
+        pending = self._pending_saves.get(document.id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._deferred_save(document))
+            self._pending_saves[document.id] = pending
+        return pending
+    
+    async def _deferred_save(self, document: Document):
+        """Write a document after letting sibling stages update it."""
+        await asyncio.sleep(0)
+        self._pending_saves.pop(document.id, None)
+        await self.state_store.save_document(document, full=False)
+    
     async def _execute_stage(self, stage: Stage, context: Dict[str, Any]) -> Any:
         """
         Execute a single workflow stage.
@@ -225,97 +499,207 @@ class DocumentOrchestrator:
         Returns:
             Stage execution result
         """
-        agent_type = stage.agent_type
-        agent = self.agents.get(agent_type)
-        
-        if not agent:
-            raise ValueError(f"Unknown agent type: {agent_type}")
+        # Agent types were checked against self.agents when the workflow started
+        agent = self.agents[stage.agent_type]
         
         # Create task for agent
         task = self._create_task_for_stage(stage, context)
         
-        # Execute task
-        result = await agent.execute(task)
+        # Stream drafted sections onto the document while writing continues
+        drafts = None
+        if stage.name == 'writing':
+            queue = asyncio.Queue(maxsize=self.config.max_concurrent_tasks)
+            task.data['section_queue'] = queue
+            drafts = asyncio.ensure_future(self._collect_drafts(queue, context['document']))
+        
+        # Execute task, sharing task slots fairly between agent types
+        try:
+            async with self.resource_manager.task_slot(stage.agent_type):
+                result = await agent.execute(task)
+            if drafts is not None:
+                await queue.put(None)
+                await drafts
+        finally:
+            if drafts is not None and not drafts.done():
+                drafts.cancel()
+            self._release_task(task)
         
         if not result.success:
             raise RuntimeError(f"Stage {stage.name} failed: {result.error}")
         
         return result.data
     
-    def _create_task_for_stage(self, stage: Stage, context: Dict[str, Any]) -> Task:
+    async def _collect_drafts(self, queue: asyncio.Queue, document: Document):
         """
-        Create task for a workflow stage.
+        Consume drafted sections as the writing agent produces them.
+        
+        Each draft is placed on the document and announced on the message
+        bus. A section written again on retry replaces its earlier draft.
+        The drafts are superseded by the edited sections on finalization.
         
         Args:
-            stage: Workflow stage
-            context: Workflow context
-            
-        Returns:
-            Task for agent execution
+            queue: Queue of ``(index, section)`` pairs, ended by ``None``
+            document: Document being created
         """
-        request = context['request']
-        
-        if stage.name == 'research':
-            return Task(
-                id=str(uuid.uuid4()),
-                type='research',
-                data={
-                    'query': request.topic,
-                    'depth': 'deep',
-                    'requirements': request.requirements
-                }
-            )
-        
-        elif stage.name == 'writing':
-            research_data = context.get('research', {})
-            return Task(
-                id=str(uuid.uuid4()),
-                type='writing',
+        drafts: Dict[int, DocumentSection] = {}
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, section = item
+            
+            draft = drafts.get(index)
+            if draft is None:
+                draft = DocumentSection(
+                    title=section['section_title'],
+                    content=section['content'],
+                    order=index,
+                    metadata={'draft': True}
+                )
+                drafts[index] = draft
+                document.add_section(draft)
+            else:
+                draft.content = section['content']
+            
+            await self.message_bus.publish(Message(
+                type=MessageType.SECTION_DRAFTED,
                 data={
-                    'type': 'full',
-                    'research_brief': research_data.get('research_brief'),
-                    'requirements': {
-                        'document_type': request.document_type,
-                        'target_length': request.target_length,
-                        'style': request.style,
-                        'audience': request.audience
-                    }
+                    'section': draft.title,
+                    'order': index,
+                    'document_id': document.id
                 }
-            )
+            ))
+    
+    def _acquire_task(self, type: str, data: Dict[str, Any]) -> Task:
+        """
+        Get a task from the pool, or allocate one if the pool is empty.
         
-        elif stage.name == 'editing':
-            writing_data = context.get('writing', {})
-            sections = writing_data.get('sections', [])
-            full_content = "\n\n".join([s['content'] for s in sections])
+        Args:
+            type: Task type
+            data: Task data
             
-            return Task(
-                id=str(uuid.uuid4()),
-                type='editing',
-                data={
-                    'content': full_content,
-                    'style_guide': {'style': request.style}
-                }
-            )
+        Returns:
+            Task with a fresh ID and creation time
+        """
+        task_id = f"{self._task_prefix}-{next(self._task_counter)}"
+        if not self._task_pool:
+            return Task(id=task_id, type=type, data=data)
+        
+        task = self._task_pool.pop()
+        task.id = task_id
+        task.type = type
+        task.data = data
+        task.priority = 0
+        task.created_at = datetime.now()
+        task.assigned_to = None
+        return task
+    
+    def _release_task(self, task: Task):
+        """Return a finished task to the pool."""
+        if len(self._task_pool) < self._TASK_POOL_SIZE:
+            task.data = {}
+            self._task_pool.append(task)
+    
+    @staticmethod
+    def _stage_inputs(request: DocumentRequest) -> Dict[str, Any]:
+        """
+        Build the request-derived parts of stage payloads once per run.
         
-        elif stage.name == 'verification':
-            editing_data = context.get('editing', {})
-            research_data = context.get('research', {})
+        Values are read-only views shared by every task, so agents cannot
+        mutate the request through them.
+        
+        Args:
+            request: Document request
             
-            return Task(
-                id=str(uuid.uuid4()),
-                type='verification',
-                data={
-                    'document': editing_data.get('edited_content'),
-                    'requirements': {
-                        'target_length': request.target_length,
-                        'requirements': request.requirements
-                    },
-                    'research_brief': research_data.get('research_brief')
-                }
-            )
+        Returns:
+            Shared payload pieces keyed by name
+        """
+        requirements = tuple(request.requirements)
+        return {
+            'requirements': requirements,
+            'writing_requirements': MappingProxyType({
+                'document_type': request.document_type,
+                'target_length': request.target_length,
+                'style': request.style,
+                'audience': request.audience
+            }),
+            'style_guide': MappingProxyType({'style': request.style}),
+            'verification_requirements': MappingProxyType({
+                'target_length': request.target_length,
+                'requirements': requirements
+            })
+        }
+    
+    def _create_task_for_stage(self, stage: Stage, context: Dict[str, Any]) -> Task:
+        """
+        Create task for a workflow stage.
         
-        else:
+        Args:
+            stage: Workflow stage
+            context: Workflow context
+            
+        Returns:
+            Task for agent execution
+            
+        Raises:
+            ValueError: If no task builder exists for the stage
+        """
+        builder = self._task_builders.get(stage.name)
+        if builder is None:
             raise ValueError(f"Unknown stage: {stage.name}")
+        return builder(context)
+    
+    def _build_research_task(self, context: Dict[str, Any]) -> Task:
+        """Build the research task from the request topic."""
+        return self._acquire_task(
+            type='research',
+            data={
+                'query': context['request'].topic,
+                'depth': 'deep',
+                'requirements': context['inputs']['requirements']
+            }
+        )
+    
+    def _build_writing_task(self, context: Dict[str, Any]) -> Task:
+        """Build the writing task from the research brief or supplied outline."""
+        research_data = context.get('research', {})
+        data = {
+            'type': 'full',
+            'outline': context['request'].outline,
+            'research_brief': research_data.get('research_brief'),
+            'requirements': context['inputs']['writing_requirements']
+        }
+        if context.get('writing_temperature') is not None:
+            data['temperature'] = context['writing_temperature']
+        return self._acquire_task(type='writing', data=data)
+    
+    def _build_editing_task(self, context: Dict[str, Any]) -> Task:
+        """Build the editing task from the written sections."""
+        writing_data = context.get('writing', {})
+        sections = writing_data.get('sections', [])
+        full_content = "\n\n".join([s['content'] for s in sections])
+        
+        return self._acquire_task(
+            type='editing',
+            data={
+                'content': full_content,
+                'style_guide': context['inputs']['style_guide']
+            }
+        )
+    
+    def _build_verification_task(self, context: Dict[str, Any]) -> Task:
+        """Build the verification task from the edited content."""
+        editing_data = context.get('editing', {})
+        research_data = context.get('research', {})
+        
+        return self._acquire_task(
+            type='verification',
+            data={
+                'document': editing_data.get('edited_content'),
+                'requirements': context['inputs']['verification_requirements'],
+                'research_brief': research_data.get('research_brief')
+            }
+        )
     
     async def _finalize_document(self, 
                                 workflow_result: Dict[str, Any],
@@ -330,18 +714,10 @@ class DocumentOrchestrator:
         Returns:
             Finalized document
         """
-        # Extract final content
-        editing_data = workflow_result.get('editing', {})
-        final_content = editing_data.get('edited_content', '')
-        
-        # Create document sections
-        sections = self._split_into_sections(final_content)
-        document.sections = sections
-        
-        # Extract quality score
-        verification_data = workflow_result.get('verification', {})
-        verification_report = verification_data.get('verification_report', {})
-        document.quality_score = verification_report.get('overall_score', 0.0)
+        # Content and quality score were collected as the stages completed
+        builder = workflow_result['result_builder']
+        document.sections = self._split_into_sections(builder.content)
+        document.quality_score = builder.quality_score
         
         # Update word count
         document.update_word_count()
@@ -361,26 +737,27 @@ class DocumentOrchestrator:
         """
         # Simple section splitting based on headers
         # Can be made more sophisticated
-        sections = []
-        current_section = None
-        order = 0
-        
-        for line in content.split('\n'):
-            # Check if line is a header (starts with # or is all caps)
-            if line.startswith('#') or (line.isupper() and len(line) > 3):
-                if current_section:
-                    sections.append(current_section)
-                current_section = DocumentSection(
-                    title=line.strip('#').strip(),
-                    content='',
-                    order=order
-                )
-                order += 1
-            elif current_section:
-                current_section.content += line + '\n'
+        lines = content.split('\n')
+        
+        # Header lines start with # or are all caps
+        headers = [
+            i for i, line in enumerate(lines)
+            if line.startswith('#') or (line.isupper() and len(line) > 3)
+        ]
         
-        if current_section:
-            sections.append(current_section)
+        # Each section body is joined once rather than grown line by line;
+        # the trailing newline is joined in too instead of copying the body
+        ends = headers[1:] + [len(lines)]
+        sections = []
+        for order, (start, end) in enumerate(zip(headers, ends)):
+            body = lines[start + 1:end]
+            if body:
+                body.append('')
+            sections.append(DocumentSection(
+                title=lines[start].strip('#').strip(),
+                content='\n'.join(body),
+                order=order
+            ))
         
         # If no sections found, create single section
         if not sections:
@@ -394,13 +771,7 @@ class DocumentOrchestrator:
     
     def _get_status_for_stage(self, stage_name: str) -> DocumentStatus:
         """Map stage name to document status."""
-        status_map = {
-            'research': DocumentStatus.RESEARCHING,
-            'writing': DocumentStatus.WRITING,
-            'editing': DocumentStatus.EDITING,
-            'verification': DocumentStatus.VERIFYING
-        }
-        return status_map.get(stage_name, DocumentStatus.PENDING)
+        return _STAGE_STATUS.get(stage_name, _STATUS_PENDING)
     
     async def get_document(self, document_id: str) -> Optional[Document]:
         """
@@ -421,4 +792,14 @@ class DocumentOrchestrator:
         Returns:
             Dictionary of agent metrics
         """
-        return {name: agent.get_metrics() for name, agent in self.agents.items()}
\ No newline at end of file
+        return {name: agent.get_metrics() for name, agent in self.agents.items()}
+    
+    async def close(self):
+        """
+        Write any document saves still held by the state store and close
+        the provider connections shared on the running loop.
+        """
+        # Only close a store that was actually created
+        if 'state_store' in self.__dict__:
+            await self.state_store.close()
+        await close_provider_clients()
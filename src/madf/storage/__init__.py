@@ -1,5 +1,6 @@
 """Storage layer modules."""
 
 from .state_store import StateStore
+from .redis_store import RedisStateStore
 
-__all__ = ["StateStore"]
\ No newline at end of file
+__all__ = ["StateStore", "RedisStateStore"]
\ No newline at end of file
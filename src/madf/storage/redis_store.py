@@ -0,0 +1,116 @@
+"""Redis-backed state storage for document persistence."""
+
+import logging
+from typing import Optional, Any
+
+from ..models.document import Document
+from .state_store import StateStore, _dumps, _loads
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # optional, install with the "database" extra
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStateStore(StateStore):
+    """
+    State storage for documents backed by Redis.
+    
+    Each document is a Redis hash ``doc:{id}`` holding the encoded document
+    under ``body`` next to its ``status`` and ``updated_at`` fields, so
+    interim status transitions only write those two small fields.
+    Implements the same async interface as StateStore; saves are always
+    written immediately, so there is no ``flush_interval``.
+    """
+    
+    def __init__(self, url: str = "redis://localhost:6379/0", client: Any = None):
+        """
+        Initialize Redis state store.
+        
+        Args:
+            url: Redis connection URL
+            client: Existing ``redis.asyncio`` client to use instead of ``url``
+        
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        if client is None:
+            if aioredis is None:
+                raise ImportError(
+                    "RedisStateStore requires the redis package; "
+                    "install with: pip install multi-agent-document-framework[database]"
+                )
+            client = aioredis.from_url(url)
+        
+        self.client = client
+        logger.info("RedisStateStore initialized")
+    
+    @staticmethod
+    def _key(document_id: str) -> str:
+        """Redis key of a document hash."""
+        return f"doc:{document_id}"
+    
+    async def save_document(self, document: Document, *, full: bool = True):
+        """
+        Save document to Redis.
+        
+        A status-only save (``full=False``) sets just the ``status`` and
+        ``updated_at`` fields of the document hash.
+        
+        Args:
+            document: Document to save
+            full: Whether to write the complete document
+        """
+        mapping = {
+            'status': document.status.value_str,
+            'updated_at': document.updated_at.isoformat()
+        }
+        if full:
+            mapping['body'] = _dumps(self._document_to_dict(document))
+        
+        await self.client.hset(self._key(document.id), mapping=mapping)
+        logger.debug("Document %s %s", document.id, "saved" if full else "status saved")
+    
+    async def get_document(self, document_id: str) -> Optional[Document]:
+        """
+        Retrieve document from Redis.
+        
+        Args:
+            document_id: Document ID
+        
+        Returns:
+            Document if found, None otherwise
+        """
+        fields = await self.client.hgetall(self._key(document_id))
+        body = fields.get(b'body')
+        if body is None:
+            return None
+        
+        doc_dict = _loads(body)
+        doc_dict['status'] = fields[b'status'].decode()
+        doc_dict['updated_at'] = fields[b'updated_at'].decode()
+        
+        logger.debug("Document %s retrieved", document_id)
+        return self._dict_to_document(doc_dict)
+    
+    async def delete_document(self, document_id: str):
+        """
+        Delete document from Redis.
+        
+        Args:
+            document_id: Document ID
+        """
+        if await self.client.delete(self._key(document_id)):
+            logger.debug("Document %s deleted", document_id)
+    
+    async def flush(self):
+        """No-op; Redis saves are never held in memory."""
+    
+    async def close(self):
+        """Close the Redis connection."""
+        # redis-py 5 renamed close() to aclose()
+        close = getattr(self.client, 'aclose', None) or self.client.close
+        await close()
+
@@ -1,15 +1,87 @@
 """State storage for document persistence."""
 
+import asyncio
+import itertools
 import json
-from typing import Optional, Dict, Any
+import os
+import weakref
+from typing import Optional, Dict, Any, Set, Tuple
 from pathlib import Path
 import logging
 
 from ..models.document import Document, DocumentStatus, DocumentSection
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional, install with the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+# Suffixes for temporary files, unique within this process
+_tmp_counter = itertools.count()
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values the stdlib json module does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    return str(value)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """
+    Encode a dict as compact JSON bytes.
+    
+    orjson serializes dataclasses and datetimes natively; the stdlib
+    fallback converts them through _json_default.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(data, default=_json_default, separators=(',', ':')).encode()
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Decode JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+async def _run_io(func, *args):
+    """
+    Run blocking file I/O on the default executor.
+    
+    Uses run_in_executor directly rather than asyncio.to_thread, which
+    would also copy the caller's context for each call.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """
+    Write a file via a temporary sibling and an atomic rename.
+    
+    Each write uses its own temporary file, so concurrent writers (threads
+    or other processes) never share one; readers see either the old or
+    the new file, and the last rename wins.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{next(_tmp_counter)}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
 
 class StateStore:
     """
@@ -24,34 +96,129 @@ class StateStore:
     Can be extended to use databases (PostgreSQL, MongoDB, etc.)
     """
     
-    def __init__(self, storage_path: str = "./.madf_state"):
+    def __init__(self, storage_path: str = "./.madf_state", flush_interval: float = 0.0):
         """
         Initialize state store.
         
         Args:
             storage_path: Path for state storage
+            flush_interval: Seconds to hold saves in memory before writing
+                them (0 writes immediately)
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"StateStore initialized at {self.storage_path}")
+        self.flush_interval = flush_interval
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._dirty: Dict[str, Tuple[Document, bool]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Future] = set()
+        logger.info("StateStore initialized at %s", self.storage_path)
     
-    async def save_document(self, document: Document):
+    def _lock(self, document_id: str) -> asyncio.Lock:
+        """
+        Lock serializing writes to one document.
+        
+        Keeps a status save from landing after a later full save (and
+        leaving a stale sidecar). Locks are dropped once no writer holds them.
+        """
+        lock = self._locks.get(document_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[document_id] = lock
+        return lock
+    
+    async def save_document(self, document: Document, *, full: bool = True):
         """
         Save document to storage.
         
+        A status-only save (``full=False``) writes a small sidecar holding
+        just the status, for interim stage transitions; the next full save
+        supersedes it. Encoding and file I/O run off the event loop, and
+        writes to the same document are applied in call order.
+        
+        With a ``flush_interval``, the save is only recorded and returns
+        at once; repeated saves of a document within the interval are
+        written once, from its state at flush time.
+        
         Args:
             document: Document to save
+            full: Whether to write the complete document
         """
-        doc_path = self.storage_path / f"{document.id}.json"
+        if self.flush_interval > 0:
+            pending = self._dirty.get(document.id)
+            self._dirty[document.id] = (document, full or (pending is not None and pending[1]))
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.flush_interval, self._start_flush
+                )
+            return
+        
+        await self._write(document, full)
+    
+    async def flush(self):
+        """Write every save still held in memory."""
+        dirty, self._dirty = self._dirty, {}
+        await asyncio.gather(*(
+            self._write(document, full) for document, full in dirty.values()
+        ))
+    
+    async def close(self):
+        """Cancel the scheduled flush and write everything still pending."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+    
+    def _start_flush(self):
+        """Start a background flush once the interval has elapsed."""
+        self._flush_handle = None
+        flush = asyncio.ensure_future(self.flush())
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flush_done)
+    
+    def _flush_done(self, flush: asyncio.Future):
+        """Forget a finished background flush, logging any failure."""
+        self._flushes.discard(flush)
+        if not flush.cancelled() and flush.exception() is not None:
+            logger.error("Background flush failed: %s", flush.exception())
+    
+    async def _flush_document(self, document_id: str):
+        """Write a single document's held save, if any."""
+        pending = self._dirty.pop(document_id, None)
+        if pending is not None:
+            await self._write(*pending)
+    
+    async def _write(self, document: Document, full: bool):
+        """Write a document or its status sidecar now."""
+        if not full:
+            status = _dumps({
+                'status': document.status.value_str,
+                'updated_at': document.updated_at.isoformat()
+            })
+            async with self._lock(document.id):
+                await _run_io(_write_atomic, self._status_path(document.id), status)
+            logger.debug("Document %s status saved", document.id)
+            return
         
         # Convert document to dict
         doc_dict = self._document_to_dict(document)
         
-        # Write to file
-        with open(doc_path, 'w') as f:
-            json.dump(doc_dict, f, indent=2, default=str)
+        async with self._lock(document.id):
+            await _run_io(self._write_full, document.id, doc_dict)
+        logger.debug("Document %s saved", document.id)
+    
+    def _write_full(self, document_id: str, doc_dict: Dict[str, Any]):
+        """Encode and write a full document, dropping any status sidecar."""
+        _write_atomic(self.storage_path / f"{document_id}.json", _dumps(doc_dict))
         
-        logger.debug(f"Document {document.id} saved")
+        status_path = self._status_path(document_id)
+        if status_path.exists():
+            status_path.unlink()
+    
+    def _status_path(self, document_id: str) -> Path:
+        """Path of the status sidecar for a document."""
+        return self.storage_path / f"{document_id}.status.json"
     
     async def get_document(self, document_id: str) -> Optional[Document]:
         """
@@ -63,19 +230,15 @@ class StateStore:
         Returns:
             Document if found, None otherwise
         """
-        doc_path = self.storage_path / f"{document_id}.json"
-        
-        if not doc_path.exists():
+        await self._flush_document(document_id)
+        doc_dict = await _run_io(self._read, document_id)
+        if doc_dict is None:
             return None
         
-        # Read from file
-        with open(doc_path, 'r') as f:
-            doc_dict = json.load(f)
-        
         # Convert dict to document
         document = self._dict_to_document(doc_dict)
         
-        logger.debug(f"Document {document_id} retrieved")
+        logger.debug("Document %s retrieved", document_id)
         return document
     
     async def delete_document(self, document_id: str):
@@ -85,11 +248,36 @@ class StateStore:
         Args:
             document_id: Document ID
         """
+        self._dirty.pop(document_id, None)
+        async with self._lock(document_id):
+            deleted = await _run_io(self._delete, document_id)
+        if deleted:
+            logger.debug("Document %s deleted", document_id)
+    
+    def _read(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """Read a stored document, applying any newer interim status."""
         doc_path = self.storage_path / f"{document_id}.json"
         
-        if doc_path.exists():
-            doc_path.unlink()
-            logger.debug(f"Document {document_id} deleted")
+        if not doc_path.exists():
+            return None
+        
+        doc_dict = _loads(doc_path.read_bytes())
+        status_path = self._status_path(document_id)
+        if status_path.exists():
+            doc_dict.update(_loads(status_path.read_bytes()))
+        return doc_dict
+    
+    def _delete(self, document_id: str) -> bool:
+        """Remove a document and its status sidecar; True if the document existed."""
+        status_path = self._status_path(document_id)
+        if status_path.exists():
+            status_path.unlink()
+        
+        doc_path = self.storage_path / f"{document_id}.json"
+        if not doc_path.exists():
+            return False
+        doc_path.unlink()
+        return True
     
     def _document_to_dict(self, document: Document) -> Dict[str, Any]:
         """
@@ -99,25 +287,19 @@ class StateStore:
             document: Document to convert
             
         Returns:
-            Dictionary representation
+            Dictionary representation, with sections and timestamps
+            left as objects for the JSON encoder
         """
+        # Sections and timestamps are left as objects for the encoder
         return {
             'id': document.id,
             'title': document.title,
-            'sections': [
-                {
-                    'title': s.title,
-                    'content': s.content,
-                    'order': s.order,
-                    'metadata': s.metadata
-                }
-                for s in document.sections
-            ],
-            'status': document.status.value,
+            'sections': list(document.sections),
+            'status': document.status.value_str,
             'quality_score': document.quality_score,
             'word_count': document.word_count,
-            'created_at': document.created_at.isoformat(),
-            'updated_at': document.updated_at.isoformat(),
+            'created_at': document.created_at,
+            'updated_at': document.updated_at,
             'metadata': document.metadata
         }
     
@@ -145,7 +327,7 @@ class StateStore:
             id=doc_dict['id'],
             title=doc_dict['title'],
             sections=sections,
-            status=DocumentStatus(doc_dict['status']),
+            status=DocumentStatus.from_str(doc_dict['status']),
             quality_score=doc_dict.get('quality_score', 0.0),
             word_count=doc_dict.get('word_count', 0),
             created_at=datetime.fromisoformat(doc_dict['created_at']),
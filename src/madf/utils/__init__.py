@@ -2,6 +2,7 @@
 
 from .config import OrchestratorConfig, AgentConfig, ModelConfig
 from .llm_client import LLMClient
+from .rate_limiter import AsyncRateLimiter
 from .logging import setup_logging
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "AgentConfig",
     "ModelConfig",
     "LLMClient",
+    "AsyncRateLimiter",
     "setup_logging",
 ]
\ No newline at end of file
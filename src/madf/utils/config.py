@@ -1,13 +1,66 @@
 """Configuration management."""
 
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import os
 import yaml
 from pathlib import Path
 
+from ..models._common import _SLOTS
 
-@dataclass
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, cached by path and file version.
+    
+    ``mtime_ns`` and ``size`` are part of the cache key only, so an edited
+    file is parsed again. The result is shared by later calls; use
+    _load_yaml for a copy.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _load_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parsed YAML file as a copy the caller may modify."""
+    return copy.deepcopy(_parse_yaml(path, mtime_ns, size))
+
+
+# API keys found in the environment, by provider
+_API_KEYS: Dict[str, str] = {}
+
+
+def _get_api_key(provider: str) -> Optional[str]:
+    """
+    Look up a provider's API key from the environment.
+    
+    Keys that are found are cached, so building many configs reads the
+    environment once per provider. Missing keys are not cached, so a key
+    exported later is still picked up.
+    
+    Args:
+        provider: LLM provider name
+        
+    Returns:
+        API key, or None if the variable is not set
+    """
+    api_key = _API_KEYS.get(provider)
+    if api_key is None:
+        api_key = os.getenv(f"{provider.upper()}_API_KEY")
+        if api_key:
+            _API_KEYS[provider] = api_key
+    return api_key
+
+
+@dataclass(**_SLOTS)
 class ModelConfig:
     """
     LLM model configuration.
@@ -28,13 +81,13 @@ class ModelConfig:
     def __post_init__(self):
         """Load API key from environment if not provided."""
         if not self.api_key:
-            env_var = f"{self.provider.upper()}_API_KEY"
-            self.api_key = os.getenv(env_var)
+            self.api_key = _get_api_key(self.provider)
             if not self.api_key:
+                env_var = f"{self.provider.upper()}_API_KEY"
                 raise ValueError(f"API key not found. Set {env_var} environment variable.")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentConfig:
     """
     Individual agent configuration.
@@ -53,7 +106,7 @@ class AgentConfig:
     cache_enabled: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OrchestratorConfig:
     """
     Orchestrator configuration.
@@ -65,6 +118,13 @@ class OrchestratorConfig:
         enable_parallel: Enable parallel processing
         max_concurrent_tasks: Maximum concurrent tasks
         retry_attempts: Retry attempts for failed operations
+        enable_eager_tasks: Run new tasks eagerly on Python 3.12+
+        speculative_iterations: Extra workflow attempts run concurrently
+        enable_caching: Reuse documents for repeated identical requests
+        storage_backend: Document storage backend ('file' or 'redis')
+        redis_url: Redis connection URL for the 'redis' backend
+        storage_flush_interval: Seconds the file backend holds saves before
+            writing them (0 writes immediately)
         research_config: Research agent configuration
         writing_config: Writing agent configuration
         editing_config: Editing agent configuration
@@ -76,6 +136,12 @@ class OrchestratorConfig:
     enable_parallel: bool = True
     max_concurrent_tasks: int = 5
     retry_attempts: int = 3
+    enable_eager_tasks: bool = True
+    speculative_iterations: int = 0
+    enable_caching: bool = False
+    storage_backend: str = "file"
+    redis_url: str = "redis://localhost:6379/0"
+    storage_flush_interval: float = 0.0
     
     # Agent-specific configs
     research_config: Optional[AgentConfig] = None
@@ -88,14 +154,17 @@ class OrchestratorConfig:
         """
         Load configuration from YAML file.
         
+        Parsed files are cached until their modification time or size
+        changes.
+        
         Args:
             path: Path to YAML configuration file
             
         Returns:
             OrchestratorConfig instance
         """
-        with open(path, 'r') as f:
-            config_dict = yaml.safe_load(f)
+        stat = os.stat(path)
+        config_dict = _load_yaml(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
         return cls.from_dict(config_dict)
     
     @classmethod
@@ -138,6 +207,12 @@ class OrchestratorConfig:
             enable_parallel=orch_params.get('enable_parallel', True),
             max_concurrent_tasks=orch_params.get('max_concurrent_tasks', 5),
             retry_attempts=orch_params.get('retry_attempts', 3),
+            enable_eager_tasks=orch_params.get('enable_eager_tasks', True),
+            speculative_iterations=orch_params.get('speculative_iterations', 0),
+            enable_caching=orch_params.get('enable_caching', False),
+            storage_backend=orch_params.get('storage_backend', 'file'),
+            redis_url=orch_params.get('redis_url', 'redis://localhost:6379/0'),
+            storage_flush_interval=orch_params.get('storage_flush_interval', 0.0),
             research_config=research_config,
             writing_config=writing_config,
             editing_config=editing_config,
@@ -187,7 +262,13 @@ class OrchestratorConfig:
                 'quality_threshold': self.quality_threshold,
                 'enable_parallel': self.enable_parallel,
                 'max_concurrent_tasks': self.max_concurrent_tasks,
-                'retry_attempts': self.retry_attempts
+                'retry_attempts': self.retry_attempts,
+                'enable_eager_tasks': self.enable_eager_tasks,
+                'speculative_iterations': self.speculative_iterations,
+                'enable_caching': self.enable_caching,
+                'storage_backend': self.storage_backend,
+                'redis_url': self.redis_url,
+                'storage_flush_interval': self.storage_flush_interval
             },
             'agents': {
                 'research': self._agent_config_to_dict(self.research_config),
@@ -2,11 +2,182 @@
 
 import openai
 import asyncio
-from typing import List, Dict, Optional, Any
+import hashlib
+import json
+import re
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Optional, Any, Tuple
 import tiktoken
 import os
 
 from .config import ModelConfig
+from .rate_limiter import get_rate_limiter
+
+try:
+    import jsonschema
+except ImportError:  # optional, structured output is then parsed but not validated
+    jsonschema = None
+
+
+# Token counts by (encoding name, text digest), shared by all clients
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+
+# Line starts that begin a new pre-tokenizer piece, so splitting there
+# does not change the token count
+_CHUNK_BOUNDARY = re.compile(r'\n(?=\S)')
+_PARAGRAPH_BOUNDARY = re.compile(r'\n\n(?=\S)')
+
+# Texts longer than this are counted paragraph by paragraph
+_PARAGRAPH_COUNT_MIN_CHARS = 2048
+
+
+def _split_paragraphs(text: str) -> List[str]:
+    """Split text after each blank line that precedes a non-blank line."""
+    chunks = []
+    start = 0
+    for match in _PARAGRAPH_BOUNDARY.finditer(text):
+        chunks.append(text[start:match.end()])
+        start = match.end()
+    chunks.append(text[start:])
+    return chunks
+
+
+@lru_cache(maxsize=32)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """
+    Tokenizer for a model, shared by every client using that model.
+    
+    Args:
+        model: Model name
+        
+    Returns:
+        Model encoding, or cl100k_base for models tiktoken does not know
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=128)
+def _base_messages(system_message: Optional[str]) -> Tuple[Dict[str, str], ...]:
+    """
+    Leading chat messages for a system message, built once per prompt.
+    
+    Agents pass a fixed system message per call site, so the message
+    dicts are shared rather than rebuilt on every request. Callers must
+    not mutate them.
+    
+    Args:
+        system_message: Optional system message
+        
+    Returns:
+        Tuple of zero or one system message dicts
+    """
+    if not system_message:
+        return ()
+    return ({"role": "system", "content": system_message},)
+
+
+@lru_cache(maxsize=256)
+def _get_validator(schema_key: str) -> Any:
+    """
+    Compiled validator for a JSON schema, shared by every client.
+    
+    Args:
+        schema_key: Canonical JSON encoding of the schema (sorted keys,
+            compact separators), so equal schemas share one validator
+        
+    Returns:
+        Validator for the schema's declared draft (2020-12 if undeclared),
+        or None if jsonschema is not installed
+    """
+    if jsonschema is None:
+        return None
+    schema = json.loads(schema_key)
+    cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft202012Validator)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+# Batch API polling: first interval, doubling up to the maximum
+_BATCH_POLL_INTERVAL = 5.0
+_BATCH_POLL_MAX_INTERVAL = 60.0
+_OPENAI_BATCH_DONE = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Connection limits for the HTTP pool shared by all provider clients
+_MAX_CONNECTIONS = 2000
+_MAX_KEEPALIVE_CONNECTIONS = 1500
+_HTTP_TIMEOUT = 120.0
+
+# Provider SDK clients by (provider, api_key), per event loop: pooled
+# connections cannot be reused once the loop that opened them is closed
+_provider_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _provider_client(provider: str, api_key: Optional[str]) -> Any:
+    """
+    Shared SDK client for a provider and API key on the running loop.
+    
+    All clients on a loop share one httpx connection pool, sized for
+    many concurrent agent requests.
+    
+    Args:
+        provider: 'openai' or 'anthropic'
+        api_key: Provider API key
+        
+    Returns:
+        AsyncOpenAI or AsyncAnthropic client
+    """
+    clients = _provider_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((provider, api_key))
+    if client is not None:
+        return client
+    
+    import httpx  # installed with the provider SDKs
+    http_client = clients.get(('http', None))
+    if http_client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=_HTTP_TIMEOUT
+        )
+        clients[('http', None)] = http_client
+    
+    if provider == "openai":
+        client = openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+    else:
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError("anthropic package required for Anthropic provider")
+        client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+    
+    clients[(provider, api_key)] = client
+    return client
+
+
+async def close_provider_clients():
+    """
+    Close the shared provider clients and connection pool of the running loop.
+    
+    The pooled connections reference the loop, so its clients are only
+    released once closed here. Clients are recreated on next use.
+    """
+    clients = _provider_clients.pop(asyncio.get_running_loop(), None)
+    if clients is None:
+        return
+    # SDK clients hold no resources of their own beyond the shared pool
+    http_client = clients.get(('http', None))
+    if http_client is not None:
+        await http_client.aclose()
 
 
 class LLMClient:
@@ -30,13 +201,24 @@ class LLMClient:
         self.provider = config.provider
         self.model = config.model
         
+        # Prompt plus completion budget of every request, for cost accounting
+        self.estimated_tokens = 0
+        
+        # Provider-specific implementations, resolved once
+        self._generate = {
+            "openai": self._openai_generate,
+            "anthropic": self._anthropic_generate,
+        }.get(self.provider)
+        self._stream = {
+            "openai": self._openai_stream,
+            "anthropic": self._anthropic_stream,
+        }.get(self.provider)
+        
         if self.provider == "openai":
-            openai.api_key = config.api_key
-            try:
-                self.encoding = tiktoken.encoding_for_model(self.model)
-            except:
-                # Fallback encoding
-                self.encoding = tiktoken.get_encoding("cl100k_base")
+            self.encoding = _get_encoding(self.model)
+            # The Rust encoder behind tiktoken's Python wrapper, when exposed
+            core_bpe = getattr(self.encoding, "_core_bpe", None)
+            self._encode_ordinary = getattr(core_bpe, "encode_ordinary", None) or self.encoding.encode_ordinary
     
     async def generate(self, 
                       prompt: str, 
@@ -46,6 +228,9 @@ class LLMClient:
         """
         Generate text from prompt.
         
+        Requests are admitted through the provider's shared rate limiter,
+        budgeted by the prompt size plus ``max_tokens``.
+        
         Args:
             prompt: User prompt
             system_message: Optional system message
@@ -58,12 +243,27 @@ class LLMClient:
         temp = temperature if temperature is not None else self.config.temperature
         max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
         
-        if self.provider == "openai":
-            return await self._openai_generate(prompt, system_message, temp, max_tok)
-        elif self.provider == "anthropic":
-            return await self._anthropic_generate(prompt, system_message, temp, max_tok)
-        else:
+        generate = self._generate
+        if generate is None:
             raise ValueError(f"Unsupported provider: {self.provider}")
+        
+        estimated_tokens = self._estimate_tokens(prompt, system_message, max_tok)
+        limiter = get_rate_limiter(self.provider, self.config.api_key)
+        async with limiter.acquire(estimated_tokens):
+            return await generate(prompt, system_message, temp, max_tok)
+    
+    def _estimate_tokens(self, prompt: str, system_message: Optional[str], max_tokens: int) -> int:
+        """
+        Token budget of a request: prompt and system message plus ``max_tokens``.
+        
+        The estimate gates the rate limiter and is added to
+        ``estimated_tokens``.
+        """
+        tokens = self.count_tokens(prompt) + max_tokens
+        if system_message:
+            tokens += self.count_tokens(system_message)
+        self.estimated_tokens += tokens
+        return tokens
     
     async def _openai_generate(self, prompt: str, system_message: Optional[str],
                               temperature: float, max_tokens: int) -> str:
@@ -79,14 +279,10 @@ class LLMClient:
         Returns:
             Generated text
         """
-        messages = []
+        messages = [*_base_messages(system_message), {"role": "user", "content": prompt}]
         
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        
-        messages.append({"role": "user", "content": prompt})
-        
-        response = await openai.ChatCompletion.acreate(
+        client = _provider_client("openai", self.config.api_key)
+        response = await client.chat.completions.create(
             model=self.model,
             messages=messages,
             temperature=temperature,
@@ -109,12 +305,7 @@ class LLMClient:
         Returns:
             Generated text
         """
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError("anthropic package required for Anthropic provider")
-        
-        client = anthropic.AsyncAnthropic(api_key=self.config.api_key)
+        client = _provider_client("anthropic", self.config.api_key)
         
         full_prompt = f"{system_message}\n\n{prompt}" if system_message else prompt
         
@@ -127,10 +318,215 @@ class LLMClient:
         
         return response.content[0].text
     
+    async def generate_stream(self,
+                              prompt: str,
+                              system_message: Optional[str] = None,
+                              temperature: Optional[float] = None,
+                              max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        Generate text from prompt, yielding it as it arrives.
+        
+        Holds a rate limiter slot until the stream ends, so consume it
+        fully or close it (e.g. with ``contextlib.aclosing``).
+        
+        Args:
+            prompt: User prompt
+            system_message: Optional system message
+            temperature: Sampling temperature (overrides config)
+            max_tokens: Max tokens (overrides config)
+            
+        Yields:
+            Generated text fragments
+        
+        Example:
+            >>> async for text in client.generate_stream("Summarize ..."):
+            ...     print(text, end="")
+        """
+        temp = temperature if temperature is not None else self.config.temperature
+        max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
+        
+        stream = self._stream
+        if stream is None:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+        
+        estimated_tokens = self._estimate_tokens(prompt, system_message, max_tok)
+        limiter = get_rate_limiter(self.provider, self.config.api_key)
+        async with limiter.acquire(estimated_tokens):
+            async for text in stream(prompt, system_message, temp, max_tok):
+                yield text
+    
+    async def _openai_stream(self, prompt: str, system_message: Optional[str],
+                             temperature: float, max_tokens: int) -> AsyncIterator[str]:
+        """Stream completion text deltas from OpenAI."""
+        messages = [*_base_messages(system_message), {"role": "user", "content": prompt}]
+        
+        client = _provider_client("openai", self.config.api_key)
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    async def _anthropic_stream(self, prompt: str, system_message: Optional[str],
+                                temperature: float, max_tokens: int) -> AsyncIterator[str]:
+        """Stream completion text deltas from Anthropic."""
+        client = _provider_client("anthropic", self.config.api_key)
+        
+        full_prompt = f"{system_message}\n\n{prompt}" if system_message else prompt
+        
+        response = await client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": full_prompt}],
+            stream=True
+        )
+        
+        async for event in response:
+            if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                yield event.delta.text
+    
+    async def generate_batch(self,
+                             prompts: List[str],
+                             system_message: Optional[str] = None,
+                             temperature: Optional[float] = None,
+                             max_tokens: Optional[int] = None) -> List[str]:
+        """
+        Generate text for many prompts through the provider's batch API.
+        
+        Intended for offline pipelines: batches are billed at a discount
+        but may take up to 24 hours. The call polls until the batch ends.
+        
+        Args:
+            prompts: User prompts
+            system_message: Optional system message for every prompt
+            temperature: Sampling temperature (overrides config)
+            max_tokens: Max tokens (overrides config)
+            
+        Returns:
+            Generated texts, in prompt order
+            
+        Raises:
+            RuntimeError: If the batch or any of its requests fails
+        """
+        if not prompts:
+            return []
+        
+        temp = temperature if temperature is not None else self.config.temperature
+        max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
+        
+        if self.provider == "openai":
+            results = await self._openai_batch(prompts, system_message, temp, max_tok)
+        elif self.provider == "anthropic":
+            results = await self._anthropic_batch(prompts, system_message, temp, max_tok)
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+        
+        missing = [i for i, text in enumerate(results) if text is None]
+        if missing:
+            raise RuntimeError(f"Batch requests failed: {missing}")
+        return results
+    
+    async def _openai_batch(self, prompts: List[str], system_message: Optional[str],
+                            temperature: float, max_tokens: int) -> List[Optional[str]]:
+        """Submit prompts as an OpenAI batch and collect the completions."""
+        client = _provider_client("openai", self.config.api_key)
+        
+        system = _base_messages(system_message)
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [*system, {"role": "user", "content": prompt}],
+                    "temperature": temperature,
+                    "max_tokens": max_tokens
+                }
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        
+        input_file = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        interval = _BATCH_POLL_INTERVAL
+        while batch.status not in _OPENAI_BATCH_DONE:
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, _BATCH_POLL_MAX_INTERVAL)
+            batch = await client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} {batch.status}")
+        
+        results: List[Optional[str]] = [None] * len(prompts)
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    choice = response["body"]["choices"][0]
+                    results[int(record["custom_id"])] = choice["message"]["content"]
+        return results
+    
+    async def _anthropic_batch(self, prompts: List[str], system_message: Optional[str],
+                               temperature: float, max_tokens: int) -> List[Optional[str]]:
+        """Submit prompts as an Anthropic message batch and collect the replies."""
+        client = _provider_client("anthropic", self.config.api_key)
+        
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": self.model,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "messages": [{
+                        "role": "user",
+                        "content": f"{system_message}\n\n{prompt}" if system_message else prompt
+                    }]
+                }
+            }
+            for i, prompt in enumerate(prompts)
+        ]
+        batch = await client.messages.batches.create(requests=requests)
+        
+        interval = _BATCH_POLL_INTERVAL
+        while batch.processing_status != "ended":
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, _BATCH_POLL_MAX_INTERVAL)
+            batch = await client.messages.batches.retrieve(batch.id)
+        
+        results: List[Optional[str]] = [None] * len(prompts)
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[int(entry.custom_id)] = entry.result.message.content[0].text
+        return results
+    
     def count_tokens(self, text: str) -> int:
         """
         Count tokens in text.
         
+        OpenAI counts are cached by a digest of the text, so repeated
+        prompts are not re-encoded. Long texts are counted and cached per
+        paragraph, so a prompt that extends an earlier one (a system
+        prompt plus prior turns) only encodes its new paragraphs.
+        
         Args:
             text: Text to count
             
@@ -138,25 +534,124 @@ class LLMClient:
             Token count
         """
         if self.provider == "openai":
-            return len(self.encoding.encode(text))
+            if len(text) > _PARAGRAPH_COUNT_MIN_CHARS:
+                return sum(map(self._count_cached, _split_paragraphs(text)))
+            return self._count_cached(text)
         # Rough estimate for other providers
         return len(text.split())
     
+    def _count_cached(self, text: str) -> int:
+        """Count tokens with the shared digest-keyed cache."""
+        key = (self.encoding.name, hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        count = _token_counts.get(key)
+        if count is not None:
+            _token_counts.move_to_end(key)
+            return count
+        
+        # encode_ordinary skips the special-token scan; counting needs no
+        # special-token handling, and text containing one no longer raises
+        try:
+            count = len(self._encode_ordinary(text))
+        except UnicodeEncodeError:
+            # Lone surrogates; the wrapper replaces them before encoding
+            count = len(self.encoding.encode_ordinary(text))
+        _token_counts[key] = count
+        if len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+        return count
+    
+    def count_tokens_parallel(self, text: str, chunk_chars: int = 8000) -> int:
+        """
+        Count tokens in a long text using several threads.
+        
+        The text is split at line starts near every ``chunk_chars``
+        characters and the chunks are encoded concurrently by tiktoken,
+        which releases the GIL. Short texts and non-OpenAI providers use
+        ``count_tokens``.
+        
+        Args:
+            text: Text to count
+            chunk_chars: Approximate chunk size in characters
+            
+        Returns:
+            Token count
+        """
+        if self.provider != "openai" or len(text) <= chunk_chars:
+            return self.count_tokens(text)
+        
+        chunks = []
+        start = 0
+        while start < len(text):
+            boundary = _CHUNK_BOUNDARY.search(text, start + chunk_chars)
+            end = boundary.end() if boundary else len(text)
+            chunks.append(text[start:end])
+            start = end
+        
+        tokens = self.encoding.encode_ordinary_batch(chunks, num_threads=os.cpu_count() or 1)
+        return sum(map(len, tokens))
+    
     async def generate_structured(self, 
                                  prompt: str,
                                  schema: Dict,
-                                 **kwargs) -> Dict:
+                                 system_message: Optional[str] = None,
+                                 temperature: Optional[float] = None,
+                                 max_tokens: Optional[int] = None) -> Dict:
         """
         Generate structured output matching schema.
         
+        OpenAI requests use JSON-schema response format; other providers
+        are asked for JSON in the prompt. The parsed output is validated
+        against the schema when jsonschema is installed.
+        
         Args:
             prompt: Generation prompt
             schema: JSON schema for output
-            **kwargs: Additional generation parameters
+            system_message: Optional system message
+            temperature: Sampling temperature (overrides config)
+            max_tokens: Max tokens (overrides config)
             
         Returns:
             Structured output
+        
+        Raises:
+            ValueError: If the output is not valid JSON
+            jsonschema.ValidationError: If the output does not match schema
         """
-        # Implementation would use function calling or JSON mode
-        # For now, return placeholder
-        return {}
\ No newline at end of file
+        schema_key = json.dumps(schema, sort_keys=True, separators=(',', ':'))
+        
+        if self.provider == "openai":
+            temp = temperature if temperature is not None else self.config.temperature
+            max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
+            
+            messages = [*_base_messages(system_message), {"role": "user", "content": prompt}]
+            
+            estimated_tokens = self._estimate_tokens(f"{prompt}\n{schema_key}", system_message, max_tok)
+            client = _provider_client("openai", self.config.api_key)
+            limiter = get_rate_limiter(self.provider, self.config.api_key)
+            async with limiter.acquire(estimated_tokens):
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temp,
+                    max_tokens=max_tok,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {"name": schema.get("title", "response"), "schema": schema}
+                    }
+                )
+            text = response.choices[0].message.content
+        else:
+            text = await self.generate(
+                f"{prompt}\n\nRespond with only a JSON value matching this schema:\n{schema_key}",
+                system_message=system_message,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        
+        result = json.loads(text)
+        
+        validator = _get_validator(schema_key)
+        if validator is not None:
+            validator.validate(result)
+        
+        return result
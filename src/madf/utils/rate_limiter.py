@@ -0,0 +1,167 @@
+"""Client-side rate limiting for LLM provider APIs."""
+
+import asyncio
+import hashlib
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ProviderProfile:
+    """
+    Default rate limits for a provider.
+    
+    Attributes:
+        rpm: Requests per minute
+        tpm: Tokens per minute
+        max_concurrency: Upper bound for in-flight requests
+    """
+    rpm: int
+    tpm: int
+    max_concurrency: int = 16
+
+
+PROVIDER_PROFILES: Dict[str, ProviderProfile] = {
+    'openai': ProviderProfile(rpm=60, tpm=150_000, max_concurrency=10),
+    'anthropic': ProviderProfile(rpm=50, tpm=80_000, max_concurrency=5),
+}
+
+_WINDOW_SECONDS = 60.0
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """Whether an SDK error is an HTTP 429 response."""
+    return getattr(error, 'status_code', None) == 429
+
+
+class AsyncRateLimiter:
+    """
+    Request and token budget with adaptive concurrency.
+    
+    Admits a request only while the sliding one-minute window has room
+    for it under both ``rpm`` and ``tpm``. Concurrency is tuned AIMD-style:
+    each success raises the in-flight limit by ``increase / limit`` (about
+    one slot per round of requests), and each 429 multiplies it by
+    ``decrease``.
+    
+    Example:
+        >>> limiter = AsyncRateLimiter(rpm=60, tpm=150_000)
+        >>> async with limiter.acquire(tokens=1200):
+        ...     response = await client.chat.completions.create(...)
+    """
+    
+    def __init__(self,
+                 rpm: int,
+                 tpm: int,
+                 max_concurrency: int = 16,
+                 increase: float = 1.0,
+                 decrease: float = 0.5):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rpm: Requests per minute
+            tpm: Tokens per minute
+            max_concurrency: Upper bound for in-flight requests
+            increase: Additive concurrency increase per round of successes
+            decrease: Multiplicative concurrency decrease on a 429
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._condition = asyncio.Condition()
+    
+    @asynccontextmanager
+    async def acquire(self, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Hold a request slot for the duration of the block.
+        
+        A request larger than ``tpm`` is admitted once the window is
+        empty rather than blocking forever.
+        
+        Args:
+            tokens: Estimated prompt plus completion tokens
+        """
+        async with self._condition:
+            while True:
+                delay = self._admission_delay(tokens)
+                if delay == 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        
+            self._window.append((time.monotonic(), tokens))
+            self._window_tokens += tokens
+            self.in_flight += 1
+        
+        try:
+            yield
+        except Exception as e:
+            if _is_rate_limited(e):
+                self.limit = max(1.0, self.limit * self.decrease)
+            raise
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + self.increase / self.limit)
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+    
+    def _admission_delay(self, tokens: int) -> Optional[float]:
+        """
+        Seconds to wait before a request may start.
+        
+        Returns 0 if it may start now, or None to wait for a release.
+        """
+        now = time.monotonic()
+        window = self._window
+        while window and now - window[0][0] >= _WINDOW_SECONDS:
+            self._window_tokens -= window.popleft()[1]
+        
+        if self.in_flight >= int(self.limit):
+            return None
+        if not window:
+            return 0
+        if len(window) < self.rpm and self._window_tokens + tokens <= self.tpm:
+            return 0
+        # Wait for the oldest request to leave the window
+        return _WINDOW_SECONDS - (now - window[0][0])
+
+
+# Limiters by (provider, api key digest), per event loop
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncRateLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_rate_limiter(provider: str, api_key: Optional[str]) -> AsyncRateLimiter:
+    """
+    Shared rate limiter for a provider account on the running loop.
+    
+    Args:
+        provider: Provider name
+        api_key: Provider API key
+    
+    Returns:
+        Limiter seeded from PROVIDER_PROFILES
+    """
+    key_digest = hashlib.blake2b((api_key or '').encode(), digest_size=8).hexdigest()
+    limiters = _limiters.setdefault(asyncio.get_running_loop(), {})
+    limiter = limiters.get((provider, key_digest))
+    if limiter is None:
+        profile = PROVIDER_PROFILES.get(provider, PROVIDER_PROFILES['openai'])
+        limiter = AsyncRateLimiter(profile.rpm, profile.tpm, profile.max_concurrency)
+        limiters[(provider, key_digest)] = limiter
+    return limiter
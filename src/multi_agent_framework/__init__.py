@@ -8,7 +8,7 @@ __version__ = "1.0.0"
 __author__ = "Andrex Ibiza"
 __license__ = "MIT"
 
-from .agent import Agent, AgentRole, AgentCapability
+from .agent import Agent, AgentRole, AgentCapability, AgentTask
 from .coordinator import Coordinator, WorkflowMode
 from .document import Document, DocumentManager, Section
 from .verification import (
@@ -25,6 +25,7 @@ __all__ = [
     "Agent",
     "AgentRole",
     "AgentCapability",
+    "AgentTask",
     "Coordinator",
     "WorkflowMode",
     "Document",
@@ -0,0 +1,6 @@
+"""Helpers shared across framework modules."""
+
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -7,14 +7,47 @@ creating specialized agents with different roles and capabilities.
 
 import asyncio
 import uuid
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Deque, Dict, Any, Optional, Callable
+from collections import deque
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
+from ._common import _SLOTS
+
 logger = logging.getLogger(__name__)
 
+# Messages kept per agent inbox
+MAX_INBOX_SIZE = 10_000
+
+# Default system prompt by agent role, shared by all agents
+_DEFAULT_PROMPTS = MappingProxyType({
+    "researcher": (
+        "You are a research agent specialized in gathering, analyzing, and "
+        "synthesizing information. Your task is to find accurate, relevant "
+        "information and present it in a clear, organized manner."
+    ),
+    "writer": (
+        "You are a writing agent specialized in creating clear, engaging, "
+        "and well-structured content. Your task is to transform information "
+        "and ideas into compelling written material."
+    ),
+    "editor": (
+        "You are an editor agent specialized in improving content quality. "
+        "Your task is to refine text for clarity, coherence, grammar, and style."
+    ),
+    "fact_checker": (
+        "You are a fact-checking agent specialized in verifying the accuracy "
+        "of information. Your task is to identify and correct factual errors."
+    ),
+    "reviewer": (
+        "You are a review agent specialized in evaluating content quality. "
+        "Your task is to provide comprehensive feedback and suggestions."
+    ),
+})
+
 
 class AgentRole(Enum):
     """Predefined agent roles for document creation."""
@@ -44,7 +77,7 @@ class AgentCapability(Enum):
     STATISTICAL_MODELING = "statistical_modeling"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentMessage:
     """Message structure for agent communication."""
     sender_id: str
@@ -55,7 +88,7 @@ class AgentMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentTask:
     """Task assigned to an agent."""
     task_id: str
@@ -97,44 +130,25 @@ class Agent:
         self.agent_id = agent_id or str(uuid.uuid4())
         self.role = role
         self.capabilities = capabilities or []
+        # Hashed copy for task routing; capabilities are fixed after construction
+        self._caps = frozenset(self.capabilities)
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.system_prompt = system_prompt or self._get_default_system_prompt()
         
         self.task_history: List[AgentTask] = []
-        self.message_inbox: List[AgentMessage] = []
+        self._completed_count = 0
+        self._failed_count = 0
+        # Oldest messages are dropped once the inbox is full
+        self.message_inbox: Deque[AgentMessage] = deque(maxlen=MAX_INBOX_SIZE)
         self.status = "idle"  # idle, working, waiting
         
-        logger.info(f"Agent {self.agent_id} initialized with role: {self.role}")
+        logger.info("Agent %s initialized with role: %s", self.agent_id, self.role)
     
     def _get_default_system_prompt(self) -> str:
         """Get default system prompt based on agent role."""
-        prompts = {
-            "researcher": (
-                "You are a research agent specialized in gathering, analyzing, and "
-                "synthesizing information. Your task is to find accurate, relevant "
-                "information and present it in a clear, organized manner."
-            ),
-            "writer": (
-                "You are a writing agent specialized in creating clear, engaging, "
-                "and well-structured content. Your task is to transform information "
-                "and ideas into compelling written material."
-            ),
-            "editor": (
-                "You are an editor agent specialized in improving content quality. "
-                "Your task is to refine text for clarity, coherence, grammar, and style."
-            ),
-            "fact_checker": (
-                "You are a fact-checking agent specialized in verifying the accuracy "
-                "of information. Your task is to identify and correct factual errors."
-            ),
-            "reviewer": (
-                "You are a review agent specialized in evaluating content quality. "
-                "Your task is to provide comprehensive feedback and suggestions."
-            ),
-        }
-        return prompts.get(self.role, "You are a helpful AI agent.")
+        return _DEFAULT_PROMPTS.get(self.role, "You are a helpful AI agent.")
     
     async def execute_task(self, task: AgentTask) -> Dict[str, Any]:
         """
@@ -146,7 +160,7 @@ class Agent:
         Returns:
             Dictionary containing the task result and metadata
         """
-        logger.info(f"Agent {self.agent_id} executing task: {task.task_id}")
+        logger.info("Agent %s executing task: %s", self.agent_id, task.task_id)
         self.status = "working"
         task.status = "in_progress"
         
@@ -159,9 +173,10 @@ class Agent:
             task.completed_at = datetime.now()
             
             self.task_history.append(task)
+            self._completed_count += 1
             self.status = "idle"
             
-            logger.info(f"Agent {self.agent_id} completed task: {task.task_id}")
+            logger.info("Agent %s completed task: %s", self.agent_id, task.task_id)
             
             return {
                 "task_id": task.task_id,
@@ -171,8 +186,9 @@ class Agent:
             }
             
         except Exception as e:
-            logger.error(f"Agent {self.agent_id} failed task {task.task_id}: {str(e)}")
+            logger.error("Agent %s failed task %s: %s", self.agent_id, task.task_id, e)
             task.status = "failed"
+            self._failed_count += 1
             self.status = "idle"
             
             return {
@@ -182,6 +198,22 @@ class Agent:
                 "agent_id": self.agent_id,
             }
     
+    async def execute_task_batch(self, tasks: List[AgentTask]) -> List[Dict[str, Any]]:
+        """
+        Execute several tasks assigned to this agent.
+        
+        The default runs ``execute_task`` for each task concurrently.
+        Agents whose backend accepts batched prompts can override this to
+        send the tasks in one request.
+        
+        Args:
+            tasks: Tasks to execute
+            
+        Returns:
+            Results as returned by ``execute_task``, in task order
+        """
+        return list(await asyncio.gather(*(self.execute_task(task) for task in tasks)))
+    
     async def _process_task(self, task: AgentTask) -> Dict[str, Any]:
         """
         Process the task based on agent's role and capabilities.
@@ -210,13 +242,13 @@ class Agent:
     
     def send_message(self, message: AgentMessage) -> None:
         """Send a message to another agent (via coordinator)."""
-        logger.debug(f"Agent {self.agent_id} sending message to {message.recipient_id}")
+        logger.debug("Agent %s sending message to %s", self.agent_id, message.recipient_id)
         # In production, this would go through the coordinator
         pass
     
     def receive_message(self, message: AgentMessage) -> None:
         """Receive a message from another agent."""
-        logger.debug(f"Agent {self.agent_id} received message from {message.sender_id}")
+        logger.debug("Agent %s received message from %s", self.agent_id, message.sender_id)
         self.message_inbox.append(message)
     
     def get_capabilities(self) -> List[str]:
@@ -225,20 +257,17 @@ class Agent:
     
     def can_handle_task(self, task_requirements: List[str]) -> bool:
         """Check if agent can handle a task based on requirements."""
-        return any(req in self.capabilities for req in task_requirements)
+        return not self._caps.isdisjoint(task_requirements)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status and statistics."""
-        completed_tasks = [t for t in self.task_history if t.status == "completed"]
-        failed_tasks = [t for t in self.task_history if t.status == "failed"]
-        
         return {
             "agent_id": self.agent_id,
             "role": self.role,
             "status": self.status,
             "total_tasks": len(self.task_history),
-            "completed_tasks": len(completed_tasks),
-            "failed_tasks": len(failed_tasks),
+            "completed_tasks": self._completed_count,
+            "failed_tasks": self._failed_count,
             "capabilities": self.capabilities,
             "messages_in_inbox": len(self.message_inbox),
         }
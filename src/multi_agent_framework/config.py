@@ -11,10 +11,17 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import logging
 
+from ._common import _SLOTS
+
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentConfig:
     """Configuration for agents."""
     default_model: str = "gpt-4"
@@ -24,7 +31,7 @@ class AgentConfig:
     max_tokens: int = 2000
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CoordinatorConfig:
     """Configuration for coordinator."""
     max_concurrent_agents: int = 5
@@ -33,7 +40,7 @@ class CoordinatorConfig:
     max_iterations: int = 3
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VerificationConfig:
     """Configuration for verification system."""
     enabled: bool = True
@@ -47,7 +54,7 @@ class VerificationConfig:
     ])
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocumentConfig:
     """Configuration for document management."""
     default_format: str = "markdown"
@@ -56,7 +63,7 @@ class DocumentConfig:
     output_directory: str = "output"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LoggingConfig:
     """Configuration for logging."""
     level: str = "INFO"
@@ -64,6 +71,23 @@ class LoggingConfig:
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() == 'true'
+
+
+# Environment overrides: (variable, config section, attribute, parser).
+# Unset and empty variables are ignored.
+_ENV_OVERRIDES = (
+    ('MADF_AGENT_MODEL', 'agent', 'default_model', str),
+    ('MADF_AGENT_TIMEOUT', 'agent', 'timeout', int),
+    ('MADF_MAX_ITERATIONS', 'coordinator', 'max_iterations', int),
+    ('MADF_COLLABORATION_MODE', 'coordinator', 'collaboration_mode', str),
+    ('MADF_VERIFICATION_ENABLED', 'verification', 'enabled', _env_bool),
+    ('MADF_LOG_LEVEL', 'logging', 'level', str),
+)
+
+
 class Config:
     """
     Main configuration class for the multi-agent framework.
@@ -110,16 +134,16 @@ class Config:
         """
         path = Path(file_path)
         if not path.exists():
-            logger.warning(f"Config file not found: {file_path}. Using defaults.")
+            logger.warning("Config file not found: %s. Using defaults.", file_path)
             return cls()
         
         try:
             with open(path, 'r') as f:
-                config_dict = yaml.safe_load(f)
-            logger.info(f"Configuration loaded from {file_path}")
+                config_dict = yaml.load(f, Loader=_SafeLoader)
+            logger.info("Configuration loaded from %s", file_path)
             return cls(config_dict)
         except Exception as e:
-            logger.error(f"Error loading config from {file_path}: {e}")
+            logger.error("Error loading config from %s: %s", file_path, e)
             return cls()
     
     @classmethod
@@ -193,25 +217,11 @@ class Config:
     
     def _load_from_env(self) -> None:
         """Load configuration overrides from environment variables."""
-        # Agent settings
-        if os.getenv('MADF_AGENT_MODEL'):
-            self.agent.default_model = os.getenv('MADF_AGENT_MODEL')
-        if os.getenv('MADF_AGENT_TIMEOUT'):
-            self.agent.timeout = int(os.getenv('MADF_AGENT_TIMEOUT'))
-        
-        # Coordinator settings
-        if os.getenv('MADF_MAX_ITERATIONS'):
-            self.coordinator.max_iterations = int(os.getenv('MADF_MAX_ITERATIONS'))
-        if os.getenv('MADF_COLLABORATION_MODE'):
-            self.coordinator.collaboration_mode = os.getenv('MADF_COLLABORATION_MODE')
-        
-        # Verification settings
-        if os.getenv('MADF_VERIFICATION_ENABLED'):
-            self.verification.enabled = os.getenv('MADF_VERIFICATION_ENABLED').lower() == 'true'
-        
-        # Logging settings
-        if os.getenv('MADF_LOG_LEVEL'):
-            self.logging.level = os.getenv('MADF_LOG_LEVEL')
+        env = os.environ
+        for name, section, attr, cast in _ENV_OVERRIDES:
+            value = env.get(name)
+            if value:
+                setattr(getattr(self, section), attr, cast(value))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -258,9 +268,9 @@ class Config:
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False)
+            yaml.dump(self.to_dict(), f, Dumper=_SafeDumper, default_flow_style=False)
         
-        logger.info(f"Configuration saved to {file_path}")
+        logger.info("Configuration saved to %s", file_path)
     
     def setup_logging(self) -> None:
         """Configure logging based on settings."""
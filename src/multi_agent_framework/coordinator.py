@@ -6,20 +6,49 @@ workflow execution for document creation.
 """
 
 import asyncio
+import hashlib
+import itertools
+import json
+import threading
 import uuid
-from typing import List, Dict, Any, Optional
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
 from .agent import Agent, AgentTask, AgentMessage
-from .document import Document, DocumentManager, Section
+from .document import Document, DocumentManager
 from .verification import VerificationSystem, VerificationResult
 from .config import Config
+from ._common import _SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Python 3.12+
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+# Most tasks sent to one agent in a single batch
+MAX_BATCH_SIZE = 8
+
+# Agent role that handles each verification issue type; others go to "editor"
+_ISSUE_ROLES = {
+    "factual_accuracy": "fact_checker",
+    "consistency": "editor",
+    "grammar": "editor",
+    "style": "editor",
+    "completeness": "writer",
+}
+
+
+def _close_loops(loops: List[asyncio.AbstractEventLoop]) -> None:
+    """Close event loops left open when their coordinator is collected."""
+    for loop in loops:
+        if not loop.is_closed() and not loop.is_running():
+            loop.close()
+
 
 class WorkflowMode(Enum):
     """Workflow execution modes."""
@@ -29,7 +58,7 @@ class WorkflowMode(Enum):
     COLLABORATIVE = "collaborative"  # Agents communicate and iterate
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowStep:
     """Represents a step in the document creation workflow."""
     step_id: str
@@ -54,6 +83,7 @@ class Coordinator:
         verification_system: Optional verification system for quality control
         max_iterations: Maximum number of refinement iterations
         config: Configuration object
+        result_cache_size: Number of task results kept for reuse (0 disables)
     """
     
     def __init__(
@@ -63,9 +93,17 @@ class Coordinator:
         verification_system: Optional[VerificationSystem] = None,
         max_iterations: int = 3,
         config: Optional[Config] = None,
+        result_cache_size: int = 256,
     ):
         self.coordinator_id = str(uuid.uuid4())
+        # Step and task ids: coordinator prefix plus a counter, cheaper than uuid4
+        self._id_prefix = self.coordinator_id[:8]
+        self._id_counter = itertools.count(1)
         self.agents = {agent.agent_id: agent for agent in agents}
+        # First agent of each role, for task routing
+        self._agents_by_role: Dict[str, Agent] = {}
+        for agent in agents:
+            self._agents_by_role.setdefault(agent.role, agent)
         self.workflow_mode = workflow_mode
         self.verification_system = verification_system
         self.max_iterations = max_iterations
@@ -74,9 +112,19 @@ class Coordinator:
         self.document_manager = DocumentManager()
         self.workflow_history: List[WorkflowStep] = []
         
+        # Successful task results by content hash, least recently used first
+        self.result_cache_size = result_cache_size
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Event loops reused by create_document, one per calling thread
+        self._thread_loop = threading.local()
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._loops_lock = threading.Lock()
+        self._loops_finalizer = weakref.finalize(self, _close_loops, self._loops)
+        
         logger.info(
-            f"Coordinator {self.coordinator_id} initialized with "
-            f"{len(self.agents)} agents in {workflow_mode.value} mode"
+            "Coordinator %s initialized with %s agents in %s mode",
+            self.coordinator_id, len(self.agents), workflow_mode.value
         )
     
     def create_document(
@@ -85,8 +133,62 @@ class Coordinator:
         requirements: Dict[str, Any],
         workflow_steps: Optional[List[Dict[str, Any]]] = None,
     ) -> Document:
-        """Synchronous wrapper for create_document_async."""
-        return asyncio.run(self.create_document_async(topic, requirements, workflow_steps))
+        """
+        Synchronous wrapper for create_document_async.
+        
+        Runs on a private event loop per calling thread, kept across calls
+        until close() (or the end of a ``with`` block, or garbage collection).
+        On Python 3.12+ the loop uses eager tasks, so agent calls that
+        finish without suspending skip a scheduler round trip.
+        
+        Raises:
+            RuntimeError: If called while an event loop is running
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "create_document cannot run inside an event loop; "
+                "await create_document_async instead"
+            )
+        
+        loop = getattr(self._thread_loop, "loop", None)
+        if loop is None or loop.is_closed():
+            loop = self._thread_loop.loop = asyncio.new_event_loop()
+            if _eager_task_factory is not None:
+                loop.set_task_factory(_eager_task_factory)
+            with self._loops_lock:
+                self._loops.append(loop)
+        return loop.run_until_complete(
+            self.create_document_async(topic, requirements, workflow_steps)
+        )
+    
+    def close(self) -> None:
+        """
+        Close the event loops used by create_document.
+        
+        Call once no create_document call is in progress; later calls
+        start new loops.
+        """
+        with self._loops_lock:
+            loops = self._loops[:]
+            self._loops.clear()
+        for loop in loops:
+            if loop.is_closed():
+                continue
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                loop.close()
+    
+    def __enter__(self) -> "Coordinator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     async def create_document_async(
         self,
@@ -105,7 +207,7 @@ class Coordinator:
         Returns:
             Completed Document object
         """
-        logger.info(f"Starting document creation for topic: {topic}")
+        logger.info("Starting document creation for topic: %s", topic)
         
         # Initialize document
         document = self.document_manager.create_document(
@@ -119,129 +221,265 @@ class Coordinator:
         
         # Execute workflow
         for iteration in range(self.max_iterations):
-            logger.info(f"Workflow iteration {iteration + 1}/{self.max_iterations}")
+            logger.info("Workflow iteration %s/%s", iteration + 1, self.max_iterations)
             
-            if self.workflow_mode == WorkflowMode.SEQUENTIAL:
-                await self._execute_sequential_workflow(workflow_steps, document)
-            elif self.workflow_mode == WorkflowMode.PARALLEL:
-                await self._execute_parallel_workflow(workflow_steps, document)
-            elif self.workflow_mode == WorkflowMode.PIPELINE:
-                await self._execute_pipeline_workflow(workflow_steps, document)
-            else:
-                await self._execute_collaborative_workflow(workflow_steps, document)
+            await self._execute_workflow(workflow_steps, document)
             
-            # Verify document if verification system is enabled
-            if self.verification_system:
-                verification_result = self.verification_system.verify(document)
-                document.verification_score = verification_result.overall_score
-                
-                logger.info(f"Verification score: {verification_result.overall_score}")
-                
-                if verification_result.passed:
-                    logger.info("Document passed verification")
+            # Without verification there is nothing to refine
+            if not self.verification_system:
+                break
+            
+            # Verification is CPU-bound; keep the event loop responsive.
+            # run_in_executor rather than to_thread avoids copying the
+            # context per call.
+            verification_result = await asyncio.get_running_loop().run_in_executor(
+                None, self.verification_system.verify, document
+            )
+            document.verification_score = verification_result.overall_score
+            
+            logger.info("Verification score: %s", verification_result.overall_score)
+            
+            if verification_result.passed:
+                logger.info("Document passed verification")
+                break
+            else:
+                logger.info("Document needs refinement")
+                # Generate refinement tasks based on verification feedback
+                workflow_steps = self._generate_refinement_workflow(
+                    verification_result
+                )
+                if not workflow_steps:
+                    logger.info("No actionable refinement issues; stopping")
                     break
-                else:
-                    logger.info("Document needs refinement")
-                    # Generate refinement tasks based on verification feedback
-                    workflow_steps = self._generate_refinement_workflow(
-                        verification_result
-                    )
         
         # Finalize document
         self.document_manager.finalize_document(document)
         
-        logger.info(f"Document creation completed: {document.document_id}")
+        logger.info("Document creation completed: %s", document.document_id)
         return document
     
-    async def _execute_sequential_workflow(
+    async def _execute_workflow(
         self,
         workflow_steps: List[Dict[str, Any]],
         document: Document,
     ) -> None:
-        """Execute workflow steps sequentially."""
+        """
+        Execute workflow steps according to the workflow mode.
+        
+        Steps run as a dependency graph. A step config may name itself with
+        ``step_id`` and list the step ids it waits for in ``dependencies``.
+        Steps without a ``dependencies`` entry depend on the previous step in
+        SEQUENTIAL and PIPELINE mode, and on nothing in PARALLEL and
+        COLLABORATIVE mode.
+        """
+        chained = self.workflow_mode in (WorkflowMode.SEQUENTIAL, WorkflowMode.PIPELINE)
+        steps = []
         for step_config in workflow_steps:
             step = self._create_workflow_step(step_config, document)
-            agent = self.agents[step.agent_id]
-            
-            result = await agent.execute_task(step.task)
-            step.status = result["status"]
-            step.result = result.get("result")
-            
-            self.workflow_history.append(step)
-            
-            # Update document with step result
-            if step.status == "success":
-                self._update_document_from_result(document, step.result)
+            if chained and "dependencies" not in step_config and steps:
+                step.dependencies = [steps[-1].step_id]
+            steps.append(step)
+        
+        await self._execute_dag(
+            steps,
+            document,
+            forward_output=self.workflow_mode == WorkflowMode.PIPELINE,
+        )
+        
+        if self.workflow_mode == WorkflowMode.COLLABORATIVE:
+            await self._execute_feedback_round(workflow_steps, document)
     
-    async def _execute_parallel_workflow(
+    def _build_dag(
         self,
-        workflow_steps: List[Dict[str, Any]],
-        document: Document,
-    ) -> None:
-        """Execute workflow steps in parallel."""
-        steps = [self._create_workflow_step(config, document) for config in workflow_steps]
-        tasks = []
+        steps: List[WorkflowStep],
+    ) -> Tuple[Dict[str, WorkflowStep], Dict[str, int], Dict[str, List[str]]]:
+        """
+        Index workflow steps as a dependency graph.
+        
+        Args:
+            steps: Workflow steps
+            
+        Returns:
+            Tuple of (steps by id, in-degree by id, successor ids by id)
+            
+        Raises:
+            ValueError: If a step depends on an unknown step or the
+                dependencies contain a cycle
+        """
+        nodes = {step.step_id: step for step in steps}
+        in_degree = {step_id: 0 for step_id in nodes}
+        successors: Dict[str, List[str]] = {step_id: [] for step_id in nodes}
         
         for step in steps:
-            agent = self.agents[step.agent_id]
-            tasks.append(agent.execute_task(step.task))
+            for dependency in step.dependencies:
+                if dependency not in nodes:
+                    raise ValueError(
+                        f"Step {step.step_id} depends on unknown step {dependency}"
+                    )
+                in_degree[step.step_id] += 1
+                successors[dependency].append(step.step_id)
         
-        results = await asyncio.gather(*tasks)
+        # Kahn's algorithm: every step is reachable from a root unless
+        # some steps wait on each other
+        remaining = dict(in_degree)
+        ready = [step_id for step_id, degree in remaining.items() if degree == 0]
+        visited = 0
+        while ready:
+            step_id = ready.pop()
+            visited += 1
+            for successor in successors[step_id]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    ready.append(successor)
+        if visited < len(nodes):
+            raise ValueError("Workflow step dependencies contain a cycle")
         
-        for step, result in zip(steps, results):
-            step.status = result["status"]
-            step.result = result.get("result")
-            self.workflow_history.append(step)
-            
-            if step.status == "success":
-                self._update_document_from_result(document, step.result)
+        return nodes, in_degree, successors
     
-    async def _execute_pipeline_workflow(
+    async def _execute_dag(
         self,
-        workflow_steps: List[Dict[str, Any]],
+        steps: List[WorkflowStep],
         document: Document,
+        forward_output: bool = False,
     ) -> None:
-        """Execute workflow as a pipeline where output feeds into next step."""
-        previous_result = None
+        """
+        Run workflow steps as soon as their dependencies finish.
         
-        for step_config in workflow_steps:
-            step = self._create_workflow_step(step_config, document)
-            
-            # Add previous result to task requirements
-            if previous_result:
-                step.task.requirements["previous_output"] = previous_result
-            
-            agent = self.agents[step.agent_id]
-            result = await agent.execute_task(step.task)
-            
-            step.status = result["status"]
-            step.result = result.get("result")
-            self.workflow_history.append(step)
-            
-            if step.status == "success":
-                self._update_document_from_result(document, step.result)
-                previous_result = step.result
+        Each result is applied to the document as soon as its step finishes,
+        so sections from fast agents do not wait for slow ones. Steps are
+        recorded in ``workflow_history`` in step order.
+        
+        Args:
+            steps: Workflow steps
+            document: Document being created
+            forward_output: Pass the result of the last successful
+                dependency to each step as ``previous_output``
+        """
+        nodes, in_degree, successors = self._build_dag(steps)
+        order = {step_id: index for index, step_id in enumerate(nodes)}
+        ready = [step_id for step_id, degree in in_degree.items() if degree == 0]
+        running: Dict[asyncio.Future, List[WorkflowStep]] = {}
+        
+        try:
+            while ready or running:
+                # Steps that become ready together for one agent go as a batch
+                batches: Dict[str, List[WorkflowStep]] = {}
+                for step_id in ready:
+                    step = nodes[step_id]
+                    if forward_output:
+                        outputs = [
+                            nodes[dependency].result for dependency in step.dependencies
+                            if nodes[dependency].status == "success"
+                        ]
+                        if outputs:
+                            step.task.requirements["previous_output"] = outputs[-1]
+                    batches.setdefault(step.agent_id, []).append(step)
+                ready = []
+                
+                for agent_id, batch in batches.items():
+                    agent = self.agents[agent_id]
+                    for start in range(0, len(batch), MAX_BATCH_SIZE):
+                        chunk = batch[start:start + MAX_BATCH_SIZE]
+                        tasks = [step.task for step in chunk]
+                        running[asyncio.ensure_future(self._execute_cached(agent, tasks))] = chunk
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                finished = [
+                    (step, result)
+                    for future in done
+                    for step, result in zip(running.pop(future), future.result())
+                ]
+                for step, result in sorted(finished, key=lambda item: order[item[0].step_id]):
+                    step.status = result["status"]
+                    step.result = result.get("result")
+                    if step.status == "success":
+                        self._update_document_from_result(document, step.result)
+                    
+                    for successor in successors[step.step_id]:
+                        in_degree[successor] -= 1
+                        if in_degree[successor] == 0:
+                            ready.append(successor)
+        except BaseException:
+            for future in running:
+                future.cancel()
+            # Let cancelled batches finish before the error propagates
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+        
+        self.workflow_history.extend(steps)
     
-    async def _execute_collaborative_workflow(
+    async def _execute_feedback_round(
         self,
         workflow_steps: List[Dict[str, Any]],
         document: Document,
     ) -> None:
-        """Execute workflow with agent collaboration and feedback loops."""
-        # First pass: parallel execution
-        await self._execute_parallel_workflow(workflow_steps, document)
-        
-        # Feedback round: agents review each other's work
+        """Feedback round: agents review each other's work."""
         for step_config in workflow_steps:
             if step_config.get("enable_feedback", False):
                 feedback_step = self._create_feedback_step(step_config, document)
                 agent = self.agents[feedback_step.agent_id]
                 
-                result = await agent.execute_task(feedback_step.task)
+                result, = await self._execute_cached(agent, [feedback_step.task])
                 
                 if result["status"] == "success":
                     self._update_document_from_result(document, result["result"])
     
+    async def _execute_cached(self, agent: Agent, tasks: List[AgentTask]) -> List[Dict[str, Any]]:
+        """
+        Execute tasks on one agent, reusing results of identical earlier tasks.
+        
+        Tasks are identical when they go to the same agent with the same
+        description and requirements. Only successful results are cached.
+        Several uncached tasks are sent together through
+        ``Agent.execute_task_batch``.
+        
+        Returns:
+            Task results, in task order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        misses = []
+        for index, task in enumerate(tasks):
+            key = self._result_key(agent, task) if self.result_cache_size > 0 else None
+            cached = self._result_cache.get(key) if key is not None else None
+            if cached is None:
+                misses.append((index, key))
+                continue
+            
+            self._result_cache.move_to_end(key)
+            logger.debug("Reusing cached result for task %s", task.task_id)
+            task.status = "completed"
+            task.result = cached["result"]
+            task.completed_at = datetime.now()
+            results[index] = {**cached, "task_id": task.task_id}
+        
+        if not misses:
+            return results
+        
+        if len(misses) == 1:
+            fresh = [await agent.execute_task(tasks[misses[0][0]])]
+        else:
+            fresh = await agent.execute_task_batch([tasks[index] for index, _ in misses])
+        
+        for (index, key), result in zip(misses, fresh):
+            results[index] = result
+            if key is not None and result["status"] == "success":
+                self._result_cache[key] = result
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        return results
+    
+    @staticmethod
+    def _result_key(agent: Agent, task: AgentTask) -> str:
+        """Result cache key of a task on an agent."""
+        return hashlib.blake2b(
+            json.dumps(
+                [agent.agent_id, task.description, task.requirements],
+                sort_keys=True,
+                default=str,
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+    
     def _generate_workflow(self, topic: str, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate workflow steps based on requirements and available agents."""
         workflow = []
@@ -299,6 +537,10 @@ class Coordinator:
         
         return workflow
     
+    def _next_id(self) -> str:
+        """Unique id for a workflow step or task of this coordinator."""
+        return f"{self._id_prefix}-{next(self._id_counter)}"
+    
     def _create_workflow_step(
         self,
         step_config: Dict[str, Any],
@@ -306,16 +548,17 @@ class Coordinator:
     ) -> WorkflowStep:
         """Create a workflow step from configuration."""
         task = AgentTask(
-            task_id=str(uuid.uuid4()),
+            task_id=self._next_id(),
             description=step_config["description"],
-            requirements=step_config.get("requirements", {}),
+            # Copied so forwarded outputs do not leak into shared requirements
+            requirements=dict(step_config.get("requirements", {})),
         )
         
         return WorkflowStep(
-            step_id=str(uuid.uuid4()),
+            step_id=step_config.get("step_id") or self._next_id(),
             agent_id=step_config["agent_id"],
             task=task,
-            dependencies=step_config.get("dependencies", []),
+            dependencies=list(step_config.get("dependencies", [])),
         )
     
     def _create_feedback_step(
@@ -329,13 +572,13 @@ class Coordinator:
             reviewer = list(self.agents.values())[0]  # Fallback to any agent
         
         task = AgentTask(
-            task_id=str(uuid.uuid4()),
+            task_id=self._next_id(),
             description=f"Review and provide feedback on: {step_config['description']}",
             requirements={"original_task": step_config},
         )
         
         return WorkflowStep(
-            step_id=str(uuid.uuid4()),
+            step_id=self._next_id(),
             agent_id=reviewer.agent_id,
             task=task,
         )
@@ -343,35 +586,20 @@ class Coordinator:
     def _update_document_from_result(self, document: Document, result: Dict[str, Any]) -> None:
         """Update document with agent task result."""
         if "content" in result:
-            # Add content to document
-            section = Section(
+            # Appending a section extends the rendered content in place
+            document.add_section(
                 title=result.get("title", "Untitled Section"),
                 content=result["content"],
                 metadata=result.get("metadata", {}),
             )
-            document.sections.append(section)
-            document.content += "\n\n" + result["content"]
     
     def _find_agent_by_role(self, role: str) -> Optional[Agent]:
         """Find first agent with specified role."""
-        for agent in self.agents.values():
-            if agent.role == role:
-                return agent
-        return None
+        return self._agents_by_role.get(role)
     
     def _find_agent_for_issue(self, issue: Dict[str, Any]) -> Optional[Agent]:
         """Find appropriate agent to handle a verification issue."""
-        issue_type = issue.get("type")
-        
-        role_mapping = {
-            "factual_accuracy": "fact_checker",
-            "consistency": "editor",
-            "grammar": "editor",
-            "style": "editor",
-            "completeness": "writer",
-        }
-        
-        role = role_mapping.get(issue_type, "editor")
+        role = _ISSUE_ROLES.get(issue.get("type"), "editor")
         return self._find_agent_by_role(role)
     
     def get_workflow_status(self) -> Dict[str, Any]:
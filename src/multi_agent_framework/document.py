@@ -4,31 +4,77 @@ Document management for the multi-agent framework.
 Handles document creation, structure, versioning, and content assembly.
 """
 
+import itertools
+import os
 import uuid
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import json
 import logging
 
+from ._common import _SLOTS
+
+try:
+    import orjson
+except ImportError:  # optional, install with the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Section and version ids: a per-process prefix plus a counter, cheaper
+# than uuid4 and still unique across merged or exported documents
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_id_counter = itertools.count(1)
+
+
+def _next_id() -> str:
+    """Unique id for a section or document version."""
+    return f"{_ID_PREFIX}-{next(_id_counter)}"
+
+
+def _reset_id_prefix() -> None:
+    """Give a forked child its own id prefix."""
+    global _ID_PREFIX
+    _ID_PREFIX = uuid.uuid4().hex[:12]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_prefix)
+
+
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson else 0
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Section:
     """Represents a section of a document."""
     title: str
     content: str
-    section_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    section_id: str = field(default_factory=_next_id)
     order: int = 0
     subsections: List['Section'] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
-    modified_at: datetime = field(default_factory=datetime.now)
+    # Defaults to created_at so a new section reads the clock once
+    modified_at: Optional[datetime] = None
+    # (content, word count) of the last count; stale once content is reassigned
+    _word_count_cache: Optional[Tuple[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        if self.modified_at is None:
+            self.modified_at = self.created_at
     
     def word_count(self) -> int:
         """Calculate word count for this section."""
-        words = len(self.content.split())
+        cache = self._word_count_cache
+        if cache is not None and cache[0] is self.content:
+            words = cache[1]
+        else:
+            words = len(self.content.split())
+            self._word_count_cache = (self.content, words)
         for subsection in self.subsections:
             words += subsection.word_count()
         return words
@@ -47,7 +93,7 @@ class Section:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocumentVersion:
     """Represents a version of a document."""
     version_id: str
@@ -64,6 +110,11 @@ class Document:
     """
     Represents a document being created by the multi-agent system.
     
+    Sections are kept ordered by ``Section.order``; use ``add_section`` to
+    insert new sections. ``content`` is rendered from the sections on first
+    read after a change, and appending a section at the end extends the
+    rendered content instead of rebuilding it.
+    
     Attributes:
         document_id: Unique identifier for the document
         title: Document title
@@ -83,23 +134,54 @@ class Document:
     ):
         self.document_id = document_id or str(uuid.uuid4())
         self.title = title
-        self.content = ""
         self.sections: List[Section] = []
+        # Sections by id, rebuilt when the sections list is replaced or resized
+        self._sections_by_id: Dict[str, Section] = {}
+        self._indexed_sections: List[Section] = self.sections
+        # Rendered section blocks, joined into content on first read;
+        # None means re-render from sections
+        self._content_parts: Optional[List[str]] = []
+        self._parts_from_sections = True
+        self._content: Optional[str] = ""
+        # Word count of content, None until counted after a change
+        self._word_count: Optional[int] = 0
         self.metadata: Dict[str, Any] = {}
         self.requirements = requirements or {}
         self.verification_score: Optional[float] = None
         self.status = "draft"  # draft, review, final
-        self.created_at = datetime.now()
-        self.modified_at = datetime.now()
+        self.created_at = self.modified_at = datetime.now()
         self.versions: List[DocumentVersion] = []
+        # id() of Section objects referenced by a version; kept alive by versions
+        self._versioned_sections: set = set()
         self.contributors: List[str] = []
         
-        logger.info(f"Document created: {self.document_id} - {self.title}")
+        logger.info("Document created: %s - %s", self.document_id, self.title)
+    
+    @property
+    def content(self) -> str:
+        """Full document content, rendered from sections unless set directly."""
+        if self._content is None:
+            if self._content_parts is None:
+                self._content_parts = [
+                    self._render_section(section)
+                    for section in sorted(self.sections, key=lambda s: s.order)
+                ]
+            self._content = "\n".join(self._content_parts)
+        return self._content
+    
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._word_count = None
+        self._content_parts = [value]
+        self._parts_from_sections = False
     
     @property
     def word_count(self) -> int:
         """Calculate total word count."""
-        return len(self.content.split())
+        if self._word_count is None:
+            self._word_count = len(self.content.split())
+        return self._word_count
     
     @property
     def section_count(self) -> int:
@@ -114,61 +196,133 @@ class Document:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Section:
         """Add a new section to the document."""
+        now = datetime.now()
         section = Section(
             title=title,
             content=content,
             order=order if order is not None else len(self.sections),
             metadata=metadata or {},
+            created_at=now,
         )
         
-        self.sections.append(section)
-        self.sections.sort(key=lambda s: s.order)
-        self._update_content()
+        sections = self.sections
+        if not sections or section.order >= sections[-1].order:
+            # Common case: default order, already in position
+            lo = len(sections)
+            sections.append(section)
+        else:
+            # Insert after sections of equal or lower order
+            lo, hi = 0, len(sections)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if section.order < sections[mid].order:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            sections.insert(lo, section)
+        if self._index_current(len(sections) - 1):
+            self._sections_by_id[section.section_id] = section
+        
+        if lo == len(sections) - 1 and self._content_parts is not None and self._parts_from_sections:
+            # Appended at the end: extend the rendered content in place
+            block = self._render_section(section)
+            self._content_parts.append(block)
+            self._content = None
+            if self._word_count is not None:
+                # Blocks are newline-separated, so their words never merge
+                self._word_count += len(block.split())
+            self.modified_at = now
+        else:
+            self._update_content(now)
         
-        logger.debug(f"Section added to {self.document_id}: {title}")
+        logger.debug("Section added to %s: %s", self.document_id, title)
         return section
     
     def update_section(self, section_id: str, content: str) -> bool:
         """Update content of an existing section."""
-        for section in self.sections:
-            if section.section_id == section_id:
-                section.content = content
-                section.modified_at = datetime.now()
-                self._update_content()
-                logger.debug(f"Section updated in {self.document_id}: {section_id}")
-                return True
-        return False
+        section = self._section_index().get(section_id)
+        if section is None:
+            return False
+        
+        now = datetime.now()
+        if id(section) in self._versioned_sections:
+            # Copy on write so version snapshots keep the old content
+            updated = replace(section, content=content, modified_at=now)
+            self.sections[self._position(section)] = updated
+            self._sections_by_id[section_id] = updated
+        else:
+            section.content = content
+            section.modified_at = now
+        self._update_content(now)
+        logger.debug("Section updated in %s: %s", self.document_id, section_id)
+        return True
     
     def remove_section(self, section_id: str) -> bool:
         """Remove a section from the document."""
-        original_count = len(self.sections)
-        self.sections = [s for s in self.sections if s.section_id != section_id]
+        section = self._section_index().pop(section_id, None)
+        if section is None:
+            return False
         
-        if len(self.sections) < original_count:
-            self._update_content()
-            logger.debug(f"Section removed from {self.document_id}: {section_id}")
-            return True
-        return False
+        self.sections = [s for s in self.sections if s.section_id != section_id]
+        self._indexed_sections = self.sections
+        self._update_content()
+        logger.debug("Section removed from %s: %s", self.document_id, section_id)
+        return True
     
-    def _update_content(self) -> None:
-        """Rebuild full content from sections."""
-        content_parts = []
-        
-        for section in sorted(self.sections, key=lambda s: s.order):
-            content_parts.append(f"# {section.title}\n")
-            content_parts.append(section.content)
-            content_parts.append("\n")
-        
-        self.content = "\n".join(content_parts)
-        self.modified_at = datetime.now()
+    def _position(self, section: Section) -> int:
+        """Index of a section object in ``sections``."""
+        sections = self.sections
+        # Binary search for the first section of equal order
+        lo, hi = 0, len(sections)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sections[mid].order < section.order:
+                lo = mid + 1
+            else:
+                hi = mid
+        for index in range(lo, len(sections)):
+            if sections[index] is section:
+                return index
+            if sections[index].order != section.order:
+                break
+        # Sections appended out of order directly
+        return next(i for i, s in enumerate(sections) if s is section)
+    
+    def _index_current(self, expected_size: int) -> bool:
+        """Whether the section index covers the sections list at ``expected_size``."""
+        return (
+            self._indexed_sections is self.sections
+            and len(self._sections_by_id) == expected_size
+        )
+    
+    def _section_index(self) -> Dict[str, Section]:
+        """Sections by id, reindexed if ``sections`` was changed directly."""
+        if not self._index_current(len(self.sections)):
+            self._sections_by_id = {s.section_id: s for s in self.sections}
+            self._indexed_sections = self.sections
+        return self._sections_by_id
+    
+    def _update_content(self, now: Optional[datetime] = None) -> None:
+        """Mark content for rebuilding; ``now`` is the caller's mutation time."""
+        self._content_parts = None
+        self._parts_from_sections = True
+        self._content = None
+        self._word_count = None
+        self.modified_at = now or datetime.now()
+    
+    @staticmethod
+    def _render_section(section: Section) -> str:
+        """Render one section's block of the full content."""
+        return f"# {section.title}\n\n{section.content}\n\n"
     
     def create_version(self, change_description: str, created_by: str = "system") -> DocumentVersion:
         """Create a new version of the document."""
         version = DocumentVersion(
-            version_id=str(uuid.uuid4()),
+            version_id=_next_id(),
             version_number=len(self.versions) + 1,
             content=self.content,
-            sections=[s for s in self.sections],  # Copy sections
+            # Shares section objects; update_section copies them on write
+            sections=list(self.sections),
             created_at=datetime.now(),
             created_by=created_by,
             change_description=change_description,
@@ -176,7 +330,8 @@ class Document:
         )
         
         self.versions.append(version)
-        logger.info(f"Version {version.version_number} created for {self.document_id}")
+        self._versioned_sections.update(map(id, version.sections))
+        logger.info("Version %s created for %s", version.version_number, self.document_id)
         return version
     
     def revert_to_version(self, version_number: int) -> bool:
@@ -186,7 +341,7 @@ class Document:
                 self.content = version.content
                 self.sections = [s for s in version.sections]
                 self.modified_at = datetime.now()
-                logger.info(f"Document {self.document_id} reverted to version {version_number}")
+                logger.info("Document %s reverted to version %s", self.document_id, version_number)
                 return True
         return False
     
@@ -215,7 +370,9 @@ class Document:
         }
     
     def to_json(self) -> str:
-        """Convert document to JSON string."""
+        """Convert document to JSON string (uses orjson when installed)."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=_ORJSON_OPTIONS).decode()
         return json.dumps(self.to_dict(), indent=2)
     
     def to_markdown(self) -> str:
@@ -262,7 +419,7 @@ class DocumentManager:
         """Create a new document."""
         document = Document(title=title, requirements=requirements)
         self.documents[document.document_id] = document
-        logger.info(f"Document created and registered: {document.document_id}")
+        logger.info("Document created and registered: %s", document.document_id)
         return document
     
     def get_document(self, document_id: str) -> Optional[Document]:
@@ -273,7 +430,7 @@ class DocumentManager:
         """Delete a document."""
         if document_id in self.documents:
             del self.documents[document_id]
-            logger.info(f"Document deleted: {document_id}")
+            logger.info("Document deleted: %s", document_id)
             return True
         return False
     
@@ -285,7 +442,7 @@ class DocumentManager:
         """Finalize a document (mark as complete)."""
         document.status = "final"
         document.create_version("Final version", "system")
-        logger.info(f"Document finalized: {document.document_id}")
+        logger.info("Document finalized: %s", document.document_id)
     
     def assemble_from_sections(
         self,
@@ -301,7 +458,7 @@ class DocumentManager:
             document.sections.append(section)
         
         document._update_content()
-        logger.info(f"Document assembled from {len(sections)} sections")
+        logger.info("Document assembled from %s sections", len(sections))
         return document
     
     def merge_documents(
@@ -318,13 +475,15 @@ class DocumentManager:
         
         merged = self.create_document(title)
         
-        for doc in documents:
-            for section in doc.sections:
-                merged.sections.append(section)
-            merged.contributors.extend(doc.contributors)
-        
+        # Sections follow document order; renumbered copies leave the
+        # source documents' sections untouched
+        sections = itertools.chain.from_iterable(doc.sections for doc in documents)
+        merged.sections = [replace(section, order=i) for i, section in enumerate(sections)]
+        merged.contributors = list(
+            itertools.chain.from_iterable(doc.contributors for doc in documents)
+        )
         merged._update_content()
-        logger.info(f"Merged {len(documents)} documents into {merged.document_id}")
+        logger.info("Merged %s documents into %s", len(documents), merged.document_id)
         return merged
     
     def export_document(
@@ -347,11 +506,14 @@ class DocumentManager:
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about managed documents."""
         total_docs = len(self.documents)
-        total_words = sum(doc.word_count for doc in self.documents.values())
-        total_sections = sum(doc.section_count for doc in self.documents.values())
+        total_words = 0
+        total_sections = 0
+        status_counts: Dict[str, int] = {}
         
-        status_counts = {}
+        # One pass; word counts are cached per document until its content changes
         for doc in self.documents.values():
+            total_words += doc.word_count
+            total_sections += len(doc.sections)
             status_counts[doc.status] = status_counts.get(doc.status, 0) + 1
         
         return {
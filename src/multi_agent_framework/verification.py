@@ -13,6 +13,35 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the checks, compiled once at import
+# A sentence runs from its first non-space character to the next [.!?]
+_SENTENCE_RE = re.compile(r'[^\s.!?][^.!?]*')
+_WORD_RE = re.compile(r'[^\s.!?]+')
+_HEADING_RE = re.compile(r'^(#+)\s+(.+)$', re.MULTILINE)
+_HAS_HEADING_RE = re.compile(r'^#+\s', re.MULTILINE)
+_PCT_RE = re.compile(r'\d+\.?\d*\s*%')
+# Numbered [1], (Author, Year) and (Author et al., Year) citations
+_CITATION_RE = re.compile(r'\[\d+\]|\([A-Z][a-z]+(?:\s+et\s+al\.?)?,?\s+\d{4}\)')
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_FIRST_PERSON_RE = re.compile(r'\b(?:I|we|our|us)\b', re.IGNORECASE)
+_THIRD_PERSON_RE = re.compile(r'\b(?:they|their|them|one)\b', re.IGNORECASE)
+
+# Phrases that signal a claim needing a citation
+_CLAIM_INDICATORS = ("research shows", "studies indicate", "according to", "evidence suggests")
+_CLAIM_RE = re.compile("|".join(map(re.escape, _CLAIM_INDICATORS)), re.IGNORECASE)
+
+# Spelling variants that should not be mixed in one document
+_SPELLING_VARIANTS = (
+    (("analyze", "analyse"), "US vs UK spelling"),
+    (("organization", "organisation"), "US vs UK spelling"),
+    (("color", "colour"), "US vs UK spelling"),
+)
+# Lookahead so overlapping occurrences are all reported, like substring tests
+_VARIANT_RE = re.compile(
+    "(?=(%s))" % "|".join(re.escape(w) for words, _ in _SPELLING_VARIANTS for w in words),
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class VerificationIssue:
@@ -127,9 +156,9 @@ class QualityCheck:
         issues = []
         
         # Check average sentence length
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        if sentences:
-            avg_words = sum(len(s.split()) for s in sentences) / len(sentences)
+        sentence_count = len(_SENTENCE_RE.findall(content))
+        if sentence_count:
+            avg_words = len(_WORD_RE.findall(content)) / sentence_count
             if avg_words > 30:
                 issues.append(VerificationIssue(
                     issue_type="readability",
@@ -159,7 +188,7 @@ class QualityCheck:
         issues = []
         
         # Check for sections/headings
-        has_headings = bool(re.search(r'^#+\s', content, re.MULTILINE))
+        has_headings = bool(_HAS_HEADING_RE.search(content))
         if not has_headings and len(content) > 1000:
             issues.append(VerificationIssue(
                 issue_type="structure",
@@ -211,8 +240,7 @@ class FactCheck:
         issues = []
         
         # Find percentages
-        percentage_pattern = r'\d+\.?\d*\s*%'
-        percentages = re.findall(percentage_pattern, content)
+        percentages = _PCT_RE.findall(content)
         
         if percentages:
             issues.append(VerificationIssue(
@@ -229,32 +257,11 @@ class FactCheck:
         """Check for proper citations."""
         issues = []
         
-        # Look for citation patterns [1], (Author, Year), etc.
-        citation_patterns = [
-            r'\[\d+\]',
-            r'\([A-Z][a-z]+,?\s+\d{4}\)',
-            r'\([A-Z][a-z]+\s+et\s+al\.?,?\s+\d{4}\)',
-        ]
-        
-        has_citations = any(
-            re.search(pattern, content)
-            for pattern in citation_patterns
-        )
-        
         # Check if document makes claims but has no citations
-        claim_indicators = [
-            "research shows",
-            "studies indicate",
-            "according to",
-            "evidence suggests",
-        ]
-        
-        has_claim_indicators = any(
-            indicator in content.lower()
-            for indicator in claim_indicators
-        )
+        has_claim_indicators = _CLAIM_RE.search(content) is not None
         
-        if has_claim_indicators and not has_citations:
+        # Look for citation patterns [1], (Author, Year), etc. only when needed
+        if has_claim_indicators and _CITATION_RE.search(content) is None:
             issues.append(VerificationIssue(
                 issue_type="fact_check",
                 severity="high",
@@ -269,8 +276,7 @@ class FactCheck:
         issues = []
         
         # Find year mentions
-        year_pattern = r'\b(19|20)\d{2}\b'
-        years = [int(y) for y in re.findall(year_pattern, content)]
+        years = [int(y) for y in _YEAR_RE.findall(content)]
         
         current_year = datetime.now().year
         future_years = [y for y in years if y > current_year]
@@ -322,15 +328,11 @@ class ConsistencyCheck:
         """Check for consistent terminology."""
         issues = []
         
-        # Check for mixed spelling variants
-        variants = [
-            (["analyze", "analyse"], "US vs UK spelling"),
-            (["organization", "organisation"], "US vs UK spelling"),
-            (["color", "colour"], "US vs UK spelling"),
-        ]
+        # Check for mixed spelling variants, all found in one scan
+        present = {match.group(1).lower() for match in _VARIANT_RE.finditer(content)}
         
-        for words, description in variants:
-            found = [w for w in words if w in content.lower()]
+        for words, description in _SPELLING_VARIANTS:
+            found = [w for w in words if w in present]
             if len(found) > 1:
                 issues.append(VerificationIssue(
                     issue_type="consistency",
@@ -347,7 +349,7 @@ class ConsistencyCheck:
         
         # Check heading format consistency
         heading_styles = []
-        for match in re.finditer(r'^(#+)\s+(.+)$', content, re.MULTILINE):
+        for match in _HEADING_RE.finditer(content):
             heading_styles.append(len(match.group(1)))
         
         # Check if headings skip levels (e.g., # followed by ###)
@@ -368,8 +370,8 @@ class ConsistencyCheck:
         issues = []
         
         # Check for mixed person (first vs third)
-        first_person = len(re.findall(r'\b(I|we|our|us)\b', content, re.IGNORECASE))
-        third_person = len(re.findall(r'\b(they|their|them|one)\b', content, re.IGNORECASE))
+        first_person = len(_FIRST_PERSON_RE.findall(content))
+        third_person = len(_THIRD_PERSON_RE.findall(content))
         
         if first_person > 5 and third_person > 5:
             issues.append(VerificationIssue(
@@ -422,7 +424,7 @@ class VerificationSystem:
         else:
             self.enabled_checks = list(set(available_checks.values()))
         
-        logger.info(f"Verification system initialized with {len(self.enabled_checks)} checks")
+        logger.info("Verification system initialized with %s checks", len(self.enabled_checks))
     
     def verify(self, document) -> VerificationResult:
         """
@@ -434,7 +436,7 @@ class VerificationSystem:
         Returns:
             Aggregated VerificationResult
         """
-        logger.info(f"Starting verification for document: {document.document_id}")
+        logger.info("Starting verification for document: %s", document.document_id)
         
         all_issues = []
         check_scores = []
@@ -445,7 +447,7 @@ class VerificationSystem:
             all_issues.extend(result.issues)
             check_scores.append(result.score)
             
-            logger.debug(f"{result.check_name}: score={result.score}, issues={len(result.issues)}")
+            logger.debug("%s: score=%s, issues=%s", result.check_name, result.score, len(result.issues))
         
         # Calculate overall score
         overall_score = sum(check_scores) / len(check_scores) if check_scores else 0.0
@@ -465,8 +467,8 @@ class VerificationSystem:
         )
         
         logger.info(
-            f"Verification complete: score={overall_score:.2f}, "
-            f"passed={passed}, issues={len(all_issues)}"
+            "Verification complete: score=%.2f, passed=%s, issues=%s",
+            overall_score, passed, len(all_issues)
         )
         
         return result
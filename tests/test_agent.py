@@ -101,6 +101,22 @@ class TestAgent:
         # Result should indicate processing occurred
         assert "agent_id" in result
     
+    @pytest.mark.asyncio
+    async def test_get_status_counts_outcomes(self):
+        """Test status counters after successful and failed tasks."""
+        agent = Agent(role="writer")
+        
+        async def fail(task):
+            raise RuntimeError("model unavailable")
+        
+        await agent.execute_task(AgentTask(task_id="ok", description="Write", requirements={}))
+        agent._process_task = fail
+        await agent.execute_task(AgentTask(task_id="bad", description="Write", requirements={}))
+        
+        status = agent.get_status()
+        assert status["completed_tasks"] == 1
+        assert status["failed_tasks"] == 1
+    
     def test_agent_repr(self):
         """Test agent string representation."""
         agent = Agent(agent_id="test_123", role="writer")
@@ -159,4 +159,19 @@ class TestVerificationAgent:
         result = await verification_agent.process(task)
         
         assert result.success is True
-        assert 'verification_report' in result.data
\ No newline at end of file
+        assert 'verification_report' in result.data
+    
+    def test_near_duplicate_requires_same_claims(self, verification_agent):
+        """Test passing reports are only reused for revisions keeping order and numbers."""
+        words = [f"word{i}" for i in range(200)]
+        original = " ".join(words + ["Growth", "was", "12%", "this", "year."])
+        report = {'verification_report': {'overall_score': 0.9}, 'passed': True}
+        verification_agent._last_verified[b"ctx"] = (original, report)
+        
+        reworded = original.replace("this year.", "this year!")
+        swapped = original.replace("12%", "21%")
+        reordered = " ".join(words[100:] + words[:100] + ["Growth", "was", "12%", "this", "year."])
+        
+        assert verification_agent._near_duplicate_report(reworded, b"ctx") is report
+        assert verification_agent._near_duplicate_report(swapped, b"ctx") is None
+        assert verification_agent._near_duplicate_report(reordered, b"ctx") is None
\ No newline at end of file
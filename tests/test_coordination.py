@@ -2,8 +2,13 @@
 
 import pytest
 import asyncio
+from datetime import datetime, timedelta
 
-from madf.coordination import WorkflowManager, WorkflowBuilder, MessageBus, MessageType, Message
+from madf.coordination import (
+    WorkflowManager, WorkflowBuilder, WorkflowScheduler, MessageBus, MessageType, Message,
+    FairShareScheduler
+)
+from madf.coordination.state_manager import StateManager
 from madf.models.request import DocumentRequest
 
 
@@ -36,6 +41,166 @@ class TestWorkflowManager:
         assert workflow.stages[0].name == "research"
 
 
+    @pytest.mark.asyncio
+    async def test_registered_workflow_is_compiled(self, workflow_manager):
+        """Test registered workflows run through the compiled runner."""
+        workflow = (WorkflowBuilder("custom")
+            .add_stage("research", "research")
+            .add_stage("intro", "writing", depends_on=["research"], parallel=True)
+            .add_stage("body", "writing", depends_on=["research"], parallel=True)
+            .add_stage("editing", "editing", depends_on=["intro", "body"])
+            .build())
+        workflow_manager.register_workflow("custom", workflow)
+        
+        executed = []
+        
+        async def run_stage(stage):
+            executed.append(stage.name)
+        
+        assert workflow._compiled_runner is not None
+        await workflow.run(run_stage)
+        
+        assert executed[0] == "research"
+        assert sorted(executed[1:3]) == ["body", "intro"]
+        assert executed[3] == "editing"
+    
+    def test_register_cyclic_workflow(self, workflow_manager):
+        """Test cyclic workflows are rejected at registration."""
+        workflow = (WorkflowBuilder("cyclic")
+            .add_stage("a", "research", depends_on=["b"])
+            .add_stage("b", "writing", depends_on=["a"])
+            .build())
+        
+        with pytest.raises(ValueError, match="cyclic"):
+            workflow_manager.register_workflow("cyclic", workflow)
+
+
+class TestOutlineWorkflow:
+    """Test workflows for requests with a predefined outline."""
+    
+    def test_research_and_writing_overlap(self):
+        """Test writing runs alongside research when an outline is given."""
+        manager = WorkflowManager()
+        request = DocumentRequest(
+            topic="Test Topic",
+            document_type="article",
+            target_length=1000,
+            outline="1. Intro\n2. Body"
+        )
+        
+        workflow = manager.create_workflow(request)
+        first = manager.schedule(workflow).take_batch()
+        
+        assert sorted(s.name for s in first.stages) == ["research", "writing"]
+        assert manager.create_workflow(request) is workflow
+        assert manager.workflows['article'].stages[1].depends_on == ["research"]
+    
+    def test_variants_cached_per_registration(self):
+        """Test same-named workflows registered separately get their own variants."""
+        manager = WorkflowManager()
+        blog = (WorkflowBuilder()
+            .add_stage("research", "research")
+            .add_stage("writing", "writing", depends_on=["research"])
+            .build())
+        essay = (WorkflowBuilder()
+            .add_stage("research", "research")
+            .add_stage("writing", "writing", depends_on=["research"])
+            .add_stage("editing", "editing", depends_on=["writing"])
+            .build())
+        manager.register_workflow("blog", blog)
+        manager.register_workflow("essay", essay)
+        
+        def outline_request(document_type):
+            return DocumentRequest(
+                topic="Test Topic",
+                document_type=document_type,
+                target_length=1000,
+                outline="1. Intro\n2. Body"
+            )
+        
+        blog_variant = manager.create_workflow(outline_request("blog"))
+        essay_variant = manager.create_workflow(outline_request("essay"))
+        
+        assert [s.name for s in blog_variant.stages] == ["research", "writing"]
+        assert [s.name for s in essay_variant.stages] == ["research", "writing", "editing"]
+    
+    @pytest.mark.asyncio
+    async def test_editing_starts_before_research_finishes(self):
+        """Test stages are dispatched as soon as their own dependencies complete."""
+        manager = WorkflowManager()
+        request = DocumentRequest(
+            topic="Test Topic",
+            document_type="article",
+            target_length=1000,
+            outline="1. Intro\n2. Body"
+        )
+        workflow = manager.create_workflow(request)
+        editing_started = asyncio.Event()
+        executed = []
+        
+        async def run_stage(stage):
+            if stage.name == "research":
+                await asyncio.wait_for(editing_started.wait(), timeout=1)
+            elif stage.name == "editing":
+                editing_started.set()
+            executed.append(stage.name)
+        
+        await workflow.run(run_stage)
+        
+        assert executed == ["writing", "editing", "research", "verification"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_stage_waits_for_cancelled_siblings(self):
+        """Test stages cancelled after a failure finish cleanup before the error propagates."""
+        workflow = (WorkflowBuilder("failing")
+            .add_stage("slow", "research", parallel=True)
+            .add_stage("broken", "writing", parallel=True)
+            .build())
+        cleaned_up = []
+        
+        async def run_stage(stage):
+            if stage.name == "broken":
+                raise RuntimeError("stage failed")
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append(stage.name)
+        
+        with pytest.raises(RuntimeError, match="stage failed"):
+            await workflow._run_dataflow(run_stage)
+        
+        assert cleaned_up == ["slow"]
+    
+    @pytest.mark.asyncio
+    async def test_compiled_runner_waits_for_cancelled_siblings(self):
+        """Test the compiled runner also finishes sibling cleanup before a failure propagates."""
+        workflow = (WorkflowBuilder("failing_batch")
+            .add_stage("research", "research")
+            .add_stage("slow", "writing", depends_on=["research"], parallel=True)
+            .add_stage("broken", "writing", depends_on=["research"], parallel=True)
+            .add_stage("editing", "editing", depends_on=["slow", "broken"])
+            .build())
+        workflow.compile()
+        assert workflow._compiled_runner != workflow._run_dataflow
+        cleaned_up = []
+        
+        async def run_stage(stage):
+            if stage.name == "broken":
+                raise RuntimeError("stage failed")
+            if stage.name == "slow":
+                try:
+                    await asyncio.sleep(10)
+                finally:
+                    await asyncio.sleep(0)
+                    cleaned_up.append(stage.name)
+        
+        with pytest.raises(RuntimeError, match="stage failed"):
+            await workflow.run(run_stage)
+        
+        assert cleaned_up == ["slow"]
+
+
 class TestWorkflowBuilder:
     """Test WorkflowBuilder class."""
     
@@ -60,6 +225,99 @@ class TestWorkflowBuilder:
         assert workflow.metadata["key"] == "value"
 
 
+class TestWorkflowScheduler:
+    """Test WorkflowScheduler class."""
+    
+    def test_linear_workflow_order(self):
+        """Test stages are released in dependency order."""
+        workflow = WorkflowManager().workflows['article']
+        scheduler = WorkflowManager().schedule(workflow)
+        
+        order = []
+        while not scheduler.done:
+            stage = scheduler.take()
+            order.append(stage.name)
+            scheduler.complete(stage.name)
+        
+        assert order == ["research", "writing", "editing", "verification"]
+    
+    def test_fan_in_waits_for_all_dependencies(self):
+        """Test a stage is only ready once every dependency completes."""
+        workflow = (WorkflowBuilder("fan_in")
+            .add_stage("a", "research")
+            .add_stage("b", "research")
+            .add_stage("c", "writing", depends_on=["a", "b"])
+            .build())
+        scheduler = WorkflowScheduler(workflow)
+        
+        assert [scheduler.take().name, scheduler.take().name] == ["a", "b"]
+        assert scheduler.complete("a") == []
+        assert not scheduler.has_ready()
+        assert [s.name for s in scheduler.complete("b")] == ["c"]
+    
+    def test_take_batch_groups_parallel_stages(self):
+        """Test ready parallel stages are emitted together."""
+        workflow = (WorkflowBuilder("fan_out")
+            .add_stage("research", "research")
+            .add_stage("intro", "writing", depends_on=["research"], parallel=True)
+            .add_stage("body", "writing", depends_on=["research"], parallel=True)
+            .add_stage("editing", "editing", depends_on=["intro", "body"])
+            .build())
+        scheduler = WorkflowScheduler(workflow)
+        
+        batch = scheduler.take_batch()
+        assert batch.serial.name == "research"
+        scheduler.complete("research")
+        
+        batch = scheduler.take_batch()
+        assert batch.serial is None
+        assert [s.name for s in batch.parallel] == ["intro", "body"]
+        assert [s.name for s in workflow.get_ready_batch({"research"}).stages] == ["intro", "body"]
+    
+    def test_unknown_dependency(self):
+        """Test unknown dependencies are rejected."""
+        workflow = WorkflowBuilder().add_stage("a", "research", depends_on=["missing"]).build()
+        
+        with pytest.raises(ValueError, match="unknown stage"):
+            WorkflowScheduler(workflow)
+
+
+class TestFairShareScheduler:
+    """Test FairShareScheduler class."""
+    
+    @pytest.mark.asyncio
+    async def test_waiting_agent_type_gets_next_slot(self):
+        """Test a type holding no slots is served before a busier type."""
+        scheduler = FairShareScheduler(capacity=2)
+        order = []
+        
+        async def job(agent_type):
+            async with scheduler.slot(agent_type):
+                order.append(agent_type)
+                await asyncio.sleep(0.01)
+        
+        writers = [asyncio.ensure_future(job("writing")) for _ in range(4)]
+        await asyncio.sleep(0)
+        await asyncio.gather(job("verification"), *writers)
+        
+        assert order[:3] == ["writing", "writing", "verification"]
+        assert scheduler.running == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Test cancelling a queued acquire leaves capacity intact."""
+        scheduler = FairShareScheduler(capacity=1)
+        await scheduler.acquire("research")
+        
+        waiter = asyncio.ensure_future(scheduler.acquire("writing"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        scheduler.release("research")
+        
+        await asyncio.wait_for(scheduler.acquire("editing"), timeout=1)
+        assert scheduler.running == 1
+
+
 class TestMessageBus:
     """Test MessageBus class."""
     
@@ -104,4 +362,23 @@ class TestMessageBus:
         
         assert isinstance(stats, dict)
         assert 'running' in stats
-        assert 'queue_size' in stats
\ No newline at end of file
+        assert 'queue_size' in stats
+
+
+class TestStateManager:
+    """Test StateManager class."""
+    
+    @pytest.mark.asyncio
+    async def test_update_stages_applies_last_transition(self):
+        """Test batched stage updates end on the last transition."""
+        manager = StateManager()
+        start = datetime.now()
+        
+        assert await manager.update_stages("wf", [
+            ("research", start),
+            ("writing", start + timedelta(seconds=1))
+        ])
+        
+        state = await manager.get_workflow_state("wf")
+        assert state.stage == "writing"
+        assert state.updated_at == start + timedelta(seconds=1)
@@ -4,6 +4,7 @@ Unit tests for Coordinator class.
 
 import pytest
 import asyncio
+import threading
 from multi_agent_framework import (
     Agent,
     Coordinator,
@@ -87,6 +88,49 @@ class TestCoordinator:
         assert document is not None
         assert document.title == "Sync Test"
     
+    def test_create_document_sync_reuses_loop(self):
+        """Test that repeated synchronous calls share one event loop."""
+        with Coordinator(agents=[Agent(role="writer")]) as coordinator:
+            coordinator.create_document(topic="First", requirements={})
+            loop = coordinator._thread_loop.loop
+            coordinator.create_document(topic="Second", requirements={})
+            
+            assert coordinator._thread_loop.loop is loop
+            coordinator.close()
+            assert loop.is_closed()
+            assert coordinator.create_document(topic="Third", requirements={}).title == "Third"
+            loop = coordinator._thread_loop.loop
+        
+        assert loop.is_closed()
+    
+    def test_create_document_sync_from_threads(self):
+        """Test that threads sharing a coordinator each get their own loop."""
+        coordinator = Coordinator(agents=[Agent(role="writer")])
+        barrier = threading.Barrier(2)
+        titles = []
+        
+        def create(title):
+            barrier.wait()
+            titles.append(coordinator.create_document(topic=title, requirements={}).title)
+        
+        threads = [threading.Thread(target=create, args=(f"Doc {i}",)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert sorted(titles) == ["Doc 0", "Doc 1"]
+        assert len(coordinator._loops) == 2
+        coordinator.close()
+    
+    @pytest.mark.asyncio
+    async def test_create_document_sync_in_running_loop(self):
+        """Test that the synchronous wrapper refuses to run inside a loop."""
+        coordinator = Coordinator(agents=[Agent(role="writer")])
+        
+        with pytest.raises(RuntimeError, match="create_document_async"):
+            coordinator.create_document(topic="Nested", requirements={})
+    
     def test_get_workflow_status(self):
         """Test getting workflow status."""
         agents = [
@@ -167,4 +211,223 @@ class TestWorkflowModes:
             requirements={},
         )
         
-        assert document is not None
\ No newline at end of file
+        assert document is not None
+
+
+class TestWorkflowDAG:
+    """Test dependency-driven workflow scheduling."""
+    
+    @staticmethod
+    def _recording_agents(roles, log, delay=0.01):
+        """Create agents that log task start/end and echo their description."""
+        agents = []
+        for role in roles:
+            agent = Agent(role=role)
+            
+            async def process(task, role=role):
+                log.append(("start", task.description))
+                await asyncio.sleep(delay)
+                log.append(("end", task.description))
+                return {"content": f"{role}: {task.description}", "requirements": task.requirements}
+            
+            agent._process_task = process
+            agents.append(agent)
+        return agents
+    
+    @pytest.mark.asyncio
+    async def test_independent_branches_run_concurrently(self):
+        """Test that steps only wait for their own dependencies."""
+        log = []
+        agents = self._recording_agents(["researcher", "writer", "editor"], log)
+        coordinator = Coordinator(agents=agents, max_iterations=1)
+        steps = [
+            {"step_id": "a", "agent_id": agents[0].agent_id, "description": "a",
+             "dependencies": []},
+            {"step_id": "b", "agent_id": agents[1].agent_id, "description": "b",
+             "dependencies": []},
+            {"step_id": "c", "agent_id": agents[2].agent_id, "description": "c",
+             "dependencies": ["a", "b"]},
+        ]
+        
+        document = await coordinator.create_document_async("DAG", {}, workflow_steps=steps)
+        
+        assert log.index(("start", "b")) < log.index(("end", "a"))
+        assert log.index(("start", "c")) > log.index(("end", "a"))
+        assert log.index(("start", "c")) > log.index(("end", "b"))
+        contents = [s.content for s in document.sections]
+        assert sorted(contents[:2]) == ["researcher: a", "writer: b"]
+        assert contents[2] == "editor: c"
+    
+    @pytest.mark.asyncio
+    async def test_sequential_mode_chains_steps(self):
+        """Test that steps without dependencies run in order in sequential mode."""
+        log = []
+        agents = self._recording_agents(["researcher", "writer"], log)
+        coordinator = Coordinator(agents=agents, max_iterations=1)
+        
+        await coordinator.create_document_async("Chain", {})
+        
+        assert log == [
+            ("start", "Research information about: Chain"),
+            ("end", "Research information about: Chain"),
+            ("start", "Write content about: Chain"),
+            ("end", "Write content about: Chain"),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_forwards_dependency_output(self):
+        """Test that pipeline steps receive the previous step's result."""
+        log = []
+        agents = self._recording_agents(["writer", "editor"], log)
+        coordinator = Coordinator(
+            agents=agents,
+            workflow_mode=WorkflowMode.PIPELINE,
+            max_iterations=1,
+        )
+        requirements = {"length": "short"}
+        
+        await coordinator.create_document_async("Pipe", requirements)
+        
+        edit_step = coordinator.workflow_history[-1]
+        assert edit_step.task.requirements["previous_output"]["content"] == (
+            "writer: Write content about: Pipe"
+        )
+        assert "previous_output" not in requirements
+    
+    @pytest.mark.asyncio
+    async def test_results_rendered_once_in_content(self):
+        """Test that each step result appears once in the document content."""
+        log = []
+        agents = self._recording_agents(["researcher", "writer"], log)
+        coordinator = Coordinator(agents=agents, max_iterations=1)
+        
+        document = await coordinator.create_document_async("Once", {})
+        
+        assert document.section_count == 2
+        assert document.content.count("writer: Write content about: Once") == 1
+    
+    @pytest.mark.asyncio
+    async def test_cyclic_dependencies_rejected(self):
+        """Test that a dependency cycle raises before any step runs."""
+        log = []
+        agents = self._recording_agents(["writer"], log)
+        coordinator = Coordinator(agents=agents, max_iterations=1)
+        agent_id = agents[0].agent_id
+        steps = [
+            {"step_id": "a", "agent_id": agent_id, "description": "a", "dependencies": ["b"]},
+            {"step_id": "b", "agent_id": agent_id, "description": "b", "dependencies": ["a"]},
+        ]
+        
+        with pytest.raises(ValueError):
+            await coordinator.create_document_async("Cycle", {}, workflow_steps=steps)
+        assert log == []
+    
+    @pytest.mark.asyncio
+    async def test_single_iteration_without_verification(self):
+        """Test that the workflow is not repeated when nothing verifies it."""
+        log = []
+        agents = self._recording_agents(["writer"], log)
+        coordinator = Coordinator(agents=agents, max_iterations=3, result_cache_size=0)
+        
+        await coordinator.create_document_async("Once", {})
+        
+        assert len(coordinator.workflow_history) == 1
+    
+    @pytest.mark.asyncio
+    async def test_fast_results_update_document_first(self):
+        """Test that results are applied to the document as they complete."""
+        log = []
+        slow = self._recording_agents(["researcher"], log, delay=0.05)[0]
+        fast = self._recording_agents(["writer"], log, delay=0.0)[0]
+        coordinator = Coordinator(
+            agents=[slow, fast],
+            workflow_mode=WorkflowMode.PARALLEL,
+            max_iterations=1,
+        )
+        
+        document = await coordinator.create_document_async("Stream", {})
+        
+        assert document.sections[0].content.startswith("writer")
+        assert coordinator.workflow_history[0].agent_id == slow.agent_id
+    
+    @pytest.mark.asyncio
+    async def test_identical_tasks_reuse_cached_result(self):
+        """Test that repeated identical tasks are served from the result cache."""
+        log = []
+        agents = self._recording_agents(["writer"], log)
+        coordinator = Coordinator(agents=agents, max_iterations=1)
+        step = {
+            "agent_id": agents[0].agent_id,
+            "description": "Write content about: Cached",
+        }
+        
+        await coordinator.create_document_async("Cached", {}, workflow_steps=[step, dict(step)])
+        
+        assert log == [
+            ("start", "Write content about: Cached"),
+            ("end", "Write content about: Cached"),
+        ]
+        assert [s.status for s in coordinator.workflow_history] == ["success", "success"]
+    
+    @pytest.mark.asyncio
+    async def test_ready_steps_for_one_agent_are_batched(self):
+        """Test that steps ready together for the same agent run as one batch."""
+        log = []
+        editor = self._recording_agents(["editor"], log)[0]
+        batches = []
+        execute_task_batch = editor.execute_task_batch
+        
+        async def record_batch(tasks):
+            batches.append([task.description for task in tasks])
+            return await execute_task_batch(tasks)
+        
+        editor.execute_task_batch = record_batch
+        coordinator = Coordinator(
+            agents=[editor],
+            workflow_mode=WorkflowMode.PARALLEL,
+            max_iterations=1,
+        )
+        steps = [
+            {"agent_id": editor.agent_id, "description": f"issue {i}"} for i in range(3)
+        ]
+        
+        document = await coordinator.create_document_async("Batch", {}, workflow_steps=steps)
+        
+        assert batches == [["issue 0", "issue 1", "issue 2"]]
+        assert [s.content for s in document.sections] == [
+            "editor: issue 0", "editor: issue 1", "editor: issue 2"
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_workflow_waits_for_running_steps(self):
+        """Test running steps finish their cleanup before cancellation propagates."""
+        cleaned_up = []
+        agents = [Agent(role="researcher"), Agent(role="writer")]
+        
+        async def process(task):
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append(task.description)
+        
+        for agent in agents:
+            agent._process_task = process
+        coordinator = Coordinator(
+            agents=agents,
+            workflow_mode=WorkflowMode.PARALLEL,
+            max_iterations=1,
+        )
+        steps = [
+            {"agent_id": agent.agent_id, "description": agent.role} for agent in agents
+        ]
+        
+        run = asyncio.ensure_future(
+            coordinator.create_document_async("Cancelled", {}, workflow_steps=steps)
+        )
+        await asyncio.sleep(0.01)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        
+        assert sorted(cleaned_up) == ["researcher", "writer"]
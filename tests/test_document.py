@@ -67,6 +67,20 @@ class TestDocument:
         assert doc.sections[1].title == "Second"
         assert doc.sections[2].title == "Third"
     
+    def test_content_follows_section_order(self):
+        """Test content rendering after appended and out-of-order sections."""
+        doc = Document(title="Test")
+        
+        doc.add_section("First", "Content 1")
+        doc.add_section("Third", "Content 3", order=5)
+        assert doc.content == "# First\n\nContent 1\n\n\n# Third\n\nContent 3\n\n"
+        
+        doc.add_section("Second", "Content 2", order=2)
+        assert doc.content.index("Second") < doc.content.index("Third")
+        
+        doc.content = "Manual"
+        assert doc.content == "Manual"
+    
     def test_update_section(self):
         """Test updating section content."""
         doc = Document(title="Test")
@@ -77,6 +91,18 @@ class TestDocument:
         assert updated is True
         assert "Updated content" in doc.content
     
+    def test_section_lookup_after_direct_append(self):
+        """Test that sections appended to the list directly can be updated."""
+        doc = Document(title="Test")
+        doc.add_section("Indexed", "Content")
+        section = Section(title="Direct", content="Original")
+        doc.sections.append(section)
+        
+        assert doc.update_section(section.section_id, "Updated") is True
+        assert section.content == "Updated"
+        assert doc.remove_section(section.section_id) is True
+        assert doc.update_section(section.section_id, "Again") is False
+    
     def test_remove_section(self):
         """Test removing a section."""
         doc = Document(title="Test")
@@ -108,6 +134,22 @@ class TestDocument:
         assert version.version_number == 1
         assert version.created_by == "user_01"
     
+    def test_version_unaffected_by_later_updates(self):
+        """Test that updating a section does not change earlier versions."""
+        doc = Document(title="Test")
+        section = doc.add_section("Section 1", "Content 1")
+        doc.add_section("Section 2", "Content 2")
+        version = doc.create_version("Initial version")
+        
+        assert doc.update_section(section.section_id, "Rewritten") is True
+        
+        assert version.sections[0].content == "Content 1"
+        assert doc.sections[0].content == "Rewritten"
+        assert version.sections[1] is doc.sections[1]
+        
+        doc.revert_to_version(1)
+        assert doc.sections[0].content == "Content 1"
+    
     def test_to_markdown(self):
         """Test Markdown export."""
         doc = Document(title="Test Document")
@@ -162,6 +204,9 @@ class TestSection:
         )
         
         assert section.word_count() == 5
+        
+        section.content = "Six seven"
+        assert section.word_count() == 2
     
     def test_section_to_dict(self):
         """Test section dictionary conversion."""
@@ -257,4 +302,21 @@ class TestDocumentManager:
         
         assert stats["total_documents"] == 2
         assert stats["total_words"] > 0
-        assert stats["total_sections"] == 2
\ No newline at end of file
+        assert stats["total_sections"] == 2
+    
+    def test_merge_documents(self):
+        """Test merging keeps document order without renumbering the sources."""
+        manager = DocumentManager()
+        
+        doc1 = manager.create_document("Doc 1")
+        doc1.add_section("A1", "First")
+        doc1.add_section("A2", "Second")
+        doc2 = manager.create_document("Doc 2")
+        doc2.add_section("B1", "Third")
+        
+        merged = manager.merge_documents("Merged", [doc1.document_id, doc2.document_id])
+        
+        assert [s.title for s in merged.sections] == ["A1", "A2", "B1"]
+        assert [s.order for s in merged.sections] == [0, 1, 2]
+        assert doc2.sections[0].order == 0
+        assert merged.content.index("Second") < merged.content.index("Third")
@@ -1,11 +1,16 @@
 """Tests for data models."""
 
+import os
 import pytest
+import uuid
+from dataclasses import asdict
 from datetime import datetime
 
+from madf.models._common import _new_id
 from madf.models.document import Document, DocumentSection, DocumentStatus
 from madf.models.request import DocumentRequest
-from madf.models.task import Task, TaskResult
+from madf.models.task import Task, TaskResult, TaskBatch
+from madf.models.state import FeedbackHistory
 
 
 class TestDocumentModels:
@@ -61,6 +66,23 @@ class TestDocumentModels:
         assert "Content one" in full_text
         assert "Content two" in full_text
     
+    def test_document_sections_kept_in_order(self):
+        """Test sections stay ordered on construction and insertion."""
+        document = Document(
+            id="test",
+            title="Test",
+            sections=[
+                DocumentSection("Third", "c", 2),
+                DocumentSection("First", "a", 0)
+            ],
+            status=DocumentStatus.COMPLETE
+        )
+        document.add_section(DocumentSection("Second", "b", 1))
+        document.add_section(DocumentSection("Last", "d", 5))
+        
+        assert [s.title for s in document.sections] == ["First", "Second", "Third", "Last"]
+        assert document.get_full_text() == "a\n\nb\n\nc\n\nd"
+    
     def test_document_update_word_count(self):
         """Test word count update."""
         sections = [
@@ -95,6 +117,11 @@ class TestDocumentModels:
         assert "# Test Document" in markdown
         assert "## Introduction" in markdown
         assert "Test intro" in markdown
+    
+    def test_document_status_string_form(self):
+        """Test DocumentStatus converts to and from its string form."""
+        assert DocumentStatus.COMPLETE.value_str == "complete"
+        assert DocumentStatus.from_str("researching") is DocumentStatus.RESEARCHING
 
 
 class TestDocumentRequest:
@@ -133,6 +160,32 @@ class TestDocumentRequest:
         
         with pytest.raises(ValueError, match="at least 100 words"):
             request.validate()
+    
+    def test_custom_document_type_warns(self):
+        """Test validation warns on unknown document types."""
+        request = DocumentRequest(
+            topic="Valid Topic",
+            document_type="newsletter",
+            target_length=500
+        )
+        
+        with pytest.warns(UserWarning, match="newsletter"):
+            assert request.validate() is True
+    
+    def test_to_metadata_dict(self):
+        """Test metadata dict matches asdict without sharing lists."""
+        request = DocumentRequest(
+            topic="Valid Topic",
+            document_type="article",
+            target_length=500,
+            requirements=["cite sources"],
+            metadata={'source': 'api'}
+        )
+        
+        data = request.to_metadata_dict()
+        
+        assert data == asdict(request)
+        assert data['requirements'] is not request.requirements
 
 
 class TestTaskModels:
@@ -163,4 +216,86 @@ class TestTaskModels:
         
         assert result.task_id == "task_1"
         assert result.success is True
-        assert result.execution_time == 1.5
\ No newline at end of file
+        assert result.execution_time == 1.5
+    
+    def test_generated_ids_are_unique_uuid4(self):
+        """Test pooled id generation yields distinct UUID4 strings."""
+        ids = [_new_id() for _ in range(600)]
+        
+        assert len(set(ids)) == len(ids)
+        for value in ids[:5] + ids[-5:]:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert str(parsed) == value
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_pooled_ids(self):
+        """Test a forked child generates ids distinct from its parent's."""
+        _new_id()  # make sure the pool is filled before forking
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, _new_id().encode())
+            os._exit(0)
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        
+        assert child_id != _new_id()
+    
+    def test_ids_are_interned(self):
+        """Test task ids are interned on construction."""
+        task_id = "".join(["task", "_", "42"])
+        task = Task(id=task_id, type="research", data={})
+        result = TaskResult(task_id="".join(["task", "_", "42"]), success=True, data={})
+        
+        assert task.id is result.task_id
+    
+    def test_task_batch_priority_order(self):
+        """Test TaskBatch pops by priority, then insertion order."""
+        batch = TaskBatch()
+        batch.push(Task(id="low", type="research", data={}, priority=1))
+        batch.push(Task(id="high", type="writing", data={'k': 'v'}, priority=5))
+        batch.push(Task(id="low2", type="editing", data={}, priority=1))
+        
+        assert len(batch) == 3
+        first = batch.pop()
+        assert first.id == "high"
+        assert first.data == {'k': 'v'}
+        assert first.to_task().type == "writing"
+        assert [batch.pop().id, batch.pop().id] == ["low", "low2"]
+        
+        with pytest.raises(IndexError):
+            batch.pop()
+    
+    def test_task_batch_reuses_popped_slots(self):
+        """Test TaskBatch frees popped payloads and reuses their slots."""
+        batch = TaskBatch()
+        for round_number in range(3):
+            batch.push(Task(id=f"a{round_number}", type="research", data={'n': round_number}))
+            batch.push(Task(id=f"b{round_number}", type="writing", data={}, priority=2**40))
+            popped = [batch.pop(), batch.pop()]
+            
+            assert [view.id for view in popped] == [f"b{round_number}", f"a{round_number}"]
+            assert popped[1].data == {'n': round_number}
+            assert popped[0].priority == 2**40
+        
+        assert len(batch.ids) == 2
+        assert batch.payload_refs == [None, None]
+
+
+class TestFeedbackHistory:
+    """Test FeedbackHistory model."""
+    
+    def test_feedback_history_columns(self):
+        """Test FeedbackHistory stores entries column-wise."""
+        history = FeedbackHistory()
+        history.append(1, 0.7, {'notes': 'expand intro'})
+        history.append(2, 0.9, {})
+        
+        view = history.as_view()
+        assert len(history) == 2
+        assert view.iterations == [1, 2]
+        assert list(view.scores) == [0.7, 0.9]
+        assert list(history)[0] == {'iteration': 1, 'score': 0.7, 'feedback': {'notes': 'expand intro'}}
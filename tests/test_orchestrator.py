@@ -5,7 +5,8 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 
 from madf import DocumentOrchestrator, DocumentRequest, OrchestratorConfig
-from madf.models.document import DocumentStatus
+from madf.models.document import Document, DocumentSection, DocumentStatus
+from madf.utils.config import _load_yaml
 
 
 @pytest.fixture
@@ -114,6 +115,27 @@ class TestDocumentOrchestrator:
         assert document.quality_score == 0.90
         assert len(document.sections) > 0
     
+    @pytest.mark.asyncio
+    async def test_cached_document_not_shared_with_callers(self, sample_request):
+        """Test mutating a returned document does not change later cache hits."""
+        orchestrator = DocumentOrchestrator(OrchestratorConfig(enable_caching=True))
+        cached = Document(
+            id="doc-1",
+            title="Test Document",
+            sections=[DocumentSection("Intro", "Some content", 0, metadata={'k': 1})],
+            status=DocumentStatus.COMPLETE,
+            metadata={'request': {'requirements': ['x']}}
+        )
+        orchestrator._result_cache[orchestrator._request_cache_key(sample_request)] = cached
+        
+        first = await orchestrator.create_document(sample_request)
+        first.sections[0].metadata['k'] = 2
+        first.metadata['request']['requirements'].append('y')
+        second = await orchestrator.create_document(sample_request)
+        
+        assert second.sections[0].metadata == {'k': 1}
+        assert second.metadata['request']['requirements'] == ['x']
+    
     @pytest.mark.asyncio
     async def test_get_agent_metrics(self, orchestrator):
         """Test retrieving agent metrics."""
@@ -153,4 +175,27 @@ class TestOrchestratorConfig:
         
         assert isinstance(config_dict, dict)
         assert 'orchestrator' in config_dict
-        assert 'agents' in config_dict
\ No newline at end of file
+        assert 'agents' in config_dict
+    
+    def test_from_yaml_reparses_changed_file(self, tmp_path):
+        """Test cached YAML configs are reloaded when the file changes."""
+        path = tmp_path / "config.yaml"
+        path.write_text("orchestrator:\n  max_agents: 3\n")
+        
+        assert OrchestratorConfig.from_yaml(str(path)).max_agents == 3
+        assert OrchestratorConfig.from_yaml(str(path)).max_agents == 3
+        
+        path.write_text("orchestrator:\n  max_agents: 12\n")
+        
+        assert OrchestratorConfig.from_yaml(str(path)).max_agents == 12
+    
+    def test_cached_yaml_not_shared_with_callers(self, tmp_path):
+        """Test mutating a loaded YAML dict does not affect later loads."""
+        path = tmp_path / "config.yaml"
+        path.write_text("orchestrator:\n  max_agents: 3\n")
+        stat = path.stat()
+        
+        loaded = _load_yaml(str(path), stat.st_mtime_ns, stat.st_size)
+        loaded['orchestrator']['max_agents'] = 99
+        
+        assert _load_yaml(str(path), stat.st_mtime_ns, stat.st_size)['orchestrator']['max_agents'] == 3
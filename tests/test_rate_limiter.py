@@ -0,0 +1,50 @@
+"""Tests for LLM rate limiting."""
+
+import pytest
+import asyncio
+
+from madf.utils.rate_limiter import AsyncRateLimiter, get_rate_limiter
+
+
+class _RateLimitError(Exception):
+    """Stand-in for an SDK 429 error."""
+    status_code = 429
+
+
+class TestAsyncRateLimiter:
+    """Test AsyncRateLimiter class."""
+    
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_enforced(self):
+        """Test requests beyond the per-minute budget wait."""
+        limiter = AsyncRateLimiter(rpm=1, tpm=1000)
+        
+        async def request():
+            async with limiter.acquire(10):
+                pass
+        
+        await request()
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(request(), timeout=0.05)
+    
+    @pytest.mark.asyncio
+    async def test_aimd_concurrency(self):
+        """Test 429s halve the concurrency limit and successes raise it."""
+        limiter = AsyncRateLimiter(rpm=100, tpm=100_000, max_concurrency=8)
+        
+        with pytest.raises(_RateLimitError):
+            async with limiter.acquire(10):
+                raise _RateLimitError()
+        assert limiter.limit == 4.0
+        
+        async with limiter.acquire(10):
+            pass
+        assert limiter.limit == 4.25
+        assert limiter.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_limiter_shared_per_account(self):
+        """Test clients with the same provider and key share a limiter."""
+        assert get_rate_limiter("openai", "key-a") is get_rate_limiter("openai", "key-a")
+        assert get_rate_limiter("openai", "key-a") is not get_rate_limiter("openai", "key-b")
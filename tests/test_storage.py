@@ -0,0 +1,169 @@
+"""Tests for state storage."""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from madf.models.document import Document, DocumentSection, DocumentStatus
+from madf.storage import StateStore, RedisStateStore
+
+
+class TestStateStore:
+    """Test StateStore class."""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create state store in a temporary directory."""
+        return StateStore(str(tmp_path))
+    
+    @pytest.fixture
+    def document(self):
+        """Create sample document."""
+        return Document(
+            id="doc-1",
+            title="Test Document",
+            sections=[DocumentSection("Intro", "Some content", 0)],
+            status=DocumentStatus.PENDING
+        )
+    
+    @pytest.mark.asyncio
+    async def test_save_and_get_document(self, store, document):
+        """Test full save round-trip."""
+        await store.save_document(document)
+        
+        loaded = await store.get_document("doc-1")
+        assert loaded.title == "Test Document"
+        assert loaded.status == DocumentStatus.PENDING
+        assert loaded.sections[0].content == "Some content"
+    
+    @pytest.mark.asyncio
+    async def test_status_only_save(self, store, document, tmp_path):
+        """Test status-only saves are applied on load and cleared by a full save."""
+        await store.save_document(document)
+        
+        document.status = DocumentStatus.WRITING
+        await store.save_document(document, full=False)
+        
+        loaded = await store.get_document("doc-1")
+        assert loaded.status == DocumentStatus.WRITING
+        assert loaded.sections[0].content == "Some content"
+        
+        document.status = DocumentStatus.COMPLETE
+        await store.save_document(document)
+        
+        assert not (tmp_path / "doc-1.status.json").exists()
+        assert (await store.get_document("doc-1")).status == DocumentStatus.COMPLETE
+    
+    @pytest.mark.asyncio
+    async def test_delete_document(self, store, document):
+        """Test deleting a document."""
+        await store.save_document(document)
+        await store.save_document(document, full=False)
+        await store.delete_document("doc-1")
+        
+        assert await store.get_document("doc-1") is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_apply_in_order(self, store, document, tmp_path):
+        """Test concurrent writes to one document land in call order."""
+        saves = []
+        for status in (DocumentStatus.WRITING, DocumentStatus.EDITING, DocumentStatus.COMPLETE):
+            document = replace(document, status=status)
+            saves.append(store.save_document(document, full=status == DocumentStatus.COMPLETE))
+        await asyncio.gather(*saves)
+        
+        assert (await store.get_document("doc-1")).status == DocumentStatus.COMPLETE
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["doc-1.json"]
+    
+    @pytest.mark.asyncio
+    async def test_write_behind_coalesces_saves(self, tmp_path, document):
+        """Test held saves are written once and visible to reads before flushing."""
+        store = StateStore(str(tmp_path), flush_interval=60)
+        
+        await store.save_document(document)
+        document.status = DocumentStatus.WRITING
+        await store.save_document(document, full=False)
+        assert not (tmp_path / "doc-1.json").exists()
+        
+        loaded = await store.get_document("doc-1")
+        assert loaded.status == DocumentStatus.WRITING
+        assert not (tmp_path / "doc-1.status.json").exists()
+        
+        document.status = DocumentStatus.COMPLETE
+        await store.save_document(document, full=False)
+        await store.close()
+        
+        assert (await StateStore(str(tmp_path)).get_document("doc-1")).status == DocumentStatus.COMPLETE
+
+
+class _FakeRedis:
+    """In-memory stand-in for the redis.asyncio hash commands used by the store."""
+    
+    def __init__(self):
+        self.hashes = {}
+    
+    async def hset(self, key, mapping):
+        fields = self.hashes.setdefault(key, {})
+        for field, value in mapping.items():
+            fields[field.encode()] = value if isinstance(value, bytes) else value.encode()
+    
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    async def delete(self, key):
+        return 1 if self.hashes.pop(key, None) is not None else 0
+
+
+class TestRedisStateStore:
+    """Test RedisStateStore class."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create fake Redis client."""
+        return _FakeRedis()
+    
+    @pytest.fixture
+    def store(self, client):
+        """Create Redis state store over the fake client."""
+        return RedisStateStore(client=client)
+    
+    @pytest.fixture
+    def document(self):
+        """Create sample document."""
+        return Document(
+            id="doc-1",
+            title="Test Document",
+            sections=[DocumentSection("Intro", "Some content", 0)],
+            status=DocumentStatus.PENDING
+        )
+    
+    @pytest.mark.asyncio
+    async def test_status_only_save_leaves_body(self, store, client, document):
+        """Test status-only saves update just the status fields."""
+        await store.save_document(document)
+        body = client.hashes["doc:doc-1"][b"body"]
+        
+        document.status = DocumentStatus.WRITING
+        await store.save_document(document, full=False)
+        
+        assert client.hashes["doc:doc-1"][b"body"] is body
+        loaded = await store.get_document("doc-1")
+        assert loaded.status == DocumentStatus.WRITING
+        assert loaded.sections[0].content == "Some content"
+    
+    @pytest.mark.asyncio
+    async def test_delete_document(self, store, document):
+        """Test deleting a document."""
+        await store.save_document(document)
+        await store.delete_document("doc-1")
+        
+        assert await store.get_document("doc-1") is None
+    
+    @pytest.mark.asyncio
+    async def test_flush_is_supported(self, store, client, document):
+        """Test the inherited flush interface works on the Redis backend."""
+        await store.save_document(document)
+        await store.flush()
+        
+        assert b"body" in client.hashes["doc:doc-1"]
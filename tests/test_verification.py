@@ -94,7 +94,18 @@ class TestFactCheck:
             "citation" in issue.description.lower()
             for issue in result.issues
         )
-    
+
+    def test_citation_styles_accepted(self):
+        """Test that each supported citation style satisfies claims."""
+        check = FactCheck()
+
+        for citation in ["[1]", "(Smith, 2020)", "(Smith 2020)", "(Smith et al., 2020)"]:
+            result = check.verify(f"Research shows that this is effective {citation}.")
+            assert not any(
+                "citation" in issue.description.lower()
+                for issue in result.issues
+            ), citation
+
     def test_date_validation(self):
         """Test date validation."""
         check = FactCheck()